@@ -0,0 +1,168 @@
+"""Measures cold import time and memory of the pyriskadjust data modules.
+
+Every measurement runs in a fresh python process, so nothing is cached between
+them:
+
+* time is the cumulative import time reported by ``python -X importtime``
+* memory is the tracemalloc delta (python allocations still alive after the
+  import) and the resident set size delta, measured in a separate process so
+  that tracemalloc does not slow down the timing
+
+Besides the modules themselves, each ICD mapping is also loaded through every
+backend of ``pyriskadjust.icd_mapping.get_icd_mapping``.
+
+Usage (from the root of the repository):
+
+    python benchmarks/import_benchmarks.py [--repeat 5] [--format csv|json]
+"""
+import argparse
+import csv
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGES = ["icd_mapping", "coefficients", "hccs", "models"]
+COLUMNS = ["target", "backend", "import_ms", "tracemalloc_kb", "rss_kb"]
+
+# Runs in the child process. Parent packages are imported before measuring,
+# so that the deltas only cover the target itself.
+MEMORY_SCRIPT = """
+import importlib, json, os, sys, tracemalloc
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (IOError, OSError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+module, backend = sys.argv[1], sys.argv[2]
+importlib.import_module(module.rpartition(".")[0])
+if backend:
+    from pyriskadjust.icd_mapping import get_icd_mapping
+rss_before = rss_kb()
+tracemalloc.start()
+if backend:
+    mapping = get_icd_mapping(module.rpartition("mapping_")[2], backend=backend)
+else:
+    importlib.import_module(module)
+current, _ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+print(json.dumps({"tracemalloc_kb": current // 1024, "rss_kb": rss_kb() - rss_before}))
+"""
+
+# -X importtime only reports imports done through the import statement or
+# __import__, not importlib.import_module
+TIMING_SCRIPT = """
+import sys, time
+module, backend = sys.argv[1], sys.argv[2]
+__import__(module.rpartition(".")[0])
+if backend:
+    from pyriskadjust.icd_mapping import get_icd_mapping
+    start = time.perf_counter()
+    get_icd_mapping(module.rpartition("mapping_")[2], backend=backend)
+    print((time.perf_counter() - start) * 1000)
+else:
+    __import__(module)
+"""
+
+
+def list_targets():
+    """Returns (module, backend) pairs to measure. backend is "" for a plain
+    import of the module"""
+    targets = []
+    for package in PACKAGES:
+        path = os.path.join(ROOT, "pyriskadjust", package)
+        for info in sorted(pkgutil.iter_modules([path]), key=lambda i: i[1]):
+            module = "pyriskadjust.{}.{}".format(package, info[1])
+            targets.append((module, ""))
+            if package == "icd_mapping" and info[1].startswith("mapping_"):
+                for backend in ["binary", "mmap", "store"]:
+                    targets.append((module, backend))
+    return targets
+
+
+def run(script, module, backend, importtime=False):
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", script, module, backend]
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop("PYRISKADJUST_ICD_BACKEND", None)
+    process = subprocess.run(
+        command,
+        env=env,
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return process.stdout, process.stderr
+
+
+def import_ms(module, backend):
+    stdout, stderr = run(TIMING_SCRIPT, module, backend, importtime=True)
+    if backend:
+        return float(stdout)
+    # lines look like "import time:   self [us] | cumulative | imported package"
+    for line in stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000.0
+    raise RuntimeError("No importtime entry for {}".format(module))
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def measure(module, backend, repeat):
+    timings = [import_ms(module, backend) for _ in range(repeat)]
+    memory = [
+        json.loads(run(MEMORY_SCRIPT, module, backend)[0]) for _ in range(repeat)
+    ]
+    return {
+        "target": module,
+        "backend": backend or "import",
+        "import_ms": round(median(timings), 3),
+        "tracemalloc_kb": median([m["tracemalloc_kb"] for m in memory]),
+        "rss_kb": median([m["rss_kb"] for m in memory]),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per target, the median is reported"
+    )
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    parser.add_argument(
+        "--filter", default="", help="only measure targets containing this string"
+    )
+    args = parser.parse_args(argv)
+
+    rows = [
+        measure(module, backend, args.repeat)
+        for (module, backend) in list_targets()
+        if args.filter in module
+    ]
+    if args.format == "json":
+        json.dump(rows, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        writer = csv.DictWriter(sys.stdout, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,19 @@
 from collections import defaultdict
 import json
+import sys
+
+sys.path.insert(0, "../..")
+from pyriskadjust.coefficients.compiled import (  # noqa: E402
+    split_segments,
+    split_variables,
+)
+from pyriskadjust.loader import parse_coefficient_file  # noqa: E402
 
 # Utillity to convert raw coefficient files to more useful formats.
-# Outputs both json file and python file (mapping represented as python dict)
+# Outputs both json file and python file (mapping represented as python dict).
+# Also outputs a segments file with the coefficients grouped by segment and
+# variable kind, plus a manifest of the variables of every segment, which the
+# runtime loads without parsing variable names.
 
 # fmt: off
 files = [
@@ -15,16 +26,36 @@ files = [
 
 output_dir = "../../pyriskadjust/coefficients/"
 for (inname, outname) in files:
-    with open(inname + ".csv") as f:
-        header = f.readline().strip().replace('"', "").split(",")
-        vals = map(float, f.readline().strip().split(","))
-        coefficient_mapping = dict(zip([coeff.lower() for coeff in header], vals))
+    coefficient_mapping = parse_coefficient_file(inname + ".csv")
+    # uncomment to generate json as well
+    # with open(output_dir + "coefficients_" + outname + ".json", "w") as fo:
+    #     json.dump(coefficient_mapping, fo, indent=4)
+
+    with open(output_dir + "coefficients_" + outname + ".py", "w") as fo:
+        fo.write('"""Model coefficients, take from {}"""\n\n'.format(inname))
+        fo.write("COEFFICIENTS = ")
+        json.dump(coefficient_mapping, fo, indent=4)
 
-        # uncomment to generate json as well
-        # with open(output_dir + "coefficients_" + outname + ".json", "w") as fo:
-        #     json.dump(coefficient_mapping, fo, indent=4)
+    manifest = {"source": inname, "variables": {}}
+    segments = defaultdict(dict)
+    for (segment, coefficients) in split_segments(coefficient_mapping).items():
+        variables = split_variables(coefficients)
+        manifest["variables"][segment] = variables
+        for (kind, names) in variables.items():
+            segments[segment][kind] = [
+                coefficients["hcc{}".format(n) if kind == "hcc" else n]
+                for n in names
+            ]
 
-        with open(output_dir + "coefficients_" + outname + ".py", "w") as fo:
-            fo.write('"""Model coefficients, take from {}"""\n\n'.format(inname))
-            fo.write("COEFFICIENTS = ")
-            json.dump(coefficient_mapping, fo, indent=4)
+    with open(output_dir + "segments_" + outname + ".py", "w") as fo:
+        fo.write(
+            '"""Model coefficients by segment and variable kind, '
+            'take from {}"""\n\n'.format(inname)
+        )
+        fo.write("# Variables of each segment, by kind\n")
+        fo.write("MANIFEST = ")
+        json.dump(manifest, fo, indent=4, sort_keys=True)
+        fo.write("\n\n# Coefficients, in the same order as MANIFEST\n")
+        fo.write("SEGMENTS = ")
+        json.dump(segments, fo, indent=4, sort_keys=True)
+        fo.write("\n")
@@ -1,8 +1,13 @@
-from collections import defaultdict
 import json
+import sys
+
+sys.path.insert(0, "../..")
+from pyriskadjust.icd_mapping.binary import write_mapping  # noqa: E402
+from pyriskadjust.loader import parse_mapping_file  # noqa: E402
 
 # Utillity to convert raw ICD-10 to HCC mapping files to more useful formats.
-# Outputs both json file and python file (mapping represented as python dict)
+# Outputs a python file (mapping represented as python dict), a compact binary
+# file (see pyriskadjust/icd_mapping/binary.py) and optionally a json file
 
 # fmt: off
 files = [
@@ -18,17 +23,14 @@ files = [
 
 output_dir = "../../pyriskadjust/icd_mapping/"
 for (inname, outname) in files:
-    with open(inname + ".TXT") as f:
-        d = defaultdict(list)
-        for line in f.readlines():
-            l = line.strip().split()
-            d[l[0]].append(int(l[1]))
+    d = parse_mapping_file(inname + ".TXT")
+    # uncomment to generate json as well
+    # with open(output_dir + "mapping_" + outname + ".json", "w") as fo:
+    #     json.dump(d, fo, indent=4)
 
-        # uncomment to generate json as well
-        # with open(output_dir + "mapping_" + outname + ".json", "w") as fo:
-        #     json.dump(d, fo, indent=4)
+    with open(output_dir + "mapping_" + outname + ".py", "w") as fo:
+        fo.write('"""ICD to HCC mapping based on {}.TXT"""\n\n'.format(inname))
+        fo.write("ICD_MAPPING = ")
+        json.dump(d, fo, indent=4)
 
-        with open(output_dir + "mapping_" + outname + ".py", "w") as fo:
-            fo.write('"""ICD to HCC mapping based on {}.TXT"""\n\n'.format(inname))
-            fo.write("ICD_MAPPING = ")
-            json.dump(d, fo, indent=4)
+    write_mapping(d, output_dir + "mapping_" + outname + ".bin", source=inname)
@@ -5,3 +5,5 @@
 __author__ = """Kevin Matulef"""
 __email__ = 'kevin@calyxhealth.com'
 __version__ = '0.9.6'
+
+from pyriskadjust.models import get_model  # noqa: F401
@@ -0,0 +1,227 @@
+"""Command line interface.
+
+    pyriskadjust score members.csv.gz -o scores.csv --model cna
+
+reads one member per row, as CSV or JSON lines, and writes their scores as
+soon as they are computed, so that files of any size are scored with flat
+memory. Each row has the "age" and "sex" of the member, their "diagnoses" as
+ICD-10 codes separated by spaces, commas, semicolons or pipes (or a list, in
+JSON lines) and optionally a "member_id" and the
+long_term_institutional_in_medicaid, new_enrollee_in_medicaid and
+original_entitlement_reason arguments of compute_risk_score_components.
+
+Input and output default to stdin and stdout. Gzipped input is detected, and
+output is gzipped when its name ends with .gz.
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import logging
+import re
+import sys
+
+from pyriskadjust.diagnostics import Diagnostics
+from pyriskadjust.models import get_latest_model
+from pyriskadjust.models.common import MODEL_ABBREVIATIONS, OPTIONAL_MEMBER_COLUMNS
+
+OUTPUTS = ("totals", "components", "explanations")
+FORMATS = ("csv", "jsonl")
+
+DIAGNOSES_SEPARATOR = re.compile(r"[\s,;|]+")
+TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y"})
+
+# Invalid rows kept as examples in the --diagnostics file, the others are
+# only counted
+INVALID_ROW_EXAMPLES = 10
+
+
+def _open_input(path):
+    if path == "-":
+        stream = getattr(sys.stdin, "buffer", sys.stdin)
+    else:
+        stream = open(path, "rb")
+    stream = io.BufferedReader(stream) if not hasattr(stream, "peek") else stream
+    if stream.peek(2)[:2] == b"\x1f\x8b":
+        stream = gzip.GzipFile(fileobj=stream)
+    return io.TextIOWrapper(stream, encoding="utf-8", newline="")
+
+
+def _open_output(path):
+    if path == "-":
+        return sys.stdout
+    if path.endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(path, "wb"), encoding="utf-8", newline="")
+    return io.open(path, "w", encoding="utf-8", newline="")
+
+
+def _guess_format(path):
+    name = path[:-3] if path.endswith(".gz") else path
+    if name.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    return "csv"
+
+
+def _read_rows(stream, input_format):
+    # JSON lines are yielded unparsed, so that a malformed line is reported as
+    # an invalid row like the others
+    if input_format == "csv":
+        for row in csv.DictReader(stream):
+            yield row
+    else:
+        for line in stream:
+            if line.strip():
+                yield line
+
+
+def _flag(value):
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    return bool(value)
+
+
+def _score_arguments(row, separator):
+    # the arguments of Model.components, from a row of the input
+    diagnoses = row.get("diagnoses") or []
+    if isinstance(diagnoses, str):
+        if separator is None:
+            diagnoses = DIAGNOSES_SEPARATOR.split(diagnoses.strip())
+        else:
+            diagnoses = diagnoses.split(separator)
+        diagnoses = [d for d in diagnoses if d.strip()]
+    elif not isinstance(diagnoses, list) or not all(isinstance(d, str) for d in diagnoses):
+        raise ValueError("Expected the diagnoses as a string or a list of strings")
+    return (
+        diagnoses,
+        int(row["age"]),
+        int(row["sex"]),
+        _flag(row.get(OPTIONAL_MEMBER_COLUMNS[0]) or False),
+        _flag(row.get(OPTIONAL_MEMBER_COLUMNS[1]) or False),
+        int(row.get(OPTIONAL_MEMBER_COLUMNS[2]) or 0),
+    )
+
+
+def score(args):
+    """Runs the score command, see main"""
+    module = args.module
+    model = module.get_compiled_model(args.model)
+    input_format = args.format or _guess_format(args.input)
+    output_format = args.output_format or _guess_format(args.output_path)
+    diagnostics = Diagnostics()
+    invalid_rows = 0
+    invalid_row_examples = []
+
+    stream = _open_input(args.input)
+    output = _open_output(args.output_path)
+    writer = None
+    if output_format == "csv":
+        field = {"totals": [], "components": ["components"], "explanations": ["explanation"]}
+        writer = csv.writer(output)
+        writer.writerow(["member_id", "total"] + field[args.write])
+
+    for (line, row) in enumerate(_read_rows(stream, input_format), 1):
+        try:
+            if not isinstance(row, dict):
+                row = json.loads(row)
+                if not isinstance(row, dict):
+                    raise ValueError("Expected a JSON object")
+            components = model.components(
+                *_score_arguments(row, args.separator), diagnostics=diagnostics
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            message = "Invalid row {}: {!r}".format(line, e)
+            if not args.skip_invalid:
+                raise SystemExit(message)
+            logging.warning(message)
+            invalid_rows += 1
+            if len(invalid_row_examples) < INVALID_ROW_EXAMPLES:
+                invalid_row_examples.append([line, repr(e)])
+            continue
+        result = {"member_id": row.get("member_id"), "total": sum(components.values())}
+        if args.write == "components":
+            result["components"] = components
+        elif args.write == "explanations":
+            result["explanation"] = module.explain_score(components)
+
+        if writer is None:
+            output.write(json.dumps(result) + "\n")
+        else:
+            writer.writerow(
+                [result["member_id"], result["total"]]
+                + [json.dumps(result[k]) for k in ("components", "explanation") if k in result]
+            )
+
+    if output is not sys.stdout:
+        output.close()
+    else:
+        output.flush()
+    if args.diagnostics:
+        report = diagnostics.to_dict()
+        report["invalid_rows"] = invalid_rows
+        report["invalid_row_examples"] = invalid_row_examples
+        with open(args.diagnostics, "w") as f:
+            json.dump(report, f)
+    elif diagnostics.missing_coefficients or diagnostics.unmapped_codes:
+        logging.warning(
+            "{} missing coefficients and {} unmapped codes, use --diagnostics for the details".format(
+                sum(diagnostics.missing_coefficients.values()),
+                sum(diagnostics.unmapped_codes.values()),
+            )
+        )
+    return 0
+
+
+def main(argv=None):
+    """Entry point of the pyriskadjust command"""
+    parser = argparse.ArgumentParser(prog="pyriskadjust", description="CMS-HCC risk adjustment")
+    commands = parser.add_subparsers(dest="command")
+    command = commands.add_parser(
+        "score",
+        help="Score members read from a CSV or JSON lines file",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    command.add_argument("input", nargs="?", default="-", help="Input file, - for stdin (default)")
+    command.add_argument(
+        "-o", "--output", dest="output_path", default="-", help="Output file, - for stdout (default)"
+    )
+    command.add_argument(
+        "--year", type=int, help="Payment year (default: the latest one of the version)"
+    )
+    command.add_argument(
+        "--version", help="Model version, e.g. 23 (default: the latest one of the year)"
+    )
+    command.add_argument(
+        "--model", default="cna", choices=list(MODEL_ABBREVIATIONS), help="Model segment (default: cna)"
+    )
+    command.add_argument("--format", choices=FORMATS, help="Input format (default: from the file name)")
+    command.add_argument(
+        "--output-format", choices=FORMATS, help="Output format (default: from the file name)"
+    )
+    command.add_argument(
+        "--write",
+        choices=OUTPUTS,
+        default="totals",
+        help="What to write for each member (default: totals)",
+    )
+    command.add_argument(
+        "--separator", help="Separator of the diagnoses (default: spaces, commas, semicolons or pipes)"
+    )
+    command.add_argument("--diagnostics", help="Write the problems met while scoring to this JSON file")
+    command.add_argument("--skip-invalid", action="store_true", help="Skip invalid rows instead of stopping")
+    command.set_defaults(run=score)
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+    try:
+        args.module = get_latest_model(args.year, args.version)
+    except ValueError as e:
+        command.error(str(e))
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
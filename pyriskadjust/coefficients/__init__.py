@@ -0,0 +1,139 @@
+"""Model coefficients, one module per CMS release.
+
+The coefficient modules are imported the first time they are requested through
+:func:`get_coefficients`. The models score with the array-backed tables of
+:func:`get_compiled_coefficients` instead, see
+:mod:`pyriskadjust.coefficients.compiled`. These are built from the
+``segments_*`` modules written by the coefficient generator, whose MANIFEST
+lists the variables that exist in each segment.
+"""
+import importlib
+import sys
+from types import MappingProxyType
+
+from pyriskadjust.coefficients.compiled import (
+    compile_coefficients,
+    load_segments,
+    split_segments,
+    split_variables,
+)
+
+# Map coefficient table name to the CMS file it was generated from
+COEFFICIENT_TABLES = {
+    "2018_v21": "C2110H2R",
+    "2018_v22": "C2214O5P",
+    "2019_v23": "C2318P1Q",
+}
+
+_loaded = {}
+_compiled = {}
+_manifests = {}
+
+
+def get_coefficients(name):
+    """Returns the coefficients of a given release, importing them on first use
+
+    Arguments:
+        name {string} -- Name of the coefficient table, e.g. "2019_v23"
+
+    Returns:
+        dict -- A dictionary of the form {"coefficient_name": value}
+    """
+    try:
+        return _loaded[name]
+    except KeyError:
+        pass
+    if name not in COEFFICIENT_TABLES:
+        raise ValueError("Unknown coefficient table: {}".format(name))
+    module = importlib.import_module("pyriskadjust.coefficients.coefficients_" + name)
+    _loaded[name] = module.COEFFICIENTS
+    return _loaded[name]
+
+
+def get_compiled_coefficients(name):
+    """Returns the coefficients of a given release compiled per segment
+
+    Arguments:
+        name {string} -- Name of the coefficient table, e.g. "2019_v23"
+
+    Returns:
+        dict -- A dictionary of the form {"cna": SegmentCoefficients}
+    """
+    try:
+        return _compiled[name]
+    except KeyError:
+        pass
+    module = _get_segments_module(name)
+    _compiled[name] = load_segments(module.MANIFEST, module.SEGMENTS)
+    return _compiled[name]
+
+
+def register_coefficients(name, coefficients):
+    """Makes coefficients available under a name. Use it to score with
+    coefficients loaded at runtime, e.g. by pyriskadjust.loader.load_cms_directory
+
+    Arguments:
+        name {string} -- Name of the coefficient table, e.g. "2019_v23"
+        coefficients {dict} -- A dictionary of the form {"coefficient_name": value}
+    """
+    _loaded[name] = coefficients
+    _compiled[name] = compile_coefficients(coefficients)
+    _manifests[name] = {
+        "source": "",
+        "variables": dict(
+            (segment, split_variables(variables))
+            for (segment, variables) in split_segments(coefficients).items()
+        ),
+    }
+    # the compiled models hold on to the coefficients they were built with
+    from pyriskadjust.models import refresh_models
+
+    refresh_models()
+
+
+def freeze_coefficients():
+    """Replaces every loaded COEFFICIENTS dict with a read-only mapping, and
+    freezes the name tables of the compiled coefficients"""
+    for (name, coefficients) in list(_loaded.items()):
+        if isinstance(coefficients, dict):
+            frozen = MappingProxyType(coefficients)
+            _loaded[name] = frozen
+            # the module must not hold on to the mutable dict either
+            module = sys.modules.get("pyriskadjust.coefficients.coefficients_" + name)
+            if module is not None and module.COEFFICIENTS is coefficients:
+                module.COEFFICIENTS = frozen
+    for (name, segments) in list(_compiled.items()):
+        for segment in segments.values():
+            segment.freeze()
+        if isinstance(segments, dict):
+            _compiled[name] = MappingProxyType(segments)
+
+
+def get_coefficient_manifest(name):
+    """Returns the variables of each segment of a given release
+
+    Arguments:
+        name {string} -- Name of the coefficient table, e.g. "2019_v23"
+
+    Returns:
+        dict -- A dictionary of the form
+        {
+            "source": name of the CMS file,
+            "variables": {
+                "cna": {
+                    "demographic": ["f65_69", ...],
+                    "hcc": [1, 2, ...],
+                    "interaction": ["hcc47_gcancer", ...]
+                }
+            }
+        }
+    """
+    if name in _manifests:
+        return _manifests[name]
+    return _get_segments_module(name).MANIFEST
+
+
+def _get_segments_module(name):
+    if name not in COEFFICIENT_TABLES:
+        raise ValueError("Unknown coefficient table: {}".format(name))
+    return importlib.import_module("pyriskadjust.coefficients.segments_" + name)
@@ -0,0 +1,168 @@
+"""Coefficient tables compiled into arrays, one per model segment.
+
+The COEFFICIENTS dicts are keyed by names such as "cna_hcc85" or
+"ins_m70_74". Scoring with them means formatting and hashing a name for every
+variable of every patient. Instead, the coefficients of each segment (cna,
+cnd, ..., ne, snpne) are split into three float arrays:
+
+    hcc          indexed by HCC number
+    demographic  indexed by demographic cell id
+    interaction  indexed by interaction id
+
+Missing coefficients are stored as NaN. The full variable names are kept in
+parallel name tables and are only needed to build the output.
+"""
+from array import array
+import re
+from types import MappingProxyType
+
+MISSING = float("nan")
+
+HCC_REGEX = re.compile(r"^hcc(?P<hcc>\d+)$")
+DEMOGRAPHIC_REGEX = re.compile(
+    r"^\S*(?P<sex>m|f)(?P<age_lo>\d{1,2})(_(?P<age_hi>\d{1,2}|gt))?$"
+)
+
+
+def variable_kind(variable):
+    """Returns "hcc", "demographic" or "interaction" for a variable name
+    without its segment prefix, e.g. "hcc85" or "m70_74" """
+    if HCC_REGEX.match(variable):
+        return "hcc"
+    if DEMOGRAPHIC_REGEX.match(variable):
+        return "demographic"
+    return "interaction"
+
+
+class SegmentCoefficients(object):
+    """Coefficients of one model segment, stored as arrays
+
+    Arguments:
+        segment {string} -- Abbreviation of the segment, e.g. "cna"
+        demographic {[(string, float)]} -- Demographic variables without the
+            segment prefix and their coefficients, e.g. [("m70_74", 0.379)]
+        hcc {[(int, float)]} -- HCC numbers and their coefficients
+        interaction {[(string, float)]} -- Interaction variables without the
+            segment prefix and their coefficients
+    """
+
+    def __init__(self, segment, demographic=(), hcc=(), interaction=()):
+        self.segment = segment
+        self.prefix = segment + "_"
+
+        self.demographic = array("d", [value for (_, value) in demographic])
+        self.demographic_names = [self.prefix + name for (name, _) in demographic]
+        self.demographic_ids = dict(
+            (name, i) for (i, (name, _)) in enumerate(demographic)
+        )
+
+        self.interaction = array("d", [value for (_, value) in interaction])
+        self.interaction_names = [self.prefix + name for (name, _) in interaction]
+        self.interaction_ids = dict(
+            (name, i) for (i, (name, _)) in enumerate(interaction)
+        )
+
+        size = max(h for (h, _) in hcc) + 1 if hcc else 0
+        self.hcc = array("d", [MISSING] * size)
+        self.hcc_names = [None] * size
+        for (h, value) in hcc:
+            self.hcc[h] = value
+            self.hcc_names[h] = "{}hcc{}".format(self.prefix, h)
+
+    @classmethod
+    def from_coefficients(cls, segment, coefficients):
+        """Builds the tables of a segment from its coefficients, keyed by
+        variable name without the segment prefix, e.g. {"hcc85": 0.323}"""
+        split = split_variables(coefficients)
+        return cls(
+            segment,
+            demographic=[(v, coefficients[v]) for v in split["demographic"]],
+            hcc=[(h, coefficients["hcc{}".format(h)]) for h in split["hcc"]],
+            interaction=[(v, coefficients[v]) for v in split["interaction"]],
+        )
+
+    def freeze(self):
+        """Turns the name tables into tuples and read-only mappings. The
+        coefficients are arrays of doubles already, which hold no python
+        objects"""
+        self.demographic_names = tuple(self.demographic_names)
+        self.demographic_ids = MappingProxyType(self.demographic_ids)
+        self.interaction_names = tuple(self.interaction_names)
+        self.interaction_ids = MappingProxyType(self.interaction_ids)
+        self.hcc_names = tuple(self.hcc_names)
+
+    def hcc_coefficient(self, hcc):
+        """Returns the coefficient of an HCC, or NaN if there is none"""
+        if 0 <= hcc < len(self.hcc):
+            return self.hcc[hcc]
+        return MISSING
+
+
+def split_variables(variables):
+    """Groups the variables of a segment by kind, keeping their order
+
+    Arguments:
+        variables {[string]} -- Variable names without the segment prefix
+
+    Returns:
+        dict -- A dictionary of the form
+        {"demographic": [name, ...], "hcc": [hcc, ...], "interaction": [name, ...]}
+    """
+    split = {"demographic": [], "hcc": [], "interaction": []}
+    for variable in variables:
+        kind = variable_kind(variable)
+        if kind == "hcc":
+            split["hcc"].append(int(HCC_REGEX.match(variable).group("hcc")))
+        else:
+            split[kind].append(variable)
+    return split
+
+
+def split_segments(coefficients):
+    """Groups a COEFFICIENTS dict by segment, e.g. {"cna": {"hcc85": 0.323}}"""
+    segments = {}
+    for (name, value) in coefficients.items():
+        segment, _, variable = name.partition("_")
+        segments.setdefault(segment, {})[variable] = value
+    return segments
+
+
+def compile_coefficients(coefficients):
+    """Splits a COEFFICIENTS dict by segment and compiles each segment
+
+    Arguments:
+        coefficients {dict} -- A dictionary of the form {"cna_hcc85": 0.323}
+
+    Returns:
+        dict -- A dictionary of the form {"cna": SegmentCoefficients}
+    """
+    return dict(
+        (segment, SegmentCoefficients.from_coefficients(segment, variables))
+        for (segment, variables) in split_segments(coefficients).items()
+    )
+
+
+def load_segments(manifest, segments):
+    """Builds the compiled tables from the output of the coefficient generator,
+    without having to parse any variable names
+
+    Arguments:
+        manifest {dict} -- The MANIFEST of a segments module, listing the
+            variables of each segment by kind
+        segments {dict} -- The SEGMENTS of a segments module, holding the
+            coefficients in the same order as the manifest
+
+    Returns:
+        dict -- A dictionary of the form {"cna": SegmentCoefficients}
+    """
+    output = {}
+    for (segment, variables) in manifest["variables"].items():
+        values = segments[segment]
+        output[segment] = SegmentCoefficients(
+            segment,
+            **dict(
+                (kind, list(zip(variables[kind], values[kind])))
+                for kind in ("demographic", "hcc", "interaction")
+            )
+        )
+    return output
@@ -0,0 +1,680 @@
+"""Model coefficients by segment and variable kind, take from C2110H2R"""
+
+# Variables of each segment, by kind
+MANIFEST = {
+    "source": "C2110H2R",
+    "variables": {
+        "ce": {
+            "demographic": [
+                "f0_34",
+                "f35_44",
+                "f45_54",
+                "f55_59",
+                "f60_64",
+                "f65_69",
+                "f70_74",
+                "f75_79",
+                "f80_84",
+                "f85_89",
+                "f90_94",
+                "f95_gt",
+                "m0_34",
+                "m35_44",
+                "m45_54",
+                "m55_59",
+                "m60_64",
+                "m65_69",
+                "m70_74",
+                "m75_79",
+                "m80_84",
+                "m85_89",
+                "m90_94",
+                "m95_gt"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                51,
+                52,
+                54,
+                55,
+                57,
+                58,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                138,
+                139,
+                140,
+                141,
+                157,
+                158,
+                160,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189,
+                159
+            ],
+            "interaction": [
+                "mcaid_female_aged",
+                "mcaid_female_disabled",
+                "mcaid_male_aged",
+                "mcaid_male_disabled",
+                "originallydisabled_female",
+                "originallydisabled_male",
+                "sepsis_card_resp_fail",
+                "cancer_immune",
+                "diabetes_chf",
+                "chf_copd",
+                "chf_renal",
+                "copd_card_resp_fail",
+                "disabled_hcc6",
+                "disabled_hcc34",
+                "disabled_hcc46",
+                "disabled_hcc54",
+                "disabled_hcc55",
+                "disabled_hcc110",
+                "disabled_hcc176"
+            ]
+        },
+        "ins": {
+            "demographic": [
+                "f0_34",
+                "f35_44",
+                "f45_54",
+                "f55_59",
+                "f60_64",
+                "f65_69",
+                "f70_74",
+                "f75_79",
+                "f80_84",
+                "f85_89",
+                "f90_94",
+                "f95_gt",
+                "m0_34",
+                "m35_44",
+                "m45_54",
+                "m55_59",
+                "m60_64",
+                "m65_69",
+                "m70_74",
+                "m75_79",
+                "m80_84",
+                "m85_89",
+                "m90_94",
+                "m95_gt"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                51,
+                52,
+                54,
+                55,
+                57,
+                58,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                138,
+                139,
+                140,
+                141,
+                157,
+                158,
+                160,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189,
+                159
+            ],
+            "interaction": [
+                "mcaid",
+                "origds",
+                "chf_copd",
+                "copd_card_resp_fail",
+                "sepsis_pressure_ulcer",
+                "sepsis_artif_openings",
+                "art_openings_pressure_ulcer",
+                "diabetes_chf",
+                "copd_asp_spec_bact_pneum",
+                "asp_spec_bact_pneum_pres_ulc",
+                "sepsis_asp_spec_bact_pneum",
+                "schizophrenia_copd",
+                "schizophrenia_chf",
+                "schizophrenia_seizures",
+                "disabled_hcc85",
+                "disabled_pressure_ulcer",
+                "disabled_hcc161",
+                "disabled_hcc39",
+                "disabled_hcc77",
+                "disabled_hcc6"
+            ]
+        },
+        "ne": {
+            "demographic": [
+                "nef0_34",
+                "nef35_44",
+                "nef45_54",
+                "nef55_59",
+                "nef60_64",
+                "nef65",
+                "nef66",
+                "nef67",
+                "nef68",
+                "nef69",
+                "nef70_74",
+                "nef75_79",
+                "nef80_84",
+                "nef85_89",
+                "nef90_94",
+                "nef95_gt",
+                "nem0_34",
+                "nem35_44",
+                "nem45_54",
+                "nem55_59",
+                "nem60_64",
+                "nem65",
+                "nem66",
+                "nem67",
+                "nem68",
+                "nem69",
+                "nem70_74",
+                "nem75_79",
+                "nem80_84",
+                "nem85_89",
+                "nem90_94",
+                "nem95_gt"
+            ],
+            "hcc": [],
+            "interaction": [
+                "mcaid_female0_64",
+                "mcaid_female65",
+                "mcaid_female66_69",
+                "mcaid_female70_74",
+                "mcaid_female75_gt",
+                "mcaid_male0_64",
+                "mcaid_male65",
+                "mcaid_male66_69",
+                "mcaid_male70_74",
+                "mcaid_male75_gt",
+                "origdis_female65",
+                "origdis_female66_69",
+                "origdis_female70_74",
+                "origdis_female75_gt",
+                "origdis_male65",
+                "origdis_male66_69",
+                "origdis_male70_74",
+                "origdis_male75_gt"
+            ]
+        }
+    }
+}
+
+# Coefficients, in the same order as MANIFEST
+SEGMENTS = {
+    "ce": {
+        "demographic": [
+            0.198,
+            0.212,
+            0.274,
+            0.359,
+            0.416,
+            0.283,
+            0.346,
+            0.428,
+            0.517,
+            0.632,
+            0.755,
+            0.775,
+            0.079,
+            0.119,
+            0.165,
+            0.292,
+            0.332,
+            0.309,
+            0.378,
+            0.464,
+            0.565,
+            0.647,
+            0.776,
+            0.963
+        ],
+        "hcc": [
+            0.492,
+            0.52,
+            0.557,
+            2.425,
+            1.006,
+            0.695,
+            0.33,
+            0.18,
+            0.344,
+            0.344,
+            0.124,
+            0.653,
+            0.342,
+            0.24,
+            1.003,
+            0.425,
+            0.313,
+            0.337,
+            0.257,
+            0.279,
+            0.423,
+            0.376,
+            1.078,
+            0.306,
+            0.258,
+            0.616,
+            0.343,
+            0.358,
+            0.358,
+            0.471,
+            0.318,
+            1.075,
+            0.868,
+            0.441,
+            1.016,
+            0.036,
+            0.281,
+            0.46,
+            0.482,
+            0.555,
+            0.252,
+            0.533,
+            1.732,
+            0.769,
+            0.326,
+            0.361,
+            0.283,
+            0.283,
+            0.21,
+            0.276,
+            0.371,
+            0.333,
+            0.481,
+            0.212,
+            1.313,
+            0.417,
+            0.288,
+            0.388,
+            0.388,
+            0.294,
+            0.691,
+            0.212,
+            0.223,
+            0.248,
+            0.617,
+            0.617,
+            0.227,
+            0.227,
+            0.227,
+            0.227,
+            0.227,
+            0.075,
+            1.071,
+            1.071,
+            1.071,
+            0.473,
+            0.458,
+            0.533,
+            0.141,
+            0.441,
+            0.363,
+            0.379,
+            0.555,
+            1.032,
+            0.609,
+            0.804,
+            1.071
+        ],
+        "interaction": [
+            0.213,
+            0.104,
+            0.21,
+            0.113,
+            0.244,
+            0.171,
+            0.634,
+            1.101,
+            0.237,
+            0.255,
+            0.201,
+            0.42,
+            0.564,
+            0.757,
+            0.818,
+            0.432,
+            0.147,
+            2.397,
+            0.495
+        ]
+    },
+    "ins": {
+        "demographic": [
+            0.783,
+            0.723,
+            0.7,
+            0.805,
+            0.773,
+            1.004,
+            0.947,
+            0.874,
+            0.792,
+            0.699,
+            0.594,
+            0.465,
+            0.994,
+            0.658,
+            0.687,
+            0.814,
+            0.877,
+            1.148,
+            1.195,
+            1.168,
+            1.104,
+            1.046,
+            0.928,
+            0.842
+        ],
+        "hcc": [
+            1.374,
+            0.471,
+            0.541,
+            0.928,
+            0.61,
+            0.363,
+            0.255,
+            0.165,
+            0.434,
+            0.434,
+            0.187,
+            0.343,
+            0.353,
+            0.248,
+            0.637,
+            0.343,
+            0.343,
+            0.302,
+            0.175,
+            0.25,
+            0.386,
+            0.222,
+            0.638,
+            0.436,
+            0.197,
+            0.0,
+            0.0,
+            0.051,
+            0.051,
+            0.274,
+            0.274,
+            0.497,
+            0.497,
+            0.191,
+            0.294,
+            0.0,
+            0.256,
+            0.247,
+            0.0,
+            0.11,
+            0.173,
+            0.103,
+            1.567,
+            0.611,
+            0.346,
+            0.226,
+            0.394,
+            0.394,
+            0.366,
+            0.227,
+            0.175,
+            0.175,
+            0.063,
+            0.063,
+            0.773,
+            0.257,
+            0.146,
+            0.323,
+            0.323,
+            0.252,
+            0.239,
+            0.194,
+            0.366,
+            0.178,
+            0.538,
+            0.538,
+            0.304,
+            0.304,
+            0.304,
+            0.304,
+            0.304,
+            0.235,
+            0.284,
+            0.284,
+            0.284,
+            0.226,
+            0.0,
+            0.103,
+            0.0,
+            0.179,
+            0.0,
+            0.067,
+            0.369,
+            1.12,
+            0.658,
+            0.384,
+            0.284
+        ],
+        "interaction": [
+            0.126,
+            0.026,
+            0.159,
+            0.524,
+            0.538,
+            0.453,
+            0.361,
+            0.143,
+            0.249,
+            0.325,
+            0.387,
+            0.187,
+            0.22,
+            0.303,
+            0.32,
+            0.421,
+            0.337,
+            0.624,
+            0.344,
+            0.914
+        ]
+    },
+    "ne": {
+        "demographic": [
+            0.453,
+            0.601,
+            0.81,
+            0.977,
+            1.082,
+            0.501,
+            0.543,
+            0.579,
+            0.598,
+            0.624,
+            0.737,
+            0.941,
+            1.116,
+            1.28,
+            1.372,
+            1.247,
+            0.243,
+            0.45,
+            0.633,
+            0.825,
+            0.956,
+            0.542,
+            0.601,
+            0.631,
+            0.659,
+            0.68,
+            0.818,
+            1.056,
+            1.275,
+            1.446,
+            1.622,
+            1.689
+        ],
+        "hcc": [],
+        "interaction": [
+            0.331,
+            0.513,
+            0.474,
+            0.497,
+            0.425,
+            0.419,
+            0.554,
+            0.554,
+            0.553,
+            0.513,
+            0.623,
+            0.649,
+            0.59,
+            0.562,
+            0.566,
+            0.521,
+            0.519,
+            0.441
+        ]
+    }
+}
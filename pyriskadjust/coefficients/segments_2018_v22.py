@@ -0,0 +1,2008 @@
+"""Model coefficients by segment and variable kind, take from C2214O5P"""
+
+# Variables of each segment, by kind
+MANIFEST = {
+    "source": "C2214O5P",
+    "variables": {
+        "cfa": {
+            "demographic": [
+                "f65_69",
+                "f70_74",
+                "f75_79",
+                "f80_84",
+                "f85_89",
+                "f90_94",
+                "f95_gt",
+                "m65_69",
+                "m70_74",
+                "m75_79",
+                "m80_84",
+                "m85_89",
+                "m90_94",
+                "m95_gt"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                57,
+                58,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "originallydisabled_female",
+                "originallydisabled_male",
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96"
+            ]
+        },
+        "cfd": {
+            "demographic": [
+                "f0_34",
+                "f35_44",
+                "f45_54",
+                "f55_59",
+                "f60_64",
+                "m0_34",
+                "m35_44",
+                "m45_54",
+                "m55_59",
+                "m60_64"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                57,
+                58,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96",
+                "gsubstanceabuse_gpsychiatric"
+            ]
+        },
+        "cna": {
+            "demographic": [
+                "f65_69",
+                "f70_74",
+                "f75_79",
+                "f80_84",
+                "f85_89",
+                "f90_94",
+                "f95_gt",
+                "m65_69",
+                "m70_74",
+                "m75_79",
+                "m80_84",
+                "m85_89",
+                "m90_94",
+                "m95_gt"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                57,
+                58,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "originallydisabled_female",
+                "originallydisabled_male",
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96"
+            ]
+        },
+        "cnd": {
+            "demographic": [
+                "f0_34",
+                "f35_44",
+                "f45_54",
+                "f55_59",
+                "f60_64",
+                "m0_34",
+                "m35_44",
+                "m45_54",
+                "m55_59",
+                "m60_64"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                57,
+                58,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96",
+                "gsubstanceabuse_gpsychiatric"
+            ]
+        },
+        "cpa": {
+            "demographic": [
+                "f65_69",
+                "f70_74",
+                "f75_79",
+                "f80_84",
+                "f85_89",
+                "f90_94",
+                "f95_gt",
+                "m65_69",
+                "m70_74",
+                "m75_79",
+                "m80_84",
+                "m85_89",
+                "m90_94",
+                "m95_gt"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                57,
+                58,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "originallydisabled_female",
+                "originallydisabled_male",
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96"
+            ]
+        },
+        "cpd": {
+            "demographic": [
+                "f0_34",
+                "f35_44",
+                "f45_54",
+                "f55_59",
+                "f60_64",
+                "m0_34",
+                "m35_44",
+                "m45_54",
+                "m55_59",
+                "m60_64"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                57,
+                58,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96",
+                "gsubstanceabuse_gpsychiatric"
+            ]
+        },
+        "ins": {
+            "demographic": [
+                "f0_34",
+                "f35_44",
+                "f45_54",
+                "f55_59",
+                "f60_64",
+                "f65_69",
+                "f70_74",
+                "f75_79",
+                "f80_84",
+                "f85_89",
+                "f90_94",
+                "f95_gt",
+                "m0_34",
+                "m35_44",
+                "m45_54",
+                "m55_59",
+                "m60_64",
+                "m65_69",
+                "m70_74",
+                "m75_79",
+                "m80_84",
+                "m85_89",
+                "m90_94",
+                "m95_gt"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                57,
+                58,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "ltimcaid",
+                "origds",
+                "disabled_hcc85",
+                "disabled_pressure_ulcer",
+                "disabled_hcc161",
+                "disabled_hcc39",
+                "disabled_hcc77",
+                "disabled_hcc6",
+                "chf_gcopdcf",
+                "gcopdcf_card_resp_fail",
+                "sepsis_pressure_ulcer",
+                "sepsis_artif_openings",
+                "art_openings_pressure_ulcer",
+                "diabetes_chf",
+                "gcopdcf_asp_spec_bact_pneum",
+                "asp_spec_bact_pneum_pres_ulc",
+                "sepsis_asp_spec_bact_pneum",
+                "schizophrenia_gcopdcf",
+                "schizophrenia_chf",
+                "schizophrenia_seizures"
+            ]
+        },
+        "ne": {
+            "demographic": [
+                "nmcaid_norigdis_nef0_34",
+                "nmcaid_norigdis_nef35_44",
+                "nmcaid_norigdis_nef45_54",
+                "nmcaid_norigdis_nef55_59",
+                "nmcaid_norigdis_nef60_64",
+                "nmcaid_norigdis_nef65",
+                "nmcaid_norigdis_nef66",
+                "nmcaid_norigdis_nef67",
+                "nmcaid_norigdis_nef68",
+                "nmcaid_norigdis_nef69",
+                "nmcaid_norigdis_nef70_74",
+                "nmcaid_norigdis_nef75_79",
+                "nmcaid_norigdis_nef80_84",
+                "nmcaid_norigdis_nef85_89",
+                "nmcaid_norigdis_nef90_94",
+                "nmcaid_norigdis_nef95_gt",
+                "nmcaid_norigdis_nem0_34",
+                "nmcaid_norigdis_nem35_44",
+                "nmcaid_norigdis_nem45_54",
+                "nmcaid_norigdis_nem55_59",
+                "nmcaid_norigdis_nem60_64",
+                "nmcaid_norigdis_nem65",
+                "nmcaid_norigdis_nem66",
+                "nmcaid_norigdis_nem67",
+                "nmcaid_norigdis_nem68",
+                "nmcaid_norigdis_nem69",
+                "nmcaid_norigdis_nem70_74",
+                "nmcaid_norigdis_nem75_79",
+                "nmcaid_norigdis_nem80_84",
+                "nmcaid_norigdis_nem85_89",
+                "nmcaid_norigdis_nem90_94",
+                "nmcaid_norigdis_nem95_gt",
+                "mcaid_norigdis_nef0_34",
+                "mcaid_norigdis_nef35_44",
+                "mcaid_norigdis_nef45_54",
+                "mcaid_norigdis_nef55_59",
+                "mcaid_norigdis_nef60_64",
+                "mcaid_norigdis_nef65",
+                "mcaid_norigdis_nef66",
+                "mcaid_norigdis_nef67",
+                "mcaid_norigdis_nef68",
+                "mcaid_norigdis_nef69",
+                "mcaid_norigdis_nef70_74",
+                "mcaid_norigdis_nef75_79",
+                "mcaid_norigdis_nef80_84",
+                "mcaid_norigdis_nef85_89",
+                "mcaid_norigdis_nef90_94",
+                "mcaid_norigdis_nef95_gt",
+                "mcaid_norigdis_nem0_34",
+                "mcaid_norigdis_nem35_44",
+                "mcaid_norigdis_nem45_54",
+                "mcaid_norigdis_nem55_59",
+                "mcaid_norigdis_nem60_64",
+                "mcaid_norigdis_nem65",
+                "mcaid_norigdis_nem66",
+                "mcaid_norigdis_nem67",
+                "mcaid_norigdis_nem68",
+                "mcaid_norigdis_nem69",
+                "mcaid_norigdis_nem70_74",
+                "mcaid_norigdis_nem75_79",
+                "mcaid_norigdis_nem80_84",
+                "mcaid_norigdis_nem85_89",
+                "mcaid_norigdis_nem90_94",
+                "mcaid_norigdis_nem95_gt",
+                "nmcaid_origdis_nef65",
+                "nmcaid_origdis_nef66",
+                "nmcaid_origdis_nef67",
+                "nmcaid_origdis_nef68",
+                "nmcaid_origdis_nef69",
+                "nmcaid_origdis_nef70_74",
+                "nmcaid_origdis_nef75_79",
+                "nmcaid_origdis_nef80_84",
+                "nmcaid_origdis_nef85_89",
+                "nmcaid_origdis_nef90_94",
+                "nmcaid_origdis_nef95_gt",
+                "nmcaid_origdis_nem65",
+                "nmcaid_origdis_nem66",
+                "nmcaid_origdis_nem67",
+                "nmcaid_origdis_nem68",
+                "nmcaid_origdis_nem69",
+                "nmcaid_origdis_nem70_74",
+                "nmcaid_origdis_nem75_79",
+                "nmcaid_origdis_nem80_84",
+                "nmcaid_origdis_nem85_89",
+                "nmcaid_origdis_nem90_94",
+                "nmcaid_origdis_nem95_gt",
+                "mcaid_origdis_nef65",
+                "mcaid_origdis_nef66",
+                "mcaid_origdis_nef67",
+                "mcaid_origdis_nef68",
+                "mcaid_origdis_nef69",
+                "mcaid_origdis_nef70_74",
+                "mcaid_origdis_nef75_79",
+                "mcaid_origdis_nef80_84",
+                "mcaid_origdis_nef85_89",
+                "mcaid_origdis_nef90_94",
+                "mcaid_origdis_nef95_gt",
+                "mcaid_origdis_nem65",
+                "mcaid_origdis_nem66",
+                "mcaid_origdis_nem67",
+                "mcaid_origdis_nem68",
+                "mcaid_origdis_nem69",
+                "mcaid_origdis_nem70_74",
+                "mcaid_origdis_nem75_79",
+                "mcaid_origdis_nem80_84",
+                "mcaid_origdis_nem85_89",
+                "mcaid_origdis_nem90_94",
+                "mcaid_origdis_nem95_gt"
+            ],
+            "hcc": [],
+            "interaction": []
+        },
+        "snpne": {
+            "demographic": [
+                "nmcaid_norigdis_nef0_34",
+                "nmcaid_norigdis_nef35_44",
+                "nmcaid_norigdis_nef45_54",
+                "nmcaid_norigdis_nef55_59",
+                "nmcaid_norigdis_nef60_64",
+                "nmcaid_norigdis_nef65",
+                "nmcaid_norigdis_nef66",
+                "nmcaid_norigdis_nef67",
+                "nmcaid_norigdis_nef68",
+                "nmcaid_norigdis_nef69",
+                "nmcaid_norigdis_nef70_74",
+                "nmcaid_norigdis_nef75_79",
+                "nmcaid_norigdis_nef80_84",
+                "nmcaid_norigdis_nef85_89",
+                "nmcaid_norigdis_nef90_94",
+                "nmcaid_norigdis_nef95_gt",
+                "nmcaid_norigdis_nem0_34",
+                "nmcaid_norigdis_nem35_44",
+                "nmcaid_norigdis_nem45_54",
+                "nmcaid_norigdis_nem55_59",
+                "nmcaid_norigdis_nem60_64",
+                "nmcaid_norigdis_nem65",
+                "nmcaid_norigdis_nem66",
+                "nmcaid_norigdis_nem67",
+                "nmcaid_norigdis_nem68",
+                "nmcaid_norigdis_nem69",
+                "nmcaid_norigdis_nem70_74",
+                "nmcaid_norigdis_nem75_79",
+                "nmcaid_norigdis_nem80_84",
+                "nmcaid_norigdis_nem85_89",
+                "nmcaid_norigdis_nem90_94",
+                "nmcaid_norigdis_nem95_gt",
+                "mcaid_norigdis_nef0_34",
+                "mcaid_norigdis_nef35_44",
+                "mcaid_norigdis_nef45_54",
+                "mcaid_norigdis_nef55_59",
+                "mcaid_norigdis_nef60_64",
+                "mcaid_norigdis_nef65",
+                "mcaid_norigdis_nef66",
+                "mcaid_norigdis_nef67",
+                "mcaid_norigdis_nef68",
+                "mcaid_norigdis_nef69",
+                "mcaid_norigdis_nef70_74",
+                "mcaid_norigdis_nef75_79",
+                "mcaid_norigdis_nef80_84",
+                "mcaid_norigdis_nef85_89",
+                "mcaid_norigdis_nef90_94",
+                "mcaid_norigdis_nef95_gt",
+                "mcaid_norigdis_nem0_34",
+                "mcaid_norigdis_nem35_44",
+                "mcaid_norigdis_nem45_54",
+                "mcaid_norigdis_nem55_59",
+                "mcaid_norigdis_nem60_64",
+                "mcaid_norigdis_nem65",
+                "mcaid_norigdis_nem66",
+                "mcaid_norigdis_nem67",
+                "mcaid_norigdis_nem68",
+                "mcaid_norigdis_nem69",
+                "mcaid_norigdis_nem70_74",
+                "mcaid_norigdis_nem75_79",
+                "mcaid_norigdis_nem80_84",
+                "mcaid_norigdis_nem85_89",
+                "mcaid_norigdis_nem90_94",
+                "mcaid_norigdis_nem95_gt",
+                "nmcaid_origdis_nef65",
+                "nmcaid_origdis_nef66",
+                "nmcaid_origdis_nef67",
+                "nmcaid_origdis_nef68",
+                "nmcaid_origdis_nef69",
+                "nmcaid_origdis_nef70_74",
+                "nmcaid_origdis_nef75_79",
+                "nmcaid_origdis_nef80_84",
+                "nmcaid_origdis_nef85_89",
+                "nmcaid_origdis_nef90_94",
+                "nmcaid_origdis_nef95_gt",
+                "nmcaid_origdis_nem65",
+                "nmcaid_origdis_nem66",
+                "nmcaid_origdis_nem67",
+                "nmcaid_origdis_nem68",
+                "nmcaid_origdis_nem69",
+                "nmcaid_origdis_nem70_74",
+                "nmcaid_origdis_nem75_79",
+                "nmcaid_origdis_nem80_84",
+                "nmcaid_origdis_nem85_89",
+                "nmcaid_origdis_nem90_94",
+                "nmcaid_origdis_nem95_gt",
+                "mcaid_origdis_nef65",
+                "mcaid_origdis_nef66",
+                "mcaid_origdis_nef67",
+                "mcaid_origdis_nef68",
+                "mcaid_origdis_nef69",
+                "mcaid_origdis_nef70_74",
+                "mcaid_origdis_nef75_79",
+                "mcaid_origdis_nef80_84",
+                "mcaid_origdis_nef85_89",
+                "mcaid_origdis_nef90_94",
+                "mcaid_origdis_nef95_gt",
+                "mcaid_origdis_nem65",
+                "mcaid_origdis_nem66",
+                "mcaid_origdis_nem67",
+                "mcaid_origdis_nem68",
+                "mcaid_origdis_nem69",
+                "mcaid_origdis_nem70_74",
+                "mcaid_origdis_nem75_79",
+                "mcaid_origdis_nem80_84",
+                "mcaid_origdis_nem85_89",
+                "mcaid_origdis_nem90_94",
+                "mcaid_origdis_nem95_gt"
+            ],
+            "hcc": [],
+            "interaction": []
+        }
+    }
+}
+
+# Coefficients, in the same order as MANIFEST
+SEGMENTS = {
+    "cfa": {
+        "demographic": [
+            0.425,
+            0.511,
+            0.611,
+            0.739,
+            0.917,
+            1.037,
+            1.094,
+            0.492,
+            0.582,
+            0.692,
+            0.816,
+            1.009,
+            1.186,
+            1.268
+        ],
+        "hcc": [
+            0.585,
+            0.596,
+            0.548,
+            2.542,
+            0.973,
+            0.713,
+            0.332,
+            0.159,
+            0.346,
+            0.346,
+            0.097,
+            0.752,
+            0.41,
+            0.228,
+            1.242,
+            0.342,
+            0.038,
+            0.369,
+            0.333,
+            0.334,
+            0.552,
+            0.37,
+            1.219,
+            0.529,
+            0.268,
+            0.706,
+            0.522,
+            0.612,
+            0.444,
+            1.098,
+            0.92,
+            0.552,
+            1.23,
+            0.0,
+            0.436,
+            0.553,
+            0.687,
+            0.751,
+            0.357,
+            0.946,
+            2.304,
+            1.033,
+            0.471,
+            0.355,
+            0.473,
+            0.336,
+            0.068,
+            0.369,
+            0.474,
+            0.474,
+            0.548,
+            0.374,
+            1.744,
+            0.54,
+            0.324,
+            0.985,
+            0.422,
+            0.134,
+            0.707,
+            0.162,
+            0.223,
+            0.278,
+            0.672,
+            0.672,
+            0.244,
+            0.244,
+            2.879,
+            1.576,
+            0.757,
+            0.003,
+            0.946,
+            0.274,
+            0.552,
+            0.52,
+            0.412,
+            0.721,
+            0.816,
+            0.775,
+            0.787
+        ],
+        "interaction": [
+            0.172,
+            0.192,
+            0.815,
+            0.205,
+            0.24,
+            0.271,
+            0.564,
+            0.2
+        ]
+    },
+    "cfd": {
+        "demographic": [
+            0.318,
+            0.306,
+            0.338,
+            0.388,
+            0.449,
+            0.225,
+            0.204,
+            0.281,
+            0.372,
+            0.486
+        ],
+        "hcc": [
+            0.5,
+            0.811,
+            0.919,
+            2.767,
+            1.025,
+            0.761,
+            0.361,
+            0.19,
+            0.431,
+            0.431,
+            0.16,
+            0.845,
+            0.373,
+            0.353,
+            1.349,
+            0.491,
+            0.4,
+            0.503,
+            0.875,
+            0.613,
+            0.713,
+            0.345,
+            4.256,
+            0.589,
+            0.378,
+            0.919,
+            0.366,
+            0.432,
+            0.178,
+            1.056,
+            1.019,
+            0.407,
+            1.219,
+            0.0,
+            0.465,
+            0.512,
+            0.794,
+            0.516,
+            0.195,
+            0.324,
+            1.575,
+            0.484,
+            0.484,
+            0.415,
+            0.618,
+            0.618,
+            0.205,
+            0.377,
+            0.69,
+            0.357,
+            0.435,
+            0.381,
+            1.74,
+            0.756,
+            0.319,
+            3.365,
+            0.354,
+            0.322,
+            0.49,
+            0.049,
+            0.284,
+            0.09,
+            0.637,
+            0.637,
+            0.167,
+            0.079,
+            2.626,
+            1.559,
+            0.631,
+            0.537,
+            0.324,
+            0.171,
+            0.407,
+            0.668,
+            0.383,
+            1.156,
+            1.075,
+            0.87,
+            1.065
+        ],
+        "interaction": [
+            0.652,
+            0.16,
+            0.217,
+            0.711,
+            0.524,
+            0.405,
+            0.233
+        ]
+    },
+    "cna": {
+        "demographic": [
+            0.312,
+            0.374,
+            0.448,
+            0.537,
+            0.664,
+            0.797,
+            0.816,
+            0.3,
+            0.379,
+            0.466,
+            0.561,
+            0.694,
+            0.857,
+            0.976
+        ],
+        "hcc": [
+            0.312,
+            0.455,
+            0.435,
+            2.625,
+            0.97,
+            0.677,
+            0.301,
+            0.146,
+            0.318,
+            0.318,
+            0.104,
+            0.545,
+            0.273,
+            0.228,
+            0.962,
+            0.39,
+            0.165,
+            0.246,
+            0.276,
+            0.294,
+            0.425,
+            0.423,
+            1.388,
+            0.625,
+            0.221,
+            0.383,
+            0.383,
+            0.608,
+            0.395,
+            1.314,
+            1.007,
+            0.528,
+            0.97,
+            0.28,
+            0.457,
+            0.505,
+            0.441,
+            0.674,
+            0.309,
+            0.584,
+            1.055,
+            0.658,
+            0.302,
+            0.323,
+            0.233,
+            0.218,
+            0.14,
+            0.268,
+            0.263,
+            0.263,
+            0.538,
+            0.395,
+            1.461,
+            0.4,
+            0.298,
+            0.62,
+            0.328,
+            0.209,
+            0.599,
+            0.221,
+            0.217,
+            0.499,
+            0.422,
+            0.422,
+            0.237,
+            0.237,
+            2.163,
+            1.204,
+            0.535,
+            0.321,
+            0.584,
+            0.191,
+            0.495,
+            0.418,
+            0.266,
+            0.597,
+            1.0,
+            0.571,
+            0.588
+        ],
+        "interaction": [
+            0.244,
+            0.152,
+            0.893,
+            0.154,
+            0.19,
+            0.27,
+            0.336,
+            0.105
+        ]
+    },
+    "cnd": {
+        "demographic": [
+            0.244,
+            0.303,
+            0.322,
+            0.35,
+            0.411,
+            0.155,
+            0.19,
+            0.221,
+            0.271,
+            0.303
+        ],
+        "hcc": [
+            0.288,
+            0.532,
+            0.704,
+            2.644,
+            0.927,
+            0.656,
+            0.352,
+            0.202,
+            0.371,
+            0.371,
+            0.128,
+            0.753,
+            0.227,
+            0.444,
+            1.11,
+            0.394,
+            0.267,
+            0.524,
+            0.678,
+            0.483,
+            0.474,
+            0.377,
+            3.188,
+            0.848,
+            0.339,
+            0.569,
+            0.285,
+            0.395,
+            0.209,
+            1.053,
+            0.704,
+            0.456,
+            1.082,
+            0.132,
+            0.528,
+            0.457,
+            0.54,
+            0.585,
+            0.227,
+            0.302,
+            1.024,
+            0.781,
+            0.578,
+            0.412,
+            0.306,
+            0.306,
+            0.121,
+            0.284,
+            0.282,
+            0.195,
+            0.324,
+            0.258,
+            1.506,
+            0.486,
+            0.333,
+            2.538,
+            0.262,
+            0.262,
+            0.53,
+            0.128,
+            0.171,
+            0.385,
+            0.5,
+            0.5,
+            0.141,
+            0.141,
+            2.203,
+            1.393,
+            0.636,
+            0.348,
+            0.302,
+            0.044,
+            0.456,
+            0.513,
+            0.34,
+            0.871,
+            0.618,
+            0.785,
+            0.455
+        ],
+        "interaction": [
+            0.675,
+            0.096,
+            0.174,
+            0.493,
+            0.256,
+            0.285,
+            0.191
+        ]
+    },
+    "cpa": {
+        "demographic": [
+            0.341,
+            0.406,
+            0.484,
+            0.552,
+            0.678,
+            0.817,
+            0.913,
+            0.334,
+            0.409,
+            0.491,
+            0.546,
+            0.679,
+            0.822,
+            1.038
+        ],
+        "hcc": [
+            0.55,
+            0.409,
+            0.482,
+            2.442,
+            0.955,
+            0.667,
+            0.325,
+            0.152,
+            0.354,
+            0.354,
+            0.098,
+            0.562,
+            0.244,
+            0.193,
+            0.889,
+            0.46,
+            0.263,
+            0.324,
+            0.412,
+            0.209,
+            0.418,
+            0.39,
+            1.226,
+            0.449,
+            0.225,
+            0.388,
+            0.377,
+            0.547,
+            0.413,
+            1.274,
+            0.958,
+            0.556,
+            0.57,
+            0.158,
+            0.364,
+            0.429,
+            0.407,
+            0.629,
+            0.349,
+            0.508,
+            0.914,
+            0.704,
+            0.301,
+            0.32,
+            0.28,
+            0.28,
+            0.175,
+            0.283,
+            0.278,
+            0.27,
+            0.603,
+            0.559,
+            1.452,
+            0.443,
+            0.316,
+            0.358,
+            0.358,
+            0.172,
+            0.666,
+            0.302,
+            0.276,
+            0.336,
+            0.435,
+            0.435,
+            0.184,
+            0.184,
+            2.274,
+            1.074,
+            0.586,
+            0.525,
+            1.065,
+            0.133,
+            0.516,
+            0.383,
+            0.233,
+            0.584,
+            0.795,
+            0.579,
+            0.737
+        ],
+        "interaction": [
+            0.126,
+            0.105,
+            0.776,
+            0.178,
+            0.186,
+            0.299,
+            0.46,
+            0.116
+        ]
+    },
+    "cpd": {
+        "demographic": [
+            0.344,
+            0.383,
+            0.374,
+            0.371,
+            0.395,
+            0.33,
+            0.267,
+            0.3,
+            0.307,
+            0.343
+        ],
+        "hcc": [
+            0.232,
+            0.417,
+            0.765,
+            2.582,
+            0.879,
+            0.577,
+            0.4,
+            0.182,
+            0.423,
+            0.423,
+            0.136,
+            0.709,
+            0.242,
+            0.351,
+            0.963,
+            0.324,
+            0.324,
+            0.51,
+            0.849,
+            0.496,
+            0.491,
+            0.29,
+            3.529,
+            0.69,
+            0.382,
+            0.613,
+            0.286,
+            0.366,
+            0.163,
+            1.328,
+            0.908,
+            0.384,
+            0.814,
+            0.052,
+            0.331,
+            0.168,
+            0.459,
+            0.394,
+            0.245,
+            0.155,
+            0.676,
+            0.429,
+            0.429,
+            0.367,
+            0.438,
+            0.438,
+            0.22,
+            0.258,
+            0.28,
+            0.232,
+            0.401,
+            0.401,
+            1.601,
+            0.549,
+            0.326,
+            2.861,
+            0.293,
+            0.174,
+            0.373,
+            0.22,
+            0.195,
+            0.115,
+            0.512,
+            0.512,
+            0.147,
+            0.035,
+            2.655,
+            1.237,
+            0.62,
+            0.119,
+            0.155,
+            0.049,
+            0.384,
+            0.484,
+            0.232,
+            0.876,
+            0.655,
+            0.867,
+            0.696
+        ],
+        "interaction": [
+            0.808,
+            0.139,
+            0.181,
+            0.609,
+            0.449,
+            0.318,
+            0.23
+        ]
+    },
+    "ins": {
+        "demographic": [
+            1.031,
+            0.999,
+            1.007,
+            0.986,
+            1.028,
+            1.2,
+            1.092,
+            0.995,
+            0.86,
+            0.749,
+            0.626,
+            0.456,
+            1.049,
+            1.074,
+            1.008,
+            1.055,
+            1.039,
+            1.269,
+            1.323,
+            1.331,
+            1.189,
+            1.129,
+            0.964,
+            0.781
+        ],
+        "hcc": [
+            1.747,
+            0.346,
+            0.58,
+            1.143,
+            0.727,
+            0.401,
+            0.293,
+            0.199,
+            0.441,
+            0.441,
+            0.16,
+            0.26,
+            0.511,
+            0.337,
+            0.962,
+            0.39,
+            0.39,
+            0.335,
+            0.241,
+            0.244,
+            0.345,
+            0.329,
+            0.68,
+            0.529,
+            0.151,
+            0.102,
+            0.102,
+            0.271,
+            0.271,
+            0.497,
+            0.467,
+            0.229,
+            0.224,
+            0.0,
+            0.369,
+            0.104,
+            0.0,
+            0.145,
+            0.088,
+            0.042,
+            1.631,
+            0.727,
+            0.297,
+            0.191,
+            0.497,
+            0.497,
+            0.497,
+            0.224,
+            0.114,
+            0.114,
+            0.031,
+            0.031,
+            0.884,
+            0.321,
+            0.094,
+            0.305,
+            0.305,
+            0.057,
+            0.067,
+            0.067,
+            0.46,
+            0.228,
+            0.462,
+            0.462,
+            0.436,
+            0.202,
+            0.924,
+            0.295,
+            0.294,
+            0.076,
+            0.042,
+            0.0,
+            0.209,
+            0.0,
+            0.267,
+            0.502,
+            0.962,
+            0.5,
+            0.407
+        ],
+        "interaction": [
+            0.062,
+            0.0,
+            0.321,
+            0.608,
+            0.369,
+            0.567,
+            0.425,
+            0.277,
+            0.164,
+            0.423,
+            0.252,
+            0.568,
+            0.331,
+            0.154,
+            0.254,
+            0.366,
+            0.321,
+            0.363,
+            0.173,
+            0.483
+        ]
+    },
+    "ne": {
+        "demographic": [
+            0.664,
+            0.936,
+            1.035,
+            1.004,
+            1.122,
+            0.522,
+            0.516,
+            0.544,
+            0.581,
+            0.605,
+            0.674,
+            0.892,
+            1.066,
+            1.324,
+            1.324,
+            1.324,
+            0.456,
+            0.665,
+            0.834,
+            0.889,
+            0.923,
+            0.514,
+            0.533,
+            0.575,
+            0.641,
+            0.671,
+            0.776,
+            1.04,
+            1.27,
+            1.511,
+            1.511,
+            1.511,
+            0.985,
+            1.221,
+            1.337,
+            1.342,
+            1.438,
+            1.059,
+            0.946,
+            0.946,
+            0.946,
+            0.946,
+            0.975,
+            1.092,
+            1.395,
+            1.458,
+            1.678,
+            1.678,
+            0.766,
+            1.095,
+            1.357,
+            1.422,
+            1.582,
+            1.201,
+            1.208,
+            1.208,
+            1.208,
+            1.311,
+            1.311,
+            1.361,
+            1.603,
+            1.85,
+            1.85,
+            1.85,
+            1.13,
+            1.167,
+            1.167,
+            1.167,
+            1.167,
+            1.167,
+            1.167,
+            1.167,
+            1.167,
+            1.167,
+            1.167,
+            0.79,
+            0.957,
+            1.005,
+            1.074,
+            1.398,
+            1.398,
+            1.398,
+            1.398,
+            1.398,
+            1.398,
+            1.398,
+            1.566,
+            1.619,
+            1.619,
+            1.619,
+            1.619,
+            1.619,
+            1.619,
+            1.619,
+            1.619,
+            1.619,
+            1.619,
+            1.613,
+            1.613,
+            2.202,
+            2.202,
+            2.202,
+            2.202,
+            2.202,
+            2.202,
+            2.202,
+            2.202,
+            2.202
+        ],
+        "hcc": [],
+        "interaction": []
+    },
+    "snpne": {
+        "demographic": [
+            1.136,
+            1.409,
+            1.507,
+            1.618,
+            1.689,
+            1.003,
+            0.997,
+            1.063,
+            1.1,
+            1.123,
+            1.269,
+            1.48,
+            1.687,
+            1.92,
+            1.92,
+            1.92,
+            1.045,
+            1.254,
+            1.503,
+            1.63,
+            1.67,
+            0.971,
+            0.989,
+            1.015,
+            1.082,
+            1.111,
+            1.302,
+            1.522,
+            1.758,
+            2.047,
+            2.047,
+            2.047,
+            1.633,
+            1.868,
+            2.068,
+            2.123,
+            2.177,
+            1.546,
+            1.546,
+            1.569,
+            1.569,
+            1.569,
+            1.776,
+            1.973,
+            2.162,
+            2.381,
+            2.602,
+            2.602,
+            1.329,
+            1.658,
+            1.954,
+            2.091,
+            2.187,
+            1.478,
+            1.485,
+            1.6,
+            1.6,
+            1.703,
+            1.898,
+            2.08,
+            2.229,
+            2.544,
+            2.544,
+            2.544,
+            1.747,
+            1.785,
+            1.805,
+            1.805,
+            1.805,
+            1.932,
+            2.096,
+            2.252,
+            2.252,
+            2.252,
+            2.252,
+            1.655,
+            1.691,
+            1.705,
+            1.734,
+            1.78,
+            1.874,
+            2.0,
+            2.254,
+            2.254,
+            2.254,
+            2.254,
+            2.161,
+            2.214,
+            2.272,
+            2.272,
+            2.272,
+            2.415,
+            2.576,
+            2.844,
+            2.844,
+            2.844,
+            2.844,
+            2.224,
+            2.224,
+            2.36,
+            2.36,
+            2.36,
+            2.356,
+            2.582,
+            2.582,
+            2.582,
+            2.582,
+            2.582
+        ],
+        "hcc": [],
+        "interaction": []
+    }
+}
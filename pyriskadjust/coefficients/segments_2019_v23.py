@@ -0,0 +1,2064 @@
+"""Model coefficients by segment and variable kind, take from C2318P1Q"""
+
+# Variables of each segment, by kind
+MANIFEST = {
+    "source": "C2318P1Q",
+    "variables": {
+        "cfa": {
+            "demographic": [
+                "f65_69",
+                "f70_74",
+                "f75_79",
+                "f80_84",
+                "f85_89",
+                "f90_94",
+                "f95_gt",
+                "m65_69",
+                "m70_74",
+                "m75_79",
+                "m80_84",
+                "m85_89",
+                "m90_94",
+                "m95_gt"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                56,
+                57,
+                58,
+                59,
+                60,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                138,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "originallydisabled_female",
+                "originallydisabled_male",
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal_v23",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96"
+            ]
+        },
+        "cfd": {
+            "demographic": [
+                "f0_34",
+                "f35_44",
+                "f45_54",
+                "f55_59",
+                "f60_64",
+                "m0_34",
+                "m35_44",
+                "m45_54",
+                "m55_59",
+                "m60_64"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                56,
+                57,
+                58,
+                59,
+                60,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                138,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal_v23",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96",
+                "disable_substabuse_psych_v23"
+            ]
+        },
+        "cna": {
+            "demographic": [
+                "f65_69",
+                "f70_74",
+                "f75_79",
+                "f80_84",
+                "f85_89",
+                "f90_94",
+                "f95_gt",
+                "m65_69",
+                "m70_74",
+                "m75_79",
+                "m80_84",
+                "m85_89",
+                "m90_94",
+                "m95_gt"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                56,
+                57,
+                58,
+                59,
+                60,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                138,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "originallydisabled_female",
+                "originallydisabled_male",
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal_v23",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96"
+            ]
+        },
+        "cnd": {
+            "demographic": [
+                "f0_34",
+                "f35_44",
+                "f45_54",
+                "f55_59",
+                "f60_64",
+                "m0_34",
+                "m35_44",
+                "m45_54",
+                "m55_59",
+                "m60_64"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                56,
+                57,
+                58,
+                59,
+                60,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                138,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal_v23",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96",
+                "disable_substabuse_psych_v23"
+            ]
+        },
+        "cpa": {
+            "demographic": [
+                "f65_69",
+                "f70_74",
+                "f75_79",
+                "f80_84",
+                "f85_89",
+                "f90_94",
+                "f95_gt",
+                "m65_69",
+                "m70_74",
+                "m75_79",
+                "m80_84",
+                "m85_89",
+                "m90_94",
+                "m95_gt"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                56,
+                57,
+                58,
+                59,
+                60,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                138,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "originallydisabled_female",
+                "originallydisabled_male",
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal_v23",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96"
+            ]
+        },
+        "cpd": {
+            "demographic": [
+                "f0_34",
+                "f35_44",
+                "f45_54",
+                "f55_59",
+                "f60_64",
+                "m0_34",
+                "m35_44",
+                "m45_54",
+                "m55_59",
+                "m60_64"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                56,
+                57,
+                58,
+                59,
+                60,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                138,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "hcc47_gcancer",
+                "hcc85_gdiabetesmellit",
+                "hcc85_gcopdcf",
+                "hcc85_grenal_v23",
+                "grespdepandarre_gcopdcf",
+                "hcc85_hcc96",
+                "disable_substabuse_psych_v23"
+            ]
+        },
+        "ins": {
+            "demographic": [
+                "f0_34",
+                "f35_44",
+                "f45_54",
+                "f55_59",
+                "f60_64",
+                "f65_69",
+                "f70_74",
+                "f75_79",
+                "f80_84",
+                "f85_89",
+                "f90_94",
+                "f95_gt",
+                "m0_34",
+                "m35_44",
+                "m45_54",
+                "m55_59",
+                "m60_64",
+                "m65_69",
+                "m70_74",
+                "m75_79",
+                "m80_84",
+                "m85_89",
+                "m90_94",
+                "m95_gt"
+            ],
+            "hcc": [
+                1,
+                2,
+                6,
+                8,
+                9,
+                10,
+                11,
+                12,
+                17,
+                18,
+                19,
+                21,
+                22,
+                23,
+                27,
+                28,
+                29,
+                33,
+                34,
+                35,
+                39,
+                40,
+                46,
+                47,
+                48,
+                54,
+                55,
+                56,
+                57,
+                58,
+                59,
+                60,
+                70,
+                71,
+                72,
+                73,
+                74,
+                75,
+                76,
+                77,
+                78,
+                79,
+                80,
+                82,
+                83,
+                84,
+                85,
+                86,
+                87,
+                88,
+                96,
+                99,
+                100,
+                103,
+                104,
+                106,
+                107,
+                108,
+                110,
+                111,
+                112,
+                114,
+                115,
+                122,
+                124,
+                134,
+                135,
+                136,
+                137,
+                138,
+                157,
+                158,
+                161,
+                162,
+                166,
+                167,
+                169,
+                170,
+                173,
+                176,
+                186,
+                188,
+                189
+            ],
+            "interaction": [
+                "ltimcaid",
+                "origds",
+                "disabled_hcc85",
+                "disabled_pressure_ulcer",
+                "disabled_hcc161",
+                "disabled_hcc39",
+                "disabled_hcc77",
+                "disabled_hcc6",
+                "chf_gcopdcf",
+                "gcopdcf_card_resp_fail",
+                "sepsis_pressure_ulcer",
+                "sepsis_artif_openings",
+                "art_openings_press_ulcer",
+                "diabetes_chf",
+                "gcopdcf_asp_spec_b_pneum",
+                "asp_spec_b_pneum_pres_ulc",
+                "sepsis_asp_spec_bact_pneum",
+                "schizophrenia_gcopdcf",
+                "schizophrenia_chf",
+                "schizophrenia_seizures"
+            ]
+        },
+        "ne": {
+            "demographic": [
+                "nmcaid_norigdis_nef0_34",
+                "nmcaid_norigdis_nef35_44",
+                "nmcaid_norigdis_nef45_54",
+                "nmcaid_norigdis_nef55_59",
+                "nmcaid_norigdis_nef60_64",
+                "nmcaid_norigdis_nef65",
+                "nmcaid_norigdis_nef66",
+                "nmcaid_norigdis_nef67",
+                "nmcaid_norigdis_nef68",
+                "nmcaid_norigdis_nef69",
+                "nmcaid_norigdis_nef70_74",
+                "nmcaid_norigdis_nef75_79",
+                "nmcaid_norigdis_nef80_84",
+                "nmcaid_norigdis_nef85_89",
+                "nmcaid_norigdis_nef90_94",
+                "nmcaid_norigdis_nef95_gt",
+                "nmcaid_norigdis_nem0_34",
+                "nmcaid_norigdis_nem35_44",
+                "nmcaid_norigdis_nem45_54",
+                "nmcaid_norigdis_nem55_59",
+                "nmcaid_norigdis_nem60_64",
+                "nmcaid_norigdis_nem65",
+                "nmcaid_norigdis_nem66",
+                "nmcaid_norigdis_nem67",
+                "nmcaid_norigdis_nem68",
+                "nmcaid_norigdis_nem69",
+                "nmcaid_norigdis_nem70_74",
+                "nmcaid_norigdis_nem75_79",
+                "nmcaid_norigdis_nem80_84",
+                "nmcaid_norigdis_nem85_89",
+                "nmcaid_norigdis_nem90_94",
+                "nmcaid_norigdis_nem95_gt",
+                "mcaid_norigdis_nef0_34",
+                "mcaid_norigdis_nef35_44",
+                "mcaid_norigdis_nef45_54",
+                "mcaid_norigdis_nef55_59",
+                "mcaid_norigdis_nef60_64",
+                "mcaid_norigdis_nef65",
+                "mcaid_norigdis_nef66",
+                "mcaid_norigdis_nef67",
+                "mcaid_norigdis_nef68",
+                "mcaid_norigdis_nef69",
+                "mcaid_norigdis_nef70_74",
+                "mcaid_norigdis_nef75_79",
+                "mcaid_norigdis_nef80_84",
+                "mcaid_norigdis_nef85_89",
+                "mcaid_norigdis_nef90_94",
+                "mcaid_norigdis_nef95_gt",
+                "mcaid_norigdis_nem0_34",
+                "mcaid_norigdis_nem35_44",
+                "mcaid_norigdis_nem45_54",
+                "mcaid_norigdis_nem55_59",
+                "mcaid_norigdis_nem60_64",
+                "mcaid_norigdis_nem65",
+                "mcaid_norigdis_nem66",
+                "mcaid_norigdis_nem67",
+                "mcaid_norigdis_nem68",
+                "mcaid_norigdis_nem69",
+                "mcaid_norigdis_nem70_74",
+                "mcaid_norigdis_nem75_79",
+                "mcaid_norigdis_nem80_84",
+                "mcaid_norigdis_nem85_89",
+                "mcaid_norigdis_nem90_94",
+                "mcaid_norigdis_nem95_gt",
+                "nmcaid_origdis_nef65",
+                "nmcaid_origdis_nef66",
+                "nmcaid_origdis_nef67",
+                "nmcaid_origdis_nef68",
+                "nmcaid_origdis_nef69",
+                "nmcaid_origdis_nef70_74",
+                "nmcaid_origdis_nef75_79",
+                "nmcaid_origdis_nef80_84",
+                "nmcaid_origdis_nef85_89",
+                "nmcaid_origdis_nef90_94",
+                "nmcaid_origdis_nef95_gt",
+                "nmcaid_origdis_nem65",
+                "nmcaid_origdis_nem66",
+                "nmcaid_origdis_nem67",
+                "nmcaid_origdis_nem68",
+                "nmcaid_origdis_nem69",
+                "nmcaid_origdis_nem70_74",
+                "nmcaid_origdis_nem75_79",
+                "nmcaid_origdis_nem80_84",
+                "nmcaid_origdis_nem85_89",
+                "nmcaid_origdis_nem90_94",
+                "nmcaid_origdis_nem95_gt",
+                "mcaid_origdis_nef65",
+                "mcaid_origdis_nef66",
+                "mcaid_origdis_nef67",
+                "mcaid_origdis_nef68",
+                "mcaid_origdis_nef69",
+                "mcaid_origdis_nef70_74",
+                "mcaid_origdis_nef75_79",
+                "mcaid_origdis_nef80_84",
+                "mcaid_origdis_nef85_89",
+                "mcaid_origdis_nef90_94",
+                "mcaid_origdis_nef95_gt",
+                "mcaid_origdis_nem65",
+                "mcaid_origdis_nem66",
+                "mcaid_origdis_nem67",
+                "mcaid_origdis_nem68",
+                "mcaid_origdis_nem69",
+                "mcaid_origdis_nem70_74",
+                "mcaid_origdis_nem75_79",
+                "mcaid_origdis_nem80_84",
+                "mcaid_origdis_nem85_89",
+                "mcaid_origdis_nem90_94",
+                "mcaid_origdis_nem95_gt"
+            ],
+            "hcc": [],
+            "interaction": []
+        },
+        "snpne": {
+            "demographic": [
+                "nmcaid_norigdis_nef0_34",
+                "nmcaid_norigdis_nef35_44",
+                "nmcaid_norigdis_nef45_54",
+                "nmcaid_norigdis_nef55_59",
+                "nmcaid_norigdis_nef60_64",
+                "nmcaid_norigdis_nef65",
+                "nmcaid_norigdis_nef66",
+                "nmcaid_norigdis_nef67",
+                "nmcaid_norigdis_nef68",
+                "nmcaid_norigdis_nef69",
+                "nmcaid_norigdis_nef70_74",
+                "nmcaid_norigdis_nef75_79",
+                "nmcaid_norigdis_nef80_84",
+                "nmcaid_norigdis_nef85_89",
+                "nmcaid_norigdis_nef90_94",
+                "nmcaid_norigdis_nef95_gt",
+                "nmcaid_norigdis_nem0_34",
+                "nmcaid_norigdis_nem35_44",
+                "nmcaid_norigdis_nem45_54",
+                "nmcaid_norigdis_nem55_59",
+                "nmcaid_norigdis_nem60_64",
+                "nmcaid_norigdis_nem65",
+                "nmcaid_norigdis_nem66",
+                "nmcaid_norigdis_nem67",
+                "nmcaid_norigdis_nem68",
+                "nmcaid_norigdis_nem69",
+                "nmcaid_norigdis_nem70_74",
+                "nmcaid_norigdis_nem75_79",
+                "nmcaid_norigdis_nem80_84",
+                "nmcaid_norigdis_nem85_89",
+                "nmcaid_norigdis_nem90_94",
+                "nmcaid_norigdis_nem95_gt",
+                "mcaid_norigdis_nef0_34",
+                "mcaid_norigdis_nef35_44",
+                "mcaid_norigdis_nef45_54",
+                "mcaid_norigdis_nef55_59",
+                "mcaid_norigdis_nef60_64",
+                "mcaid_norigdis_nef65",
+                "mcaid_norigdis_nef66",
+                "mcaid_norigdis_nef67",
+                "mcaid_norigdis_nef68",
+                "mcaid_norigdis_nef69",
+                "mcaid_norigdis_nef70_74",
+                "mcaid_norigdis_nef75_79",
+                "mcaid_norigdis_nef80_84",
+                "mcaid_norigdis_nef85_89",
+                "mcaid_norigdis_nef90_94",
+                "mcaid_norigdis_nef95_gt",
+                "mcaid_norigdis_nem0_34",
+                "mcaid_norigdis_nem35_44",
+                "mcaid_norigdis_nem45_54",
+                "mcaid_norigdis_nem55_59",
+                "mcaid_norigdis_nem60_64",
+                "mcaid_norigdis_nem65",
+                "mcaid_norigdis_nem66",
+                "mcaid_norigdis_nem67",
+                "mcaid_norigdis_nem68",
+                "mcaid_norigdis_nem69",
+                "mcaid_norigdis_nem70_74",
+                "mcaid_norigdis_nem75_79",
+                "mcaid_norigdis_nem80_84",
+                "mcaid_norigdis_nem85_89",
+                "mcaid_norigdis_nem90_94",
+                "mcaid_norigdis_nem95_gt",
+                "nmcaid_origdis_nef65",
+                "nmcaid_origdis_nef66",
+                "nmcaid_origdis_nef67",
+                "nmcaid_origdis_nef68",
+                "nmcaid_origdis_nef69",
+                "nmcaid_origdis_nef70_74",
+                "nmcaid_origdis_nef75_79",
+                "nmcaid_origdis_nef80_84",
+                "nmcaid_origdis_nef85_89",
+                "nmcaid_origdis_nef90_94",
+                "nmcaid_origdis_nef95_gt",
+                "nmcaid_origdis_nem65",
+                "nmcaid_origdis_nem66",
+                "nmcaid_origdis_nem67",
+                "nmcaid_origdis_nem68",
+                "nmcaid_origdis_nem69",
+                "nmcaid_origdis_nem70_74",
+                "nmcaid_origdis_nem75_79",
+                "nmcaid_origdis_nem80_84",
+                "nmcaid_origdis_nem85_89",
+                "nmcaid_origdis_nem90_94",
+                "nmcaid_origdis_nem95_gt",
+                "mcaid_origdis_nef65",
+                "mcaid_origdis_nef66",
+                "mcaid_origdis_nef67",
+                "mcaid_origdis_nef68",
+                "mcaid_origdis_nef69",
+                "mcaid_origdis_nef70_74",
+                "mcaid_origdis_nef75_79",
+                "mcaid_origdis_nef80_84",
+                "mcaid_origdis_nef85_89",
+                "mcaid_origdis_nef90_94",
+                "mcaid_origdis_nef95_gt",
+                "mcaid_origdis_nem65",
+                "mcaid_origdis_nem66",
+                "mcaid_origdis_nem67",
+                "mcaid_origdis_nem68",
+                "mcaid_origdis_nem69",
+                "mcaid_origdis_nem70_74",
+                "mcaid_origdis_nem75_79",
+                "mcaid_origdis_nem80_84",
+                "mcaid_origdis_nem85_89",
+                "mcaid_origdis_nem90_94",
+                "mcaid_origdis_nem95_gt"
+            ],
+            "hcc": [],
+            "interaction": []
+        }
+    }
+}
+
+# Coefficients, in the same order as MANIFEST
+SEGMENTS = {
+    "cfa": {
+        "demographic": [
+            0.427,
+            0.52,
+            0.613,
+            0.762,
+            0.942,
+            1.087,
+            1.158,
+            0.478,
+            0.597,
+            0.724,
+            0.837,
+            1.058,
+            1.22,
+            1.359
+        ],
+        "hcc": [
+            0.604,
+            0.534,
+            0.592,
+            2.551,
+            1.007,
+            0.714,
+            0.311,
+            0.161,
+            0.344,
+            0.344,
+            0.108,
+            0.788,
+            0.389,
+            0.228,
+            1.136,
+            0.421,
+            0.04,
+            0.289,
+            0.373,
+            0.287,
+            0.588,
+            0.374,
+            1.237,
+            0.476,
+            0.249,
+            0.709,
+            0.524,
+            0.524,
+            0.697,
+            0.697,
+            0.365,
+            0.365,
+            1.141,
+            0.968,
+            0.568,
+            1.139,
+            0.0,
+            0.43,
+            0.409,
+            0.774,
+            0.715,
+            0.308,
+            0.592,
+            2.198,
+            0.954,
+            0.517,
+            0.355,
+            0.41,
+            0.318,
+            0.036,
+            0.39,
+            0.443,
+            0.443,
+            0.54,
+            0.38,
+            1.779,
+            0.585,
+            0.318,
+            0.497,
+            0.43,
+            0.154,
+            0.732,
+            0.286,
+            0.273,
+            0.286,
+            0.729,
+            0.729,
+            0.251,
+            0.251,
+            0.014,
+            2.512,
+            1.536,
+            0.776,
+            0.195,
+            0.592,
+            0.213,
+            0.568,
+            0.481,
+            0.256,
+            0.713,
+            0.734,
+            0.803,
+            0.837
+        ],
+        "interaction": [
+            0.168,
+            0.18,
+            0.843,
+            0.214,
+            0.256,
+            0.215,
+            0.542,
+            0.156
+        ]
+    },
+    "cfd": {
+        "demographic": [
+            0.326,
+            0.322,
+            0.345,
+            0.404,
+            0.462,
+            0.22,
+            0.209,
+            0.28,
+            0.374,
+            0.499
+        ],
+        "hcc": [
+            0.41,
+            0.658,
+            0.888,
+            2.814,
+            1.028,
+            0.778,
+            0.37,
+            0.23,
+            0.432,
+            0.432,
+            0.149,
+            0.857,
+            0.318,
+            0.355,
+            1.184,
+            0.416,
+            0.32,
+            0.606,
+            0.826,
+            0.576,
+            0.756,
+            0.349,
+            4.334,
+            0.759,
+            0.363,
+            0.912,
+            0.358,
+            0.348,
+            0.398,
+            0.274,
+            0.141,
+            0.12,
+            1.032,
+            0.995,
+            0.426,
+            1.286,
+            0.0,
+            0.461,
+            0.609,
+            0.822,
+            0.524,
+            0.171,
+            0.213,
+            1.554,
+            0.59,
+            0.59,
+            0.441,
+            0.508,
+            0.489,
+            0.191,
+            0.344,
+            0.613,
+            0.398,
+            0.359,
+            0.302,
+            1.836,
+            0.714,
+            0.306,
+            3.469,
+            0.333,
+            0.273,
+            0.515,
+            0.063,
+            0.296,
+            0.17,
+            0.671,
+            0.671,
+            0.333,
+            0.125,
+            0.0,
+            2.646,
+            1.462,
+            0.65,
+            0.378,
+            0.213,
+            0.089,
+            0.426,
+            0.543,
+            0.612,
+            1.063,
+            0.892,
+            0.846,
+            1.007
+        ],
+        "interaction": [
+            0.718,
+            0.116,
+            0.239,
+            0.587,
+            0.529,
+            0.414,
+            0.22
+        ]
+    },
+    "cna": {
+        "demographic": [
+            0.316,
+            0.381,
+            0.452,
+            0.54,
+            0.668,
+            0.823,
+            0.831,
+            0.301,
+            0.388,
+            0.472,
+            0.564,
+            0.707,
+            0.872,
+            1.021
+        ],
+        "hcc": [
+            0.344,
+            0.428,
+            0.446,
+            2.654,
+            1.027,
+            0.675,
+            0.309,
+            0.153,
+            0.307,
+            0.307,
+            0.106,
+            0.554,
+            0.262,
+            0.212,
+            0.913,
+            0.381,
+            0.153,
+            0.243,
+            0.308,
+            0.315,
+            0.431,
+            0.426,
+            1.394,
+            0.683,
+            0.214,
+            0.368,
+            0.368,
+            0.368,
+            0.606,
+            0.546,
+            0.353,
+            0.353,
+            1.338,
+            1.121,
+            0.519,
+            1.026,
+            0.354,
+            0.491,
+            0.533,
+            0.441,
+            0.686,
+            0.277,
+            0.575,
+            1.051,
+            0.404,
+            0.314,
+            0.31,
+            0.22,
+            0.219,
+            0.143,
+            0.271,
+            0.276,
+            0.276,
+            0.498,
+            0.368,
+            1.537,
+            0.401,
+            0.305,
+            0.509,
+            0.335,
+            0.216,
+            0.612,
+            0.164,
+            0.232,
+            0.522,
+            0.474,
+            0.474,
+            0.284,
+            0.284,
+            0.068,
+            2.112,
+            1.153,
+            0.551,
+            0.262,
+            0.575,
+            0.143,
+            0.508,
+            0.406,
+            0.249,
+            0.609,
+            0.855,
+            0.581,
+            0.567
+        ],
+        "interaction": [
+            0.248,
+            0.146,
+            0.847,
+            0.152,
+            0.191,
+            0.202,
+            0.384,
+            0.111
+        ]
+    },
+    "cnd": {
+        "demographic": [
+            0.225,
+            0.297,
+            0.331,
+            0.363,
+            0.413,
+            0.143,
+            0.184,
+            0.226,
+            0.272,
+            0.315
+        ],
+        "hcc": [
+            0.294,
+            0.527,
+            0.808,
+            2.713,
+            0.919,
+            0.671,
+            0.35,
+            0.221,
+            0.354,
+            0.354,
+            0.123,
+            0.799,
+            0.2,
+            0.417,
+            1.126,
+            0.365,
+            0.329,
+            0.551,
+            0.625,
+            0.536,
+            0.43,
+            0.378,
+            3.597,
+            0.91,
+            0.36,
+            0.564,
+            0.283,
+            0.249,
+            0.372,
+            0.372,
+            0.176,
+            0.123,
+            1.031,
+            0.764,
+            0.403,
+            1.131,
+            0.105,
+            0.518,
+            0.631,
+            0.582,
+            0.552,
+            0.226,
+            0.37,
+            0.873,
+            0.496,
+            0.435,
+            0.404,
+            0.306,
+            0.306,
+            0.132,
+            0.276,
+            0.257,
+            0.188,
+            0.331,
+            0.3,
+            1.588,
+            0.503,
+            0.327,
+            2.646,
+            0.244,
+            0.235,
+            0.371,
+            0.0,
+            0.253,
+            0.328,
+            0.461,
+            0.461,
+            0.227,
+            0.089,
+            0.012,
+            2.157,
+            1.295,
+            0.645,
+            0.537,
+            0.37,
+            0.043,
+            0.403,
+            0.441,
+            0.251,
+            0.957,
+            0.472,
+            0.818,
+            0.487
+        ],
+        "interaction": [
+            0.49,
+            0.079,
+            0.19,
+            0.52,
+            0.429,
+            0.325,
+            0.164
+        ]
+    },
+    "cpa": {
+        "demographic": [
+            0.347,
+            0.401,
+            0.479,
+            0.564,
+            0.68,
+            0.818,
+            0.917,
+            0.358,
+            0.42,
+            0.502,
+            0.554,
+            0.678,
+            0.862,
+            1.077
+        ],
+        "hcc": [
+            0.491,
+            0.393,
+            0.359,
+            2.45,
+            1.004,
+            0.649,
+            0.332,
+            0.16,
+            0.331,
+            0.331,
+            0.089,
+            0.556,
+            0.247,
+            0.197,
+            0.783,
+            0.426,
+            0.19,
+            0.267,
+            0.394,
+            0.292,
+            0.475,
+            0.357,
+            1.269,
+            0.703,
+            0.221,
+            0.415,
+            0.4,
+            0.4,
+            0.589,
+            0.589,
+            0.35,
+            0.299,
+            1.083,
+            1.083,
+            0.547,
+            0.74,
+            0.135,
+            0.313,
+            0.0,
+            0.299,
+            0.628,
+            0.321,
+            0.783,
+            0.886,
+            0.439,
+            0.392,
+            0.306,
+            0.333,
+            0.302,
+            0.162,
+            0.267,
+            0.281,
+            0.281,
+            0.503,
+            0.333,
+            1.556,
+            0.482,
+            0.312,
+            0.401,
+            0.356,
+            0.199,
+            0.61,
+            0.133,
+            0.193,
+            0.393,
+            0.481,
+            0.481,
+            0.276,
+            0.271,
+            0.038,
+            2.144,
+            1.25,
+            0.58,
+            0.0,
+            0.783,
+            0.101,
+            0.547,
+            0.411,
+            0.23,
+            0.556,
+            0.455,
+            0.573,
+            0.738
+        ],
+        "interaction": [
+            0.133,
+            0.08,
+            0.661,
+            0.145,
+            0.196,
+            0.234,
+            0.41,
+            0.132
+        ]
+    },
+    "cpd": {
+        "demographic": [
+            0.357,
+            0.387,
+            0.392,
+            0.389,
+            0.388,
+            0.367,
+            0.258,
+            0.288,
+            0.317,
+            0.349
+        ],
+        "hcc": [
+            0.213,
+            0.411,
+            0.732,
+            2.666,
+            0.899,
+            0.683,
+            0.364,
+            0.197,
+            0.379,
+            0.379,
+            0.125,
+            0.797,
+            0.226,
+            0.371,
+            0.95,
+            0.382,
+            0.263,
+            0.608,
+            0.656,
+            0.564,
+            0.495,
+            0.282,
+            4.166,
+            0.654,
+            0.385,
+            0.7,
+            0.282,
+            0.282,
+            0.327,
+            0.285,
+            0.123,
+            0.088,
+            1.185,
+            0.972,
+            0.377,
+            0.968,
+            0.0,
+            0.36,
+            0.304,
+            0.484,
+            0.495,
+            0.204,
+            0.246,
+            0.854,
+            0.854,
+            0.394,
+            0.376,
+            0.434,
+            0.434,
+            0.182,
+            0.305,
+            0.223,
+            0.223,
+            0.368,
+            0.203,
+            1.599,
+            0.501,
+            0.348,
+            3.018,
+            0.269,
+            0.231,
+            0.333,
+            0.147,
+            0.232,
+            0.185,
+            0.538,
+            0.538,
+            0.265,
+            0.023,
+            0.0,
+            2.574,
+            1.019,
+            0.604,
+            0.371,
+            0.246,
+            0.08,
+            0.377,
+            0.391,
+            0.263,
+            0.893,
+            0.648,
+            0.805,
+            0.684
+        ],
+        "interaction": [
+            0.633,
+            0.064,
+            0.215,
+            0.488,
+            0.526,
+            0.348,
+            0.224
+        ]
+    },
+    "ins": {
+        "demographic": [
+            0.898,
+            1.103,
+            1.041,
+            1.062,
+            1.065,
+            1.241,
+            1.148,
+            1.013,
+            0.882,
+            0.799,
+            0.669,
+            0.502,
+            1.098,
+            0.999,
+            0.961,
+            1.014,
+            1.058,
+            1.284,
+            1.326,
+            1.316,
+            1.208,
+            1.122,
+            0.99,
+            0.822
+        ],
+        "hcc": [
+            1.723,
+            0.332,
+            0.535,
+            1.302,
+            0.623,
+            0.461,
+            0.293,
+            0.211,
+            0.442,
+            0.442,
+            0.179,
+            0.275,
+            0.46,
+            0.379,
+            0.873,
+            0.486,
+            0.486,
+            0.355,
+            0.423,
+            0.357,
+            0.403,
+            0.293,
+            0.802,
+            0.577,
+            0.192,
+            0.178,
+            0.178,
+            0.178,
+            0.188,
+            0.188,
+            0.188,
+            0.0,
+            0.562,
+            0.501,
+            0.29,
+            0.475,
+            0.0,
+            0.332,
+            0.357,
+            0.033,
+            0.162,
+            0.065,
+            0.0,
+            1.626,
+            0.512,
+            0.313,
+            0.204,
+            0.366,
+            0.366,
+            0.366,
+            0.253,
+            0.108,
+            0.108,
+            0.016,
+            0.016,
+            0.881,
+            0.302,
+            0.094,
+            0.601,
+            0.311,
+            0.109,
+            0.16,
+            0.16,
+            0.394,
+            0.216,
+            0.472,
+            0.472,
+            0.245,
+            0.201,
+            0.092,
+            0.838,
+            0.308,
+            0.308,
+            0.0,
+            0.0,
+            0.0,
+            0.251,
+            0.0,
+            0.095,
+            0.475,
+            1.039,
+            0.518,
+            0.365
+        ],
+        "interaction": [
+            0.061,
+            0.001,
+            0.278,
+            0.546,
+            0.478,
+            0.451,
+            0.468,
+            0.407,
+            0.191,
+            0.415,
+            0.14,
+            0.48,
+            0.347,
+            0.17,
+            0.216,
+            0.465,
+            0.347,
+            0.415,
+            0.128,
+            0.573
+        ]
+    },
+    "ne": {
+        "demographic": [
+            0.804,
+            0.947,
+            1.015,
+            1.016,
+            1.122,
+            0.52,
+            0.515,
+            0.544,
+            0.597,
+            0.6,
+            0.69,
+            0.86,
+            1.013,
+            1.293,
+            1.293,
+            1.293,
+            0.442,
+            0.657,
+            0.864,
+            0.903,
+            0.92,
+            0.517,
+            0.533,
+            0.582,
+            0.626,
+            0.69,
+            0.785,
+            1.059,
+            1.246,
+            1.497,
+            1.497,
+            1.497,
+            0.969,
+            1.202,
+            1.305,
+            1.307,
+            1.408,
+            0.993,
+            0.897,
+            0.919,
+            0.95,
+            0.95,
+            0.985,
+            1.133,
+            1.352,
+            1.535,
+            1.701,
+            1.701,
+            0.734,
+            1.059,
+            1.353,
+            1.418,
+            1.55,
+            1.144,
+            1.094,
+            1.151,
+            1.202,
+            1.202,
+            1.298,
+            1.407,
+            1.555,
+            1.777,
+            1.777,
+            1.777,
+            1.122,
+            1.174,
+            1.174,
+            1.174,
+            1.174,
+            1.174,
+            1.174,
+            1.174,
+            1.293,
+            1.293,
+            1.293,
+            0.92,
+            1.071,
+            1.123,
+            1.123,
+            1.319,
+            1.408,
+            1.408,
+            1.408,
+            1.497,
+            1.497,
+            1.497,
+            1.462,
+            1.887,
+            1.887,
+            1.887,
+            1.887,
+            1.887,
+            1.887,
+            1.887,
+            1.887,
+            1.887,
+            1.887,
+            1.811,
+            2.198,
+            2.198,
+            2.198,
+            2.198,
+            2.198,
+            2.198,
+            2.198,
+            2.198,
+            2.198,
+            2.198
+        ],
+        "hcc": [],
+        "interaction": []
+    },
+    "snpne": {
+        "demographic": [
+            1.513,
+            1.513,
+            1.513,
+            1.613,
+            1.683,
+            1.016,
+            1.016,
+            1.084,
+            1.12,
+            1.174,
+            1.319,
+            1.519,
+            1.743,
+            1.96,
+            2.148,
+            2.148,
+            1.289,
+            1.289,
+            1.506,
+            1.634,
+            1.673,
+            0.994,
+            0.994,
+            1.029,
+            1.093,
+            1.151,
+            1.352,
+            1.585,
+            1.831,
+            2.087,
+            2.34,
+            2.34,
+            1.776,
+            1.776,
+            2.007,
+            2.091,
+            2.119,
+            1.393,
+            1.393,
+            1.491,
+            1.563,
+            1.58,
+            1.788,
+            1.965,
+            2.174,
+            2.453,
+            2.633,
+            2.633,
+            1.547,
+            1.547,
+            1.858,
+            2.037,
+            2.165,
+            1.533,
+            1.533,
+            1.651,
+            1.651,
+            1.651,
+            1.966,
+            2.125,
+            2.251,
+            2.581,
+            2.581,
+            2.581,
+            1.82,
+            1.82,
+            1.837,
+            1.837,
+            1.837,
+            2.004,
+            2.103,
+            2.453,
+            2.453,
+            2.453,
+            2.453,
+            1.676,
+            1.676,
+            1.729,
+            1.748,
+            1.8,
+            1.935,
+            2.065,
+            2.328,
+            2.328,
+            2.328,
+            2.328,
+            2.202,
+            2.202,
+            2.217,
+            2.241,
+            2.329,
+            2.416,
+            2.535,
+            2.724,
+            2.724,
+            2.724,
+            2.724,
+            2.175,
+            2.175,
+            2.176,
+            2.176,
+            2.176,
+            2.401,
+            2.481,
+            2.755,
+            2.755,
+            2.755,
+            2.755
+        ],
+        "hcc": [],
+        "interaction": []
+    }
+}
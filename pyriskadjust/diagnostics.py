@@ -0,0 +1,131 @@
+"""Collects data quality problems met while scoring.
+
+By default, missing coefficients are reported with logging.warning. Pass a
+Diagnostics object to the scoring functions instead to count them, along with
+diagnoses that map to no HCC and ages outside of the demographic cells:
+
+    diagnostics = Diagnostics()
+    for member in members:
+        model.compute_risk_score_components(..., diagnostics=diagnostics)
+    diagnostics.to_dict()
+
+Collectors of several batches or processes can be combined with merge, and
+shipped between processes with pickle or to_dict / from_dict. A collector
+created with enabled=False records nothing and silences the warnings, and the
+scoring code does no extra work for it.
+"""
+from collections import Counter
+
+
+class Diagnostics(object):
+    """Counters of the problems met while scoring
+
+    Keyword Arguments:
+        detail {bool} -- Whether to also keep the problems of each member, in
+            details (default: {False})
+        enabled {bool} -- Whether to record anything at all (default: {True})
+    """
+
+    def __init__(self, detail=False, enabled=True):
+        self.detail = detail
+        self.enabled = enabled
+        self.members = 0
+        self.unmapped_codes = Counter()
+        self.missing_coefficients = Counter()
+        self.out_of_range_ages = Counter()
+        self.details = []
+        self._current = None
+
+    def start_member(self, member=None):
+        """Starts recording the problems of a new member. The scoring
+        functions call it with member=None, which numbers members in the order
+        they are scored"""
+        if member is None:
+            member = self.members
+        self.members += 1
+        if self.detail:
+            self._current = {
+                "member": member,
+                "unmapped_codes": [],
+                "missing_coefficients": [],
+                "out_of_range_age": None,
+            }
+            self.details.append(self._current)
+
+    def unmapped_code(self, code):
+        self.unmapped_codes[code] += 1
+        if self._current is not None:
+            self._current["unmapped_codes"].append(code)
+
+    def missing_coefficient(self, variable):
+        self.missing_coefficients[variable] += 1
+        if self._current is not None:
+            self._current["missing_coefficients"].append(variable)
+
+    def out_of_range_age(self, age):
+        self.out_of_range_ages[age] += 1
+        if self._current is not None:
+            self._current["out_of_range_age"] = age
+
+    def add_counts(
+        self, members=0, unmapped_codes=None, missing_coefficients=None, out_of_range_ages=None
+    ):
+        """Adds counts collected in bulk, e.g. by score_batch, which keeps no
+        details per member
+
+        Keyword Arguments:
+            members {int} -- Number of members scored (default: {0})
+            unmapped_codes {dict} -- Occurrences of each unmapped code (default: {None})
+            missing_coefficients {dict} -- Occurrences of each missing variable (default: {None})
+            out_of_range_ages {dict} -- Occurrences of each out of range age (default: {None})
+        """
+        self.members += members
+        self.unmapped_codes.update(unmapped_codes or {})
+        self.missing_coefficients.update(missing_coefficients or {})
+        self.out_of_range_ages.update(out_of_range_ages or {})
+
+    def merge(self, other):
+        """Adds the counts and details of another collector to this one
+
+        Arguments:
+            other {Diagnostics} -- Another collector, e.g. of another batch
+
+        Returns:
+            Diagnostics -- self
+        """
+        self.members += other.members
+        self.unmapped_codes.update(other.unmapped_codes)
+        self.missing_coefficients.update(other.missing_coefficients)
+        self.out_of_range_ages.update(other.out_of_range_ages)
+        self.details.extend(other.details)
+        return self
+
+    def to_dict(self):
+        """Returns the collected data as a JSON serializable dict"""
+        return {
+            "members": self.members,
+            "unmapped_codes": dict(self.unmapped_codes),
+            "missing_coefficients": dict(self.missing_coefficients),
+            "out_of_range_ages": [
+                [age, count] for (age, count) in self.out_of_range_ages.items()
+            ],
+            "details": self.details,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Builds a collector back from the output of to_dict"""
+        diagnostics = cls(detail=bool(data["details"]))
+        diagnostics.members = data["members"]
+        diagnostics.unmapped_codes.update(data["unmapped_codes"])
+        diagnostics.missing_coefficients.update(data["missing_coefficients"])
+        diagnostics.out_of_range_ages.update(
+            dict((age, count) for (age, count) in data["out_of_range_ages"])
+        )
+        diagnostics.details.extend(data["details"])
+        return diagnostics
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_current"] = None
+        return state
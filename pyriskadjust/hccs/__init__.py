@@ -0,0 +1,43 @@
+"""HCC labels and hierarchies, one module per model version.
+
+Use :func:`get_hcc_labels` and :func:`get_hcc_hierarchy` to load them lazily.
+"""
+import importlib
+import sys
+from types import MappingProxyType
+
+HCC_VERSIONS = ("v20", "v22", "v23", "v24")
+
+
+def _get_module(version):
+    if version not in HCC_VERSIONS:
+        raise ValueError("Unknown HCC version: {}".format(version))
+    return importlib.import_module("pyriskadjust.hccs.hccs_" + version)
+
+
+def get_hcc_labels(version):
+    """Returns the HCC_LABELS dict of a model version, e.g. "v23" """
+    return _get_module(version).HCC_LABELS
+
+
+def get_hcc_hierarchy(version):
+    """Returns the HCC_HIERARCHY dict of a model version, e.g. "v23" """
+    return _get_module(version).HCC_HIERARCHY
+
+
+def freeze_hierarchies():
+    """Replaces the HCC_HIERARCHY of every loaded version with a read-only
+    mapping of tuples, and its HCC_LABELS with a read-only mapping"""
+    for version in HCC_VERSIONS:
+        module = sys.modules.get("pyriskadjust.hccs.hccs_" + version)
+        if module is None:
+            continue
+        if isinstance(module.HCC_HIERARCHY, dict):
+            module.HCC_HIERARCHY = MappingProxyType(
+                dict(
+                    (hcc, tuple(children))
+                    for (hcc, children) in module.HCC_HIERARCHY.items()
+                )
+            )
+        if isinstance(module.HCC_LABELS, dict):
+            module.HCC_LABELS = MappingProxyType(module.HCC_LABELS)
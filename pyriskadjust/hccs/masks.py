@@ -0,0 +1,70 @@
+"""HCC sets represented as integer bitmasks.
+
+Bit n of a mask is set when HCC n is present, so HCC numbers are used as bit
+positions directly and a mask of any version fits in a few machine words.
+Group and hierarchy tests then become single & and | operations. Sets of ints
+are only built at the public API boundary, with mask_to_hccs.
+"""
+
+
+def hccs_to_mask(hccs):
+    """Returns the bitmask of an iterable of HCC numbers"""
+    mask = 0
+    for hcc in hccs:
+        mask |= 1 << hcc
+    return mask
+
+
+def as_mask(hccs):
+    """Returns the bitmask of HCCs given as a bitmask, or as any iterable of
+    HCC numbers (a set, a list, an array...)"""
+    if isinstance(hccs, int) and not isinstance(hccs, bool):
+        return hccs
+    # int() turns numpy integers into python ones, which do not overflow
+    return hccs_to_mask(int(hcc) for hcc in hccs)
+
+
+def iter_hccs(mask):
+    """Yields the HCC numbers of a bitmask, in increasing order"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def mask_to_hccs(mask):
+    """Returns the set of HCC numbers of a bitmask"""
+    return set(iter_hccs(mask))
+
+
+def hierarchy_masks(hierarchy):
+    """Compiles an HCC_HIERARCHY into exclusion masks
+
+    Arguments:
+        hierarchy {dict} -- A dictionary of the form {hcc: [excluded_hcc, ...]}
+
+    Returns:
+        dict -- A dictionary of the form {hcc: mask of the excluded HCCs}
+    """
+    return dict(
+        (hcc, hccs_to_mask(excluded))
+        for (hcc, excluded) in hierarchy.items()
+        if excluded
+    )
+
+
+def apply_hierarchy(mask, exclusions):
+    """Removes from a mask the HCCs excluded by the HCCs present in it.
+
+    Like the CMS software, exclusions are applied in one pass over the HCCs
+    initially present: an HCC that is itself excluded still excludes its own
+    children. The CMS hierarchies list every excluded HCC explicitly.
+
+    Arguments:
+        mask {int} -- Bitmask of HCCs
+        exclusions {dict} -- Output of hierarchy_masks
+    """
+    excluded = 0
+    for hcc in iter_hccs(mask):
+        excluded |= exclusions.get(hcc, 0)
+    return mask & ~excluded
@@ -0,0 +1,171 @@
+"""ICD-10 to HCC mappings, one module per CMS release.
+
+The mapping modules are very large, so they are only imported the first time
+they are requested through :func:`get_icd_mapping`. Each mapping is also
+shipped as a compact binary file (see :mod:`pyriskadjust.icd_mapping.binary`)
+which loads much faster than the python module, or can be memory-mapped so
+that all worker processes on a host share a single copy of it. The "store"
+backend serves every version from one deduplicated MappingStore, which keeps
+memory flat when several versions are used at once.
+
+The backend used by the models can be chosen with :func:`set_default_backend`
+or the PYRISKADJUST_ICD_BACKEND environment variable.
+
+:func:`get_incidence_matrix` exposes a mapping as a sparse codes x HCCs
+matrix, to map the claims of many patients at once (see
+:mod:`pyriskadjust.icd_mapping.incidence`).
+"""
+import importlib
+import os
+import sys
+
+from pyriskadjust.icd_mapping.binary import BinaryMapping, dumps_mapping, load_mapping
+from pyriskadjust.icd_mapping.store import MappingStore
+
+# Map mapping name to the CMS file it was generated from
+ICD_MAPPINGS = {
+    "2018_v21": "F2118H1R",
+    "2018_v22": "F2218O1P",
+    "2019_v23": "F2318P1Q",
+    "2020_v24": "F2419P1M",
+    "2021_v22": "F2221O1P",
+    "2021_v24": "F2421P1M",
+}
+
+BACKENDS = ("module", "binary", "mmap", "store")
+
+_default_backend = os.environ.get("PYRISKADJUST_ICD_BACKEND", "module")
+_loaded = {}
+_store = []
+_incidence = {}
+
+
+def set_default_backend(backend):
+    """Sets the backend used by get_icd_mapping when none is given, and thus
+    by the models. Call it before the first score is computed.
+
+    Arguments:
+        backend {string} -- One of "module", "binary", "mmap" or "store"
+    """
+    global _default_backend
+    if backend not in BACKENDS:
+        raise ValueError(
+            "Unknown backend {}, expected one of {}".format(backend, BACKENDS)
+        )
+    _default_backend = backend
+
+
+def binary_mapping_path(name):
+    """Returns the path of the binary file shipped for a mapping"""
+    return os.path.join(os.path.dirname(__file__), "mapping_{}.bin".format(name))
+
+
+def register_icd_mapping(name, mapping):
+    """Makes a mapping available under a name, for every backend. Use it to
+    score with a mapping loaded at runtime, e.g. by
+    pyriskadjust.loader.load_cms_directory
+
+    Arguments:
+        name {string} -- Name of the mapping, e.g. "2019_v23"
+        mapping {dict} -- A mapping of the form {"icd_code": [hcc, hcc, ...]}
+    """
+    for backend in BACKENDS:
+        _loaded[name, backend] = mapping
+    _incidence.pop(name, None)
+    ICD_MAPPINGS.setdefault(name, getattr(mapping, "source", ""))
+    # the compiled models hold on to the mapping they were built with
+    from pyriskadjust.models import refresh_models
+
+    refresh_models()
+
+
+def freeze_mappings():
+    """Replaces every mapping loaded as a python dict with an equivalent
+    BinaryMapping, which holds a few arrays instead of ~10k keys and lists.
+    Lookups in it do not touch the reference counts of shared objects, so
+    processes forked afterwards keep sharing its memory pages.
+    """
+    for (key, mapping) in list(_loaded.items()):
+        if isinstance(mapping, dict):
+            source = ICD_MAPPINGS[key[0]]
+            frozen = BinaryMapping(dumps_mapping(mapping, source=source))
+            _loaded[key] = frozen
+            # drop the dict held by the module as well, so it can be freed
+            module = sys.modules.get("pyriskadjust.icd_mapping.mapping_" + key[0])
+            if module is not None and module.ICD_MAPPING is mapping:
+                module.ICD_MAPPING = frozen
+
+
+def get_mapping_store():
+    """Returns the MappingStore holding all the shipped mappings, building it
+    from the binary files on first use"""
+    if not _store:
+        mappings = {}
+        for name in ICD_MAPPINGS:
+            # registered mappings have no shipped file
+            mappings[name] = _loaded.get((name, "binary"))
+            if mappings[name] is None:
+                mappings[name] = load_mapping(binary_mapping_path(name))
+        _store.append(MappingStore(mappings))
+    return _store[0]
+
+
+def get_icd_mapping(name, backend=None):
+    """Returns the ICD to HCC mapping for a given release, loading it on
+    first use
+
+    Arguments:
+        name {string} -- Name of the mapping, e.g. "2019_v23"
+
+    Keyword Arguments:
+        backend {string} -- "module" to import the python dict, "binary" to
+            read the binary file into memory, "mmap" to memory-map it,
+            "store" for a view of the shared MappingStore
+            (default: {the default backend, initially "module"})
+
+    Returns:
+        dict -- A mapping of the form {"icd_code": [hcc, hcc, ...]}
+    """
+    if backend is None:
+        backend = _default_backend
+    try:
+        return _loaded[name, backend]
+    except KeyError:
+        pass
+    if name not in ICD_MAPPINGS:
+        raise ValueError("Unknown ICD mapping: {}".format(name))
+    if backend == "module":
+        module = importlib.import_module("pyriskadjust.icd_mapping.mapping_" + name)
+        mapping = module.ICD_MAPPING
+    elif backend == "binary":
+        mapping = load_mapping(binary_mapping_path(name))
+    elif backend == "mmap":
+        mapping = load_mapping(binary_mapping_path(name), memory_map=True)
+    elif backend == "store":
+        mapping = get_mapping_store().view(name)
+    else:
+        raise ValueError(
+            "Unknown backend {}, expected one of {}".format(backend, BACKENDS)
+        )
+    _loaded[name, backend] = mapping
+    return mapping
+
+
+def get_incidence_matrix(name):
+    """Returns the IncidenceMatrix of a mapping, building it on first use.
+    Needs numpy
+
+    Arguments:
+        name {string} -- Name of the mapping, e.g. "2019_v23"
+
+    Returns:
+        IncidenceMatrix -- The mapping as a sparse codes x HCCs matrix
+    """
+    try:
+        return _incidence[name]
+    except KeyError:
+        pass
+    from pyriskadjust.icd_mapping.incidence import IncidenceMatrix
+
+    _incidence[name] = IncidenceMatrix(get_icd_mapping(name))
+    return _incidence[name]
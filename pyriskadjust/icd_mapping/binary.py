@@ -0,0 +1,197 @@
+"""Compact binary format for ICD to HCC mappings.
+
+Importing one of the generated ``mapping_*.py`` modules means compiling and
+executing a dict literal of ~10k entries. The same mapping can be stored as a
+few flat arrays instead, which load in well under a millisecond:
+
+    header   magic, format version, number of codes, number of values,
+             source file name and a sha256 of everything after it
+    keys     the ICD codes encoded as int64 (see codes.encode_icd), sorted
+    offsets  n_codes + 1 uint32, the HCCs of code i are values[off[i]:off[i+1]]
+    values   the HCCs as uint16
+
+All numbers are little endian.
+"""
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+import hashlib
+import mmap
+import numbers
+import struct
+import sys
+
+from pyriskadjust.icd_mapping.codes import encode_icd, decode_icd
+
+MAGIC = b"PRHM"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<4sHxxII8s32s")
+
+
+def _swap_if_big_endian(arr):
+    # the file is little endian, arrays use the native byte order
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+
+def dumps_mapping(mapping, source=""):
+    """Serializes an ICD to HCC mapping to bytes
+
+    Arguments:
+        mapping {dict} -- A dictionary of the form {"icd_code": [hcc, ...]}
+
+    Keyword Arguments:
+        source {string} -- Name of the CMS file the mapping is based on (default: {""})
+
+    Returns:
+        bytes -- The mapping in binary format
+    """
+    encoded = sorted((encode_icd(code), code) for code in mapping)
+    keys = array("q", [key for (key, _) in encoded])
+    offsets = array("I", [0])
+    values = array("H")
+    for (_, code) in encoded:
+        values.extend(mapping[code])
+        offsets.append(len(values))
+    payload = (
+        _swap_if_big_endian(keys).tobytes()
+        + _swap_if_big_endian(offsets).tobytes()
+        + _swap_if_big_endian(values).tobytes()
+    )
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(keys),
+        len(values),
+        source.encode("ascii"),
+        hashlib.sha256(payload).digest(),
+    )
+    return header + payload
+
+
+def write_mapping(mapping, path, source=""):
+    """Writes an ICD to HCC mapping to a file in binary format"""
+    with open(path, "wb") as f:
+        f.write(dumps_mapping(mapping, source=source))
+
+
+def load_mapping(path, memory_map=False):
+    """Reads a mapping written by write_mapping
+
+    Arguments:
+        path {string} -- Path of the binary mapping file
+
+    Keyword Arguments:
+        memory_map {bool} -- If True, serve lookups from a read-only memory
+            map of the file instead of copying it into the process. All
+            processes mapping the same file share one physical copy
+            (default: {False})
+
+    Returns:
+        BinaryMapping -- A read-only mapping of the form {"icd_code": [hcc, ...]}
+    """
+    with open(path, "rb") as f:
+        if memory_map:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return MappedBinaryMapping(buffer)
+        return BinaryMapping(f.read())
+
+
+def _read_header(buffer):
+    """Validates the header and checksum of a binary mapping and returns
+    (source, n_codes, n_values)"""
+    if len(buffer) < _HEADER.size:
+        raise ValueError("Not a binary ICD mapping: file too short")
+    (magic, version, n_codes, n_values, source, checksum) = _HEADER.unpack_from(
+        buffer, 0
+    )
+    if magic != MAGIC:
+        raise ValueError("Not a binary ICD mapping: bad magic {!r}".format(magic))
+    if version != FORMAT_VERSION:
+        raise ValueError("Unsupported binary ICD mapping version {}".format(version))
+    if hashlib.sha256(memoryview(buffer)[_HEADER.size:]).digest() != checksum:
+        raise ValueError("Binary ICD mapping is corrupt: checksum mismatch")
+    return source.rstrip(b"\0").decode("ascii"), n_codes, n_values
+
+
+class BinaryMapping(Mapping):
+    """Read-only ICD to HCC mapping backed by the arrays of the binary format.
+
+    Behaves like the ICD_MAPPING dicts: keys are ICD codes and values are
+    lists of HCCs. Lookups also accept codes encoded with codes.encode_icd.
+    """
+
+    # copy the arrays out of the buffer, rather than reading them in place
+    _copy = True
+
+    def __init__(self, buffer):
+        self.source, n_codes, n_values = _read_header(buffer)
+        view = memoryview(buffer)
+        keys_start = _HEADER.size
+        offsets_start = keys_start + 8 * n_codes
+        values_start = offsets_start + 4 * (n_codes + 1)
+        self._keys = self._section(view, keys_start, offsets_start, "q")
+        self._offsets = self._section(view, offsets_start, values_start, "I")
+        self._values = self._section(
+            view, values_start, values_start + 2 * n_values, "H"
+        )
+
+    def _section(self, view, start, end, typecode):
+        if self._copy or sys.byteorder == "big":
+            # memoryview.cast uses the native byte order, so big endian hosts
+            # always get private copies
+            return _swap_if_big_endian(array(typecode, view[start:end].tobytes()))
+        return view[start:end].cast(typecode)
+
+    def _index(self, code):
+        if isinstance(code, int):
+            pass
+        elif isinstance(code, numbers.Integral):
+            # e.g. numpy integers, from arrays of encoded codes
+            code = int(code)
+        else:
+            try:
+                code = encode_icd(code)
+            except (TypeError, ValueError):
+                return -1
+        i = bisect_left(self._keys, code)
+        if i < len(self._keys) and self._keys[i] == code:
+            return i
+        return -1
+
+    def __getitem__(self, code):
+        i = self._index(code)
+        if i < 0:
+            raise KeyError(code)
+        return self._values[self._offsets[i]:self._offsets[i + 1]].tolist()
+
+    def get(self, code, default=None):
+        i = self._index(code)
+        if i < 0:
+            return default
+        return self._values[self._offsets[i]:self._offsets[i + 1]].tolist()
+
+    def __contains__(self, code):
+        return self._index(code) >= 0
+
+    def __iter__(self):
+        return (decode_icd(key) for key in self._keys)
+
+    def encoded_items(self):
+        """Iterates over (encoded_code, [hcc, ...]) pairs, in key order"""
+        offsets = self._offsets
+        for (i, key) in enumerate(self._keys):
+            yield key, self._values[offsets[i]:offsets[i + 1]].tolist()
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class MappedBinaryMapping(BinaryMapping):
+    """BinaryMapping that reads keys and values straight from the buffer,
+    typically a read-only mmap, without copying them into the process.
+    """
+
+    _copy = False
@@ -0,0 +1,108 @@
+"""Integer encoding of ICD-10-CM codes.
+
+ICD-10-CM codes are at most 7 characters from [0-9A-Z]. Each character is
+stored as a base 37 digit (0 is reserved for padding), so that every code fits
+in a 64-bit integer and the integers sort in the same order as the codes:
+
+    encode_icd("A0103") < encode_icd("A0104") < encode_icd("A011")
+
+Codes must already be normalized, i.e. uppercase and without periods, see
+normalize_icd.
+"""
+from array import array
+
+MAX_CODE_LENGTH = 7
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_BASE = len(_ALPHABET) + 1
+_DIGITS = dict((c, i + 1) for (i, c) in enumerate(_ALPHABET))
+_PADDING = [_BASE ** (MAX_CODE_LENGTH - n) for n in range(MAX_CODE_LENGTH + 1)]
+
+# Claims repeat the same few thousand codes, so normalized codes are cached.
+# The cache is emptied when it reaches this size
+NORMALIZE_CACHE_SIZE = 1 << 16
+_normalized = {}
+
+
+def normalize_icd(code):
+    """Normalizes an ICD-10 code as found in claims, by stripping whitespace and
+    periods and uppercasing it, e.g. " e11.69" -> "E1169"
+
+    Arguments:
+        code {string} -- An ICD-10 code
+
+    Returns:
+        string -- The normalized code
+    """
+    try:
+        return _normalized[code]
+    except KeyError:
+        pass
+    normalized = code.strip().upper().replace(".", "")
+    if len(_normalized) >= NORMALIZE_CACHE_SIZE:
+        _normalized.clear()
+    _normalized[code] = normalized
+    return normalized
+
+
+def normalize_icds(codes):
+    """Normalizes a sequence of ICD-10 codes, see normalize_icd
+
+    Arguments:
+        codes {[string]} -- ICD-10 codes, as a list, tuple, array...
+
+    Returns:
+        [string] -- The normalized codes
+    """
+    cache = _normalized
+    try:
+        # most of the time, every code has been seen before
+        return [cache[code] for code in codes]
+    except KeyError:
+        return [normalize_icd(code) for code in codes]
+
+
+def encode_icd(code):
+    """Encodes an ICD-10 code as an integer
+
+    Arguments:
+        code {string} -- A normalized ICD-10 code, e.g. "E1169"
+
+    Returns:
+        int -- The encoded code
+    """
+    if len(code) > MAX_CODE_LENGTH:
+        raise ValueError("Invalid ICD-10 code: {}".format(code))
+    value = 0
+    try:
+        for c in code:
+            value = value * _BASE + _DIGITS[c]
+    except KeyError:
+        raise ValueError("Invalid ICD-10 code: {}".format(code))
+    return value * _PADDING[len(code)]
+
+
+def decode_icd(value):
+    """Decodes an integer produced by encode_icd back to the ICD-10 code"""
+    chars = []
+    for _ in range(MAX_CODE_LENGTH):
+        value, digit = divmod(value, _BASE)
+        if digit:
+            chars.append(_ALPHABET[digit - 1])
+        elif chars:
+            raise ValueError("Invalid encoded ICD-10 code")
+    if value:
+        raise ValueError("Invalid encoded ICD-10 code")
+    return "".join(reversed(chars))
+
+
+def encode_icds(codes):
+    """Encodes a sequence of ICD-10 codes
+
+    Arguments:
+        codes {[string]} -- Normalized ICD-10 codes
+
+    Returns:
+        array.array -- The encoded codes, as an array of int64
+    """
+    return array("q", [encode_icd(code) for code in codes])
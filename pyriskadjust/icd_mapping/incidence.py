@@ -0,0 +1,187 @@
+"""ICD-10 to HCC mappings as sparse incidence matrices.
+
+An IncidenceMatrix holds a mapping as a codes x HCCs matrix M, where M[i, h]
+is 1 when code i maps to HCC h. The diagnoses of many patients, as a
+patients x codes claims matrix C, then map to HCCs with a single sparse
+product: (C M)[p, h] is nonzero when patient p has a code mapping to HCC h.
+
+    incidence = get_incidence_matrix("2019_v23")
+    claims = incidence.claims_matrix(patients, codes, n_patients)
+    patient_hccs = incidence.hccs(claims)
+
+The matrices are scipy.sparse CSR matrices when scipy is installed, and
+CSRMatrix otherwise, a pure numpy implementation of the few operations used
+here. numpy is needed either way.
+"""
+import numpy
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+from pyriskadjust.icd_mapping.codes import normalize_icds
+
+
+def _factorize(values):
+    # Returns (distinct values, index of each value in them). Much faster than
+    # numpy.unique for strings
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    distinct = list(dict.fromkeys(values))
+    ids = dict(zip(distinct, range(len(distinct))))
+    return distinct, numpy.fromiter(map(ids.__getitem__, values), dtype=numpy.int64, count=len(values))
+
+
+def _unique(keys):
+    # sorted distinct ints, faster than numpy.unique for these
+    keys = numpy.sort(keys)
+    if len(keys):
+        keys = keys[numpy.concatenate(([True], keys[1:] != keys[:-1]))]
+    return keys
+
+
+class CSRMatrix(object):
+    """Compressed sparse row matrix, with the same attributes as a
+    scipy.sparse.csr_matrix and the few methods used by pyriskadjust
+
+    Arguments:
+        data {numpy.ndarray} -- The nonzero values, row by row
+        indices {numpy.ndarray} -- The column of each value
+        indptr {numpy.ndarray} -- Where each row starts in data, plus nnz
+        shape {(int, int)} -- The shape of the matrix
+    """
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.shape = shape
+
+    @classmethod
+    def from_pairs(cls, rows, columns, shape, data=None):
+        """Builds a matrix from the coordinates of its values, adding up the
+        values of duplicate coordinates. Values default to 1"""
+        rows = numpy.asarray(rows, dtype=numpy.int64)
+        columns = numpy.asarray(columns, dtype=numpy.int64)
+        if data is None:
+            data = numpy.ones(len(rows), dtype=numpy.int32)
+        keys = rows * shape[1] + columns
+        order = numpy.argsort(keys, kind="stable")
+        keys = keys[order]
+        if len(keys):
+            starts = numpy.flatnonzero(numpy.concatenate(([True], keys[1:] != keys[:-1])))
+            data = numpy.add.reduceat(numpy.asarray(data)[order], starts)
+            keys = keys[starts]
+        else:
+            data = numpy.asarray(data)[order]
+        indptr = numpy.searchsorted(keys, numpy.arange(shape[0] + 1) * shape[1])
+        return cls(data, keys % shape[1], indptr, shape)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def dot(self, other):
+        """Returns the product of this matrix by another CSRMatrix"""
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(
+                "Cannot multiply matrices of shapes {} and {}".format(self.shape, other.shape)
+            )
+        rows = numpy.repeat(numpy.arange(self.shape[0]), numpy.diff(self.indptr))
+        # each value (i, k) of self meets the values of row k of other
+        counts = other.indptr[self.indices + 1] - other.indptr[self.indices]
+        positions = numpy.repeat(
+            other.indptr[self.indices] - numpy.cumsum(counts) + counts, counts
+        ) + numpy.arange(counts.sum())
+        return CSRMatrix.from_pairs(
+            numpy.repeat(rows, counts),
+            other.indices[positions],
+            (self.shape[0], other.shape[1]),
+            numpy.repeat(self.data, counts) * other.data[positions],
+        )
+
+    __matmul__ = dot
+
+    def nonzero(self):
+        """Returns the (rows, columns) of the nonzero values"""
+        rows = numpy.repeat(numpy.arange(self.shape[0]), numpy.diff(self.indptr))
+        nonzero = self.data != 0
+        return rows[nonzero], self.indices[nonzero]
+
+    def toarray(self):
+        output = numpy.zeros(self.shape, dtype=self.data.dtype)
+        rows, columns = self.nonzero()
+        output[rows, columns] = self.data[self.data != 0]
+        return output
+
+
+def sparse_matrix(rows, columns, shape):
+    """Returns a CSR matrix of the given shape with ones at the given
+    coordinates, a scipy.sparse.csr_matrix if scipy is installed and a
+    CSRMatrix otherwise. Duplicate coordinates add up
+
+    Arguments:
+        rows {numpy.ndarray} -- The row of each value
+        columns {numpy.ndarray} -- The column of each value
+        shape {(int, int)} -- The shape of the matrix
+    """
+    if sparse is None:
+        return CSRMatrix.from_pairs(rows, columns, shape)
+    return sparse.csr_matrix(
+        (numpy.ones(len(rows), dtype=numpy.int32), (rows, columns)), shape=shape
+    )
+
+
+class IncidenceMatrix(object):
+    """An ICD to HCC mapping as a sparse codes x HCCs matrix
+
+    Arguments:
+        mapping {dict} -- A mapping of the form {"icd_code": [hcc, hcc, ...]}
+
+    Attributes:
+        codes {[string]} -- The code of each row, sorted
+        width {int} -- The number of columns, one per HCC number up to the
+            highest one mapped
+        matrix -- The codes x width CSR matrix
+    """
+
+    def __init__(self, mapping):
+        items = sorted(mapping.items())
+        self.codes = [code for (code, _) in items]
+        self._rows = dict((code, i) for (i, code) in enumerate(self.codes))
+        hccs = [hccs for (_, hccs) in items]
+        self.width = max([max(h) for h in hccs if h] or [-1]) + 1
+        self.matrix = sparse_matrix(
+            numpy.repeat(numpy.arange(len(hccs)), [len(h) for h in hccs]),
+            numpy.array([hcc for h in hccs for hcc in h], dtype=numpy.int64),
+            (len(self.codes), self.width),
+        )
+
+    def rows(self, codes):
+        """Returns the row of each normalized code, or -1 for the codes that
+        are not mapped"""
+        rows = self._rows
+        return numpy.array([rows.get(code, -1) for code in codes], dtype=numpy.int64)
+
+    def claims_matrix(self, patients, codes, n_patients):
+        """Builds the patients x codes matrix of claims lines, leaving out the
+        codes that are not mapped
+
+        Arguments:
+            patients {numpy.ndarray} -- The patient of each line, from 0 to n_patients - 1
+            codes {numpy.ndarray} -- The ICD-10 code of each line, as found in claims
+            n_patients {int} -- The number of patients
+        """
+        distinct, inverse = _factorize(codes)
+        rows = self.rows(normalize_icds(distinct))[inverse]
+        mapped = rows >= 0
+        return sparse_matrix(
+            numpy.asarray(patients)[mapped], rows[mapped], (n_patients, len(self.codes))
+        )
+
+    def hccs(self, claims):
+        """Maps a patients x codes claims matrix to the patients x HCCs matrix
+        of the patients' HCCs, before the hierarchy is applied. Values are
+        nonzero where the patient has the HCC"""
+        return claims.dot(self.matrix)
@@ -0,0 +1,141 @@
+"""Shared storage for several versions of the ICD to HCC mapping.
+
+Consecutive CMS releases map mostly the same ~10k codes to mostly the same
+HCCs. A MappingStore holds every code once, every distinct list of HCCs once,
+and for each code the assignment shared by most versions. Each version then
+only stores where it differs from that base:
+
+    codes        sorted int64 encoded codes, the union over all versions
+    assignments  the distinct HCC lists, assignment 0 means "not mapped"
+    base         uint16 assignment id of each code, the most common one
+    deltas       per version, sorted code indexes and their assignment ids
+
+Loading another version therefore costs a few kilobytes rather than another
+full mapping.
+"""
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+import numbers
+
+from pyriskadjust.icd_mapping.codes import encode_icd, decode_icd
+
+
+def _encoded_items(mapping):
+    if hasattr(mapping, "encoded_items"):
+        return mapping.encoded_items()
+    return ((encode_icd(code), hccs) for (code, hccs) in mapping.items())
+
+
+class MappingStore(object):
+    """Deduplicated store of several ICD to HCC mappings.
+
+    Arguments:
+        mappings {dict} -- A dictionary of the form {"version_name": mapping},
+            where each mapping is of the form {"icd_code": [hcc, ...]}
+    """
+
+    def __init__(self, mappings):
+        columns = {}
+        assignment_ids = {(): 0}
+        self._assignments = [()]
+        for (name, mapping) in mappings.items():
+            column = {}
+            for (code, hccs) in _encoded_items(mapping):
+                key = tuple(hccs)
+                if key not in assignment_ids:
+                    assignment_ids[key] = len(self._assignments)
+                    self._assignments.append(key)
+                column[code] = assignment_ids[key]
+            columns[name] = column
+
+        self._codes = array(
+            "q", sorted(set(code for column in columns.values() for code in column))
+        )
+        self._base = array("H")
+        for code in self._codes:
+            counts = {}
+            for column in columns.values():
+                assignment = column.get(code, 0)
+                counts[assignment] = counts.get(assignment, 0) + 1
+            self._base.append(max(counts, key=counts.get))
+
+        self._deltas = {}
+        self._sizes = {}
+        for (name, column) in columns.items():
+            indexes = array("I")
+            ids = array("H")
+            for (i, code) in enumerate(self._codes):
+                assignment = column.get(code, 0)
+                if assignment != self._base[i]:
+                    indexes.append(i)
+                    ids.append(assignment)
+            self._deltas[name] = (indexes, ids)
+            self._sizes[name] = len(column)
+
+    @property
+    def versions(self):
+        return list(self._deltas)
+
+    def view(self, name):
+        """Returns a read-only mapping of the form {"icd_code": [hcc, ...]}
+        for one of the versions in the store"""
+        if name not in self._deltas:
+            raise ValueError("Unknown mapping version in store: {}".format(name))
+        return MappingStoreView(self, name)
+
+
+class MappingStoreView(Mapping):
+    """One version of a MappingStore. Behaves like the ICD_MAPPING dicts, and
+    also accepts codes encoded with codes.encode_icd."""
+
+    def __init__(self, store, name):
+        self.name = name
+        self._store = store
+        self._delta_indexes, self._delta_ids = store._deltas[name]
+
+    def _assignment(self, i):
+        j = bisect_left(self._delta_indexes, i)
+        if j < len(self._delta_indexes) and self._delta_indexes[j] == i:
+            return self._delta_ids[j]
+        return self._store._base[i]
+
+    def _lookup(self, code):
+        if isinstance(code, int):
+            pass
+        elif isinstance(code, numbers.Integral):
+            # e.g. numpy integers, from arrays of encoded codes
+            code = int(code)
+        else:
+            try:
+                code = encode_icd(code)
+            except (TypeError, ValueError):
+                return 0
+        codes = self._store._codes
+        i = bisect_left(codes, code)
+        if i < len(codes) and codes[i] == code:
+            return self._assignment(i)
+        return 0
+
+    def __getitem__(self, code):
+        assignment = self._lookup(code)
+        if not assignment:
+            raise KeyError(code)
+        return list(self._store._assignments[assignment])
+
+    def get(self, code, default=None):
+        assignment = self._lookup(code)
+        if not assignment:
+            return default
+        return list(self._store._assignments[assignment])
+
+    def __contains__(self, code):
+        return self._lookup(code) != 0
+
+    def __iter__(self):
+        for (i, code) in enumerate(self._store._codes):
+            if self._assignment(i):
+                yield decode_icd(code)
+
+    def __len__(self):
+        return self._store._sizes[self.name]
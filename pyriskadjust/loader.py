@@ -0,0 +1,137 @@
+"""Loads raw CMS release files at runtime.
+
+CMS publishes the ICD to HCC mappings as whitespace separated text files
+(e.g. F2421P1M.TXT) and the coefficients as one-row csv files (e.g.
+C2318P1Q.csv). :func:`load_cms_directory` parses every such file of a
+directory once and caches the compiled tables on disk, keyed by a sha256 of
+the raw file, so that later starts only read the cache.
+
+The loaded tables can be used by the models under a release name with
+:func:`pyriskadjust.icd_mapping.register_icd_mapping` and
+:func:`pyriskadjust.coefficients.register_coefficients`.
+"""
+from collections import defaultdict
+import hashlib
+import json
+import os
+import tempfile
+
+from pyriskadjust.icd_mapping import binary
+
+# Bump when the parsing or the cache format changes, to invalidate old caches
+CACHE_VERSION = 1
+
+
+def parse_mapping_file(path):
+    """Parses a CMS ICD to HCC mapping file
+
+    Arguments:
+        path {string} -- Path of the file, with one "icd_code hcc" pair per line
+
+    Returns:
+        dict -- A dictionary of the form {"icd_code": [hcc, hcc, ...]}
+    """
+    mapping = defaultdict(list)
+    with open(path) as f:
+        for line in f:
+            fields = line.strip().split()
+            if fields:
+                mapping[fields[0]].append(int(fields[1]))
+    return dict(mapping)
+
+
+def parse_coefficient_file(path):
+    """Parses a CMS coefficient file
+
+    Arguments:
+        path {string} -- Path of the csv file, a header of variable names and
+            one row of coefficients
+
+    Returns:
+        dict -- A dictionary of the form {"coefficient_name": value}
+    """
+    with open(path) as f:
+        header = f.readline().strip().replace('"', "").split(",")
+        values = map(float, f.readline().strip().split(","))
+    return dict(zip([name.lower() for name in header], values))
+
+
+def default_cache_dir():
+    """Returns $PYRISKADJUST_CACHE_DIR, or ~/.cache/pyriskadjust"""
+    return os.environ.get(
+        "PYRISKADJUST_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "pyriskadjust"),
+    )
+
+
+def _fingerprint(path):
+    digest = hashlib.sha256("v{}:".format(CACHE_VERSION).encode("ascii"))
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_atomic(path, data):
+    # several workers may fill the cache at the same time
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _load_mapping(path, cache_dir):
+    cache_path = os.path.join(cache_dir, _fingerprint(path) + ".bin")
+    if not os.path.exists(cache_path):
+        name = os.path.splitext(os.path.basename(path))[0]
+        data = binary.dumps_mapping(parse_mapping_file(path), source=name)
+        _write_atomic(cache_path, data)
+    return binary.load_mapping(cache_path)
+
+
+def _load_coefficients(path, cache_dir):
+    cache_path = os.path.join(cache_dir, _fingerprint(path) + ".json")
+    if not os.path.exists(cache_path):
+        data = json.dumps(parse_coefficient_file(path))
+        _write_atomic(cache_path, data.encode("utf-8"))
+    with open(cache_path) as f:
+        return json.load(f)
+
+
+def load_cms_directory(directory, cache_dir=None):
+    """Loads every CMS mapping (F*.TXT) and coefficient (C*.csv) file of a
+    directory, using the on-disk cache when the file has been seen before
+
+    Arguments:
+        directory {string} -- Directory holding the raw CMS files
+
+    Keyword Arguments:
+        cache_dir {string} -- Where to cache the parsed tables
+            (default: {default_cache_dir()})
+
+    Returns:
+        dict -- A dictionary of the form
+        {
+            "icd_mappings": {"F2421P1M": {"icd_code": [hcc, ...]}},
+            "coefficients": {"C2318P1Q": {"coefficient_name": value}},
+        }
+        where the mappings are read-only BinaryMapping objects
+    """
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+
+    output = {"icd_mappings": {}, "coefficients": {}}
+    for filename in sorted(os.listdir(directory)):
+        path = os.path.join(directory, filename)
+        name, extension = os.path.splitext(filename)
+        if name[:1].upper() == "F" and extension.lower() == ".txt":
+            output["icd_mappings"][name] = _load_mapping(path, cache_dir)
+        elif name[:1].upper() == "C" and extension.lower() == ".csv":
+            output["coefficients"][name] = _load_coefficients(path, cache_dir)
+    return output
@@ -0,0 +1,134 @@
+"""Registry of the implemented CMS-HCC models.
+
+Models are looked up by payment year and model version with :func:`get_model`.
+Nothing is imported until a model is requested, and each model in turn only
+loads its ICD mapping, hierarchy and coefficients the first time it scores.
+
+Servers that load everything in a parent process and then fork workers should
+call :func:`preload` before forking instead.
+"""
+import gc
+import importlib
+import sys
+
+from pyriskadjust.coefficients import freeze_coefficients, get_compiled_coefficients
+from pyriskadjust.hccs import freeze_hierarchies
+from pyriskadjust.icd_mapping import freeze_mappings
+from pyriskadjust.models.common import MODEL_ABBREVIATIONS
+
+# Map (payment year, model version) to the module implementing it
+MODELS = {
+    (2018, 22): "pyriskadjust.models.model_2018_v22",
+    (2019, 23): "pyriskadjust.models.model_2019_v23",
+}
+
+# Tables exposed as attributes by every model module
+MODEL_TABLES = ("ICD_MAPPING", "HCC_HIERARCHY", "HCC_LABELS", "COEFFICIENTS")
+
+
+def _model_key(year, version):
+    return (int(year), int(str(version).lower().lstrip("v")))
+
+
+def get_model(year, version):
+    """Returns the module implementing a model
+
+    Arguments:
+        year {int} -- Payment year, e.g. 2019
+        version {int | string} -- Model version, e.g. 23 or "v23"
+
+    Returns:
+        module -- A module exposing compute_risk_score_components,
+            diagnoses_to_hccs and explain_score
+    """
+    key = _model_key(year, version)
+    if key not in MODELS:
+        raise ValueError(
+            "No model for year {} and version {}".format(year, version)
+        )
+    return importlib.import_module(MODELS[key])
+
+
+def get_latest_model(year=None, version=None):
+    """Returns the module implementing the latest model of a payment year
+    and model version, either of which may be left out
+
+    Keyword Arguments:
+        year {int} -- Payment year, e.g. 2019 (default: {any})
+        version {int | string} -- Model version, e.g. 23 or "v23" (default: {any})
+
+    Returns:
+        module -- See get_model
+    """
+    keys = sorted(MODELS)
+    if year is not None:
+        keys = [key for key in keys if str(key[0]) == str(year)]
+    if version is not None:
+        number = str(version).lower().lstrip("v")
+        keys = [key for key in keys if str(key[1]) == number]
+    if not keys:
+        raise ValueError(
+            "No model for year {} and version {}".format(
+                "any" if year is None else year, "any" if version is None else version
+            )
+        )
+    return get_model(*keys[-1])
+
+
+def refresh_models():
+    """Rebuilds the compiled models of every imported model module, so that
+    they pick up tables replaced since they were built, e.g. by
+    register_icd_mapping, register_coefficients or freeze_tables"""
+    for name in MODELS.values():
+        module = sys.modules.get(name)
+        if module is None:
+            continue
+        for table in MODEL_TABLES:
+            if table in vars(module):
+                # before python 3.7, the tables are plain module attributes
+                # (see the model modules), which would keep the old ones alive
+                setattr(module, table, vars(module)["__getattr__"](table))
+        module.VERSION.refresh()
+
+
+def freeze_tables():
+    """Turns all the loaded model tables (ICD mappings, HCC hierarchies and
+    labels, coefficients and their compiled form) into immutable structures
+    with few python objects, then moves every object allocated so far out of reach of
+    the garbage collector (gc.freeze, python 3.7+).
+
+    After a fork, reference count updates and garbage collection passes write
+    to the memory pages of the objects they touch, which slowly turns pages
+    shared with the parent into private copies. Frozen tables avoid both.
+    """
+    freeze_mappings()
+    freeze_hierarchies()
+    freeze_coefficients()
+    # the compiled models still point to the unfrozen tables
+    refresh_models()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+
+
+def preload(models=None, freeze=True):
+    """Loads the tables of some models up front, for servers that fork their
+    workers after startup (e.g. gunicorn --preload, multiprocessing with the
+    fork start method). Call it in the parent, right before forking. For best
+    results also call gc.disable() early in the parent, and gc.enable() in
+    each worker.
+
+    Keyword Arguments:
+        models {[(int, int)]} -- (year, version) pairs to load (default: {all models})
+        freeze {bool} -- Whether to call freeze_tables afterwards (default: {True})
+    """
+    keys = MODELS if models is None else [_model_key(*m) for m in models]
+    for (year, version) in keys:
+        module = get_model(year, version)
+        for table in MODEL_TABLES:
+            # loads the table, see __getattr__ of the model modules
+            getattr(module, table)
+        get_compiled_coefficients(module.COEFFICIENTS_NAME)
+        for model in MODEL_ABBREVIATIONS:
+            module.get_compiled_model(model)
+    if freeze:
+        freeze_tables()
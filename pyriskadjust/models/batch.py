@@ -0,0 +1,407 @@
+"""Scoring of whole populations with numpy.
+
+score_batch scores many patients at once from arrays, with the same results
+as calling compute_risk_score_components for each of them. The diagnoses of
+all the patients are passed as one flat array of ICD-10 codes and an array of
+offsets, patient i having the codes codes[offsets[i]:offsets[i + 1]]:
+
+    codes = ["E1169", "I5030", "I509", "R05"]
+    offsets = [0, 3, 3, 4]
+
+Patients are scored by chunks of CHUNK_SIZE. Within a chunk, each distinct
+code is normalized and looked up once, and the claims are mapped to HCCs with
+a sparse product by the incidence matrix of the ICD mapping (see
+pyriskadjust.icd_mapping.incidence), as is the hierarchy. The interactions and
+the coefficients are then applied to whole arrays at once.
+
+numpy is only needed by this module, and is not a dependency of pyriskadjust.
+scipy is used for the sparse products when it is installed.
+"""
+from collections import Counter
+import logging
+
+import numpy
+
+from pyriskadjust.hccs.masks import iter_hccs
+from pyriskadjust.icd_mapping import get_incidence_matrix
+from pyriskadjust.icd_mapping.codes import normalize_icds
+from pyriskadjust.icd_mapping.incidence import _factorize, _unique, sparse_matrix
+from pyriskadjust.models.common import (
+    AGE_SEX_CELLS,
+    FEMALE_EDIT_CODES,
+    FEMALE_EDIT_HCC,
+    MAX_AGE,
+    UNDER_18_EDIT_CODES,
+    UNDER_18_EDIT_HCC,
+    age_sex_cells,
+)
+# re-exported for the adapters of score_batch
+from pyriskadjust.models.common import OPTIONAL_MEMBER_COLUMNS  # noqa: F401
+
+# Patients scored at once, which bounds the memory used besides the output
+CHUNK_SIZE = 1 << 16
+
+
+def flatten_diagnoses(diagnoses):
+    """Returns the (codes, offsets) arrays of score_batch for a list of lists
+    of ICD-10 codes, one list per patient"""
+    offsets = numpy.zeros(len(diagnoses) + 1, dtype=numpy.int64)
+    numpy.cumsum([len(d) for d in diagnoses], out=offsets[1:])
+    codes = numpy.array([code for d in diagnoses for code in d], dtype=object)
+    return codes, offsets
+
+
+def _integers(values, n, name):
+    values = numpy.asarray(values)
+    if values.shape != (n,):
+        raise ValueError("Expected {} {}, got an array of shape {}".format(n, name, values.shape))
+    if values.dtype.kind in "iu":
+        return values.astype(numpy.int64, copy=False)
+    converted = values.astype(numpy.int64)
+    if values.dtype.kind == "f" and (converted != values).any():
+        raise ValueError("The {} must be integers".format(name))
+    return converted
+
+
+def _flags(values, n, name):
+    if values is None:
+        return numpy.zeros(n, dtype=bool)
+    values = numpy.asarray(values)
+    if values.shape != (n,):
+        raise ValueError("Expected {} {}, got an array of shape {}".format(n, name, values.shape))
+    return values.astype(bool)
+
+
+class VersionTables(object):
+    """The ICD mapping and hierarchy of a ModelVersion, as sparse matrices
+    indexed by HCC number
+
+    Arguments:
+        version {ModelVersion} -- The model version
+    """
+
+    def __init__(self, version):
+        _, hcc_hierarchy, _ = version.tables()
+        self.incidence = get_incidence_matrix(version.icd_mapping_name)
+        hccs = {FEMALE_EDIT_HCC, UNDER_18_EDIT_HCC, self.incidence.width - 1}
+        for (hcc, excluded) in hcc_hierarchy.items():
+            hccs.add(hcc)
+            hccs.update(excluded)
+        # every HCC a patient can have is below width
+        self.width = max(hccs) + 1
+        # width x width matrix of the HCCs excluded by each HCC
+        exclusions = version.hierarchy_masks()
+        pairs = [(hcc, child) for hcc in exclusions for child in iter_hccs(exclusions[hcc])]
+        self.exclusions = sparse_matrix(
+            numpy.array([hcc for (hcc, _) in pairs], dtype=numpy.int64),
+            numpy.array([child for (_, child) in pairs], dtype=numpy.int64),
+            (self.width, self.width),
+        )
+
+    def lookup(self, codes):
+        """Looks up distinct ICD-10 codes, as found in claims
+
+        Arguments:
+            codes {[string]} -- The codes
+
+        Returns:
+            dict -- The normalized codes ("codes"), their rows in the incidence
+            matrix ("rows", -1 for the codes with no HCC) and boolean arrays
+            flagging the codes of the special case edits
+        """
+        normalized = normalize_icds(codes)
+        return {
+            "codes": normalized,
+            "rows": self.incidence.rows(normalized),
+            "female_edit": numpy.array(
+                [code in FEMALE_EDIT_CODES for code in normalized], dtype=bool
+            ),
+            "under_18_edit": numpy.array(
+                [code in UNDER_18_EDIT_CODES for code in normalized], dtype=bool
+            ),
+            "f3481": numpy.array([code == "F3481" for code in normalized], dtype=bool),
+        }
+
+    def hccs(self, codes, line_patients, ages, sexes, unmapped_codes):
+        """Maps the diagnoses of a chunk of patients to HCCs, like
+        _diagnoses_to_mask, and applies the hierarchy
+
+        Arguments:
+            codes {numpy.ndarray} -- The codes of the chunk
+            line_patients {numpy.ndarray} -- The patient of each code
+            ages {numpy.ndarray} -- The ages of the patients
+            sexes {numpy.ndarray} -- The sexes of the patients
+            unmapped_codes {Counter} -- Receives the codes with no HCC
+
+        Returns:
+            (numpy.ndarray, numpy.ndarray) -- (patient, hcc) pairs, sorted
+        """
+        n = len(ages)
+        distinct, inverse = _factorize(codes)
+        table = self.lookup(distinct)
+        line_ages = ages[line_patients]
+
+        # the special case edits, see _diagnoses_to_mask
+        female = table["female_edit"][inverse] & (sexes[line_patients] == 2)
+        under_18 = ~female & table["under_18_edit"][inverse] & (line_ages < 18)
+        general = ~(
+            female
+            | under_18
+            | (line_ages < 6)
+            | ((line_ages > 18) & table["f3481"][inverse])
+        )
+        rows = table["rows"][inverse]
+        unmapped = general & (rows < 0)
+        if unmapped.any():
+            counts = numpy.bincount(inverse[unmapped], minlength=len(distinct))
+            for i in numpy.flatnonzero(counts):
+                unmapped_codes[table["codes"][i]] += int(counts[i])
+
+        # patients x codes, times codes x HCCs
+        mapped = general & (rows >= 0)
+        claims = sparse_matrix(
+            line_patients[mapped], rows[mapped], (n, len(self.incidence.codes))
+        )
+        patients, hccs = self.incidence.hccs(claims).nonzero()
+        patients = numpy.concatenate((patients, line_patients[female], line_patients[under_18]))
+        hccs = numpy.concatenate(
+            (
+                hccs,
+                numpy.full(female.sum(), FEMALE_EDIT_HCC, dtype=numpy.int64),
+                numpy.full(under_18.sum(), UNDER_18_EDIT_HCC, dtype=numpy.int64),
+            )
+        )
+        keys = _unique(patients * self.width + hccs)
+        patients = keys // self.width
+        hccs = keys % self.width
+
+        # remove the HCCs excluded by the hierarchy, in one pass like
+        # apply_hierarchy
+        excluded = sparse_matrix(patients, hccs, (n, self.width)).dot(self.exclusions)
+        excluded_patients, excluded_hccs = excluded.nonzero()
+        excluded = _unique(excluded_patients * self.width + excluded_hccs)
+        if len(excluded):
+            found = numpy.searchsorted(excluded, keys)
+            found[found == len(excluded)] = 0
+            kept = excluded[found] != keys
+            patients = patients[kept]
+            hccs = hccs[kept]
+        return patients, hccs
+
+
+class BatchModel(object):
+    """One segment of a model version, as arrays for score_batch
+
+    Arguments:
+        model {Model} -- The compiled segment
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.tables = model.version.batch_tables()
+        width = self.tables.width
+
+        self.variables = []
+        columns = {}
+
+        def column(name):
+            if name not in columns:
+                columns[name] = len(self.variables)
+                self.variables.append(name)
+            return columns[name]
+
+        # coefficient and output column by demographic prefix and cell id.
+        # The new enrollee prefixes are indexed by medicaid + 2 * origdis
+        if model.new_enrollee:
+            prefixes = ("nmcaid_norigdis_", "mcaid_norigdis_", "nmcaid_origdis_", "mcaid_origdis_")
+        else:
+            prefixes = ("",)
+        self.prefixes = prefixes
+        shape = (len(prefixes), len(AGE_SEX_CELLS))
+        self.demographic = numpy.full(shape, numpy.nan)
+        self.demographic_columns = numpy.zeros(shape, dtype=numpy.int64)
+        for (i, prefix) in enumerate(prefixes):
+            for (cell, variable) in enumerate(model._demographic_cells[prefix]):
+                if variable is not None:
+                    self.demographic[i, cell] = variable[1]
+                    self.demographic_columns[i, cell] = column(variable[0])
+        for (name, _) in model._demographic_variables.values():
+            column(name)
+
+        self.hcc = numpy.full(width, numpy.nan)
+        self.hcc_columns = numpy.zeros(width, dtype=numpy.int64)
+        for (hcc, (name, value)) in sorted(model._hcc_variables.items()):
+            if hcc < width:
+                self.hcc[hcc] = value
+                self.hcc_columns[hcc] = column(name)
+
+        # conditions of the interaction rules that are HCC groups, as a
+        # width x conditions matrix, and the rules by variable
+        conditions = sorted(model.interactions.conditions)
+        self.conditions = numpy.zeros((width, len(conditions)), dtype=bool)
+        for (j, condition) in enumerate(conditions):
+            for hcc in iter_hccs(model.interactions.conditions[condition]):
+                if hcc < width:
+                    self.conditions[hcc, j] = True
+        self.rules = []
+        rules = {}
+        for (variable, terms) in model.interactions.rules:
+            terms = [conditions.index(t) if t in model.interactions.conditions else t for t in terms]
+            if variable not in rules:
+                rules[variable] = []
+                self.rules.append((variable, rules[variable]))
+            rules[variable].append(terms)
+        self.interactions = dict(model._interaction_variables)
+        for (name, _) in model._interaction_variables.values():
+            column(name)
+        self.columns = columns
+
+    def score(
+        self,
+        codes,
+        offsets,
+        ages,
+        sexes,
+        long_term_institutional_in_medicaid=None,
+        new_enrollee_in_medicaid=None,
+        original_entitlement_reason=None,
+        components=False,
+        diagnostics=None,
+    ):
+        """See score_batch of the model modules"""
+        ages = numpy.asarray(ages)
+        n = len(ages)
+        ages = _integers(ages, n, "ages")
+        if (ages < 0).any():
+            raise ValueError("The ages must not be negative")
+        sexes = _integers(sexes, n, "sexes")
+        if original_entitlement_reason is None:
+            reasons = numpy.zeros(n, dtype=numpy.int64)
+        else:
+            reasons = _integers(original_entitlement_reason, n, "entitlement reasons")
+        ltimcaid = _flags(long_term_institutional_in_medicaid, n, "institutional flags")
+        ne_mcaid = _flags(new_enrollee_in_medicaid, n, "medicaid flags")
+        offsets = _integers(offsets, n + 1, "offsets")
+        if len(codes) != offsets[-1] or offsets[0] != 0 or (numpy.diff(offsets) < 0).any():
+            raise ValueError("The offsets do not describe the codes")
+
+        totals = numpy.zeros(n)
+        output = numpy.zeros((n, len(self.variables))) if components else None
+        unmapped_codes = Counter()
+        missing = Counter()
+        for start in range(0, n, CHUNK_SIZE):
+            end = min(n, start + CHUNK_SIZE)
+            self._score_chunk(
+                codes[offsets[start]:offsets[end]],
+                offsets[start:end + 1] - offsets[start],
+                ages[start:end],
+                sexes[start:end],
+                reasons[start:end],
+                ltimcaid[start:end],
+                ne_mcaid[start:end],
+                totals[start:end],
+                None if output is None else output[start:end],
+                unmapped_codes,
+                missing,
+            )
+
+        if diagnostics is None:
+            for (name, count) in sorted(missing.items()):
+                logging.warning("Coefficient not found for {} patients: {}".format(count, name))
+        elif diagnostics.enabled:
+            old = ages[ages > MAX_AGE]
+            diagnostics.add_counts(
+                n,
+                unmapped_codes,
+                missing,
+                dict(zip(*[a.tolist() for a in numpy.unique(old, return_counts=True)])),
+            )
+        if components:
+            return totals, output, list(self.variables)
+        return totals
+
+    def _score_chunk(
+        self,
+        codes,
+        offsets,
+        ages,
+        sexes,
+        reasons,
+        ltimcaid,
+        ne_mcaid,
+        totals,
+        output,
+        unmapped_codes,
+        missing,
+    ):
+        # totals and output are the rows of the chunk, filled in place
+        n = len(ages)
+        patients = numpy.arange(n)
+        prefix = self.model.prefix
+        is_originally_disabled = (ages >= 65) & (reasons == 1)
+
+        # --------- demographic variables ---------------------------------
+        if self.model.new_enrollee:
+            cells = age_sex_cells(ages, sexes, True)
+            prefix_ids = ne_mcaid.astype(numpy.int64) + 2 * is_originally_disabled
+        else:
+            cells = age_sex_cells(ages, sexes, False)
+            prefix_ids = numpy.zeros(n, dtype=numpy.int64)
+        values = self.demographic[prefix_ids, cells]
+        found = ~numpy.isnan(values)
+        totals[found] += values[found]
+        if output is not None:
+            output[found, self.demographic_columns[prefix_ids, cells][found]] = values[found]
+        if not found.all():
+            for (i, cell) in zip(prefix_ids[~found].tolist(), cells[~found].tolist()):
+                missing[prefix + self.prefixes[i] + AGE_SEX_CELLS[cell]] += 1
+
+        # the new enrollee models do not use the diagnoses
+        if self.model.new_enrollee:
+            return
+
+        # --------- HCC variables -----------------------------------------
+        hcc_patients, hccs = self.tables.hccs(
+            codes,
+            numpy.repeat(patients, numpy.diff(offsets)),
+            ages,
+            sexes,
+            unmapped_codes,
+        )
+        values = self.hcc[hccs]
+        found = ~numpy.isnan(values)
+        totals += numpy.bincount(hcc_patients[found], weights=values[found], minlength=n)
+        if output is not None:
+            output[hcc_patients[found], self.hcc_columns[hccs[found]]] = values[found]
+        for hcc in hccs[~found].tolist():
+            missing["{}hcc{}".format(prefix, hcc)] += 1
+
+        # --------- interaction variables ---------------------------------
+        present = numpy.zeros((n, self.conditions.shape[1]), dtype=bool)
+        rows, conditions = numpy.nonzero(self.conditions[hccs])
+        present[hcc_patients[rows], conditions] = True
+        # the FLAGS of pyriskadjust.models.interactions
+        flags = {
+            "disabled": (ages < 65) & (reasons != 0),
+            "originally_disabled": is_originally_disabled,
+            "female": sexes == 2,
+            "male": sexes == 1,
+            "under_65": ages < 65,
+            "ltimcaid": ltimcaid,
+        }
+        for (variable, rules) in self.rules:
+            applies = numpy.zeros(n, dtype=bool)
+            for terms in rules:
+                holds = numpy.ones(n, dtype=bool)
+                for term in terms:
+                    holds &= flags[term] if term in flags else present[:, term]
+                applies |= holds
+            if not applies.any():
+                continue
+            if variable not in self.interactions:
+                missing[prefix + variable] += int(applies.sum())
+                continue
+            name, value = self.interactions[variable]
+            totals[applies] += value
+            if output is not None:
+                output[applies, self.columns[name]] = value
@@ -1,6 +1,10 @@
+from array import array
 from datetime import datetime
 import re
 
+from pyriskadjust.hccs.masks import apply_hierarchy, hierarchy_masks, mask_to_hccs
+from pyriskadjust.icd_mapping.codes import normalize_icds
+
 
 MODEL_DESCRIPTIONS = {
     "cna": "Community Non-Dual Aged",
@@ -16,8 +20,16 @@ MODEL_DESCRIPTIONS = {
 
 MODEL_ABBREVIATIONS = MODEL_DESCRIPTIONS.keys()
 
+# Arguments of the scoring functions that tables of members may hold, besides
+# the ages and sexes
+OPTIONAL_MEMBER_COLUMNS = (
+    "long_term_institutional_in_medicaid",
+    "new_enrollee_in_medicaid",
+    "original_entitlement_reason",
+)
 
-def get_age_sex_string(age, sex, new_enrollee=False):
+
+def _age_sex_string(age, sex, new_enrollee=False):
     age_sex_string = "m" if int(sex) == 1 else "f"
     if 0 <= age <= 34:
         return age_sex_string + "0_34"
@@ -36,6 +48,100 @@ def get_age_sex_string(age, sex, new_enrollee=False):
         return age_sex_string + "95_gt"
 
 
+# Age/sex cells, precomputed for every age up to MAX_AGE. A cell id is an index
+# in AGE_SEX_CELLS, and _AGE_SEX_CELL_IDS holds the id of each
+# (age, sex, new_enrollee), at index age * 4 + (0 if male else 2) + new_enrollee
+MAX_AGE = 120
+AGE_SEX_CELLS = []
+_AGE_SEX_CELL_IDS = array("h")
+for _age in range(MAX_AGE + 1):
+    for _sex in (1, 2):
+        for _new_enrollee in (False, True):
+            _cell = _age_sex_string(_age, _sex, _new_enrollee)
+            if _cell not in AGE_SEX_CELLS:
+                AGE_SEX_CELLS.append(_cell)
+            _AGE_SEX_CELL_IDS.append(AGE_SEX_CELLS.index(_cell))
+_CELL_IDS_BY_NAME = dict((name, i) for (i, name) in enumerate(AGE_SEX_CELLS))
+del _age, _sex, _new_enrollee, _cell
+
+
+def age_sex_cell(age, sex, new_enrollee=False):
+    """Returns the id of the age/sex cell of a patient, i.e. the index of
+    get_age_sex_string(age, sex, new_enrollee) in AGE_SEX_CELLS, or -1 if the
+    age falls in no cell (e.g. negative ages)"""
+    if age.__class__ is int and 0 <= age <= MAX_AGE:
+        return _AGE_SEX_CELL_IDS[
+            age * 4 + (0 if int(sex) == 1 else 2) + (1 if new_enrollee else 0)
+        ]
+    return _CELL_IDS_BY_NAME.get(_age_sex_string(age, sex, new_enrollee), -1)
+
+
+def age_sex_cells(ages, sexes, new_enrollee=False):
+    """Vectorized age_sex_cell
+
+    Arguments:
+        ages {[int]} -- Ages of the patients
+        sexes {[int]} -- Sexes of the patients, 1=male, 2=female
+
+    Keyword Arguments:
+        new_enrollee {bool} -- Whether to use the new enrollee cells (default: {False})
+
+    Returns:
+        array.array -- The cell ids, as int16. A numpy array if ages is one
+    """
+    if hasattr(ages, "dtype") and ages.dtype.kind in "iu":
+        import numpy
+
+        sexes = numpy.asarray(sexes)
+        if sexes.dtype.kind not in "iu":
+            sexes = numpy.array([int(sex) for sex in sexes])
+        index = (
+            (numpy.clip(ages, 0, MAX_AGE) << 2)
+            | numpy.where(sexes == 1, 0, 2)
+            | int(bool(new_enrollee))
+        )
+        cells = numpy.frombuffer(_AGE_SEX_CELL_IDS, dtype=numpy.int16)[index]
+        cells[ages < 0] = -1
+        return cells
+    if hasattr(ages, "tolist"):
+        ages = ages.tolist()
+    return array(
+        "h", [age_sex_cell(age, sex, new_enrollee) for (age, sex) in zip(ages, sexes)]
+    )
+
+
+def get_age_sex_string(age, sex, new_enrollee=False):
+    cell = age_sex_cell(age, sex, new_enrollee)
+    if cell >= 0:
+        return AGE_SEX_CELLS[cell]
+    return _age_sex_string(age, sex, new_enrollee)
+
+
+# Special case edits of the ICD mapping, based on V22I0ED2.TXT: these codes map
+# to FEMALE_EDIT_HCC for women, and to UNDER_18_EDIT_HCC under 18
+FEMALE_EDIT_CODES = frozenset({"D66", "D67"})
+FEMALE_EDIT_HCC = 48
+UNDER_18_EDIT_CODES = frozenset(
+    {
+        "J410",
+        "J411",
+        "J418",
+        "J42",
+        "J430",
+        "J431",
+        "J432",
+        "J438",
+        "J439",
+        "J440",
+        "J441",
+        "J449",
+        "J982",
+        "J983",
+    }
+)
+UNDER_18_EDIT_HCC = 112
+
+
 def _diagnoses_to_hccs(icd_mapping, hcc_hierachy, diagnoses, age, sex):
     """Returns a list of hierarchical condition categories, implied by a set of
      diagnoses
@@ -46,45 +152,48 @@ def _diagnoses_to_hccs(icd_mapping, hcc_hierachy, diagnoses, age, sex):
     Returns:
         [int] -- A list of HCCs, represented as ints
     """
+    return mask_to_hccs(
+        _diagnoses_to_mask(icd_mapping, hcc_hierachy, diagnoses, age, sex)
+    )
+
+
+def _diagnoses_to_mask(
+    icd_mapping, hcc_hierachy, diagnoses, age, sex, diagnostics=None, exclusions=None
+):
+    """Same as _diagnoses_to_hccs, but returns the HCCs as a bitmask, see
+    pyriskadjust.hccs.masks. Diagnoses that map to no HCC are reported to
+    diagnostics, if given. exclusions are the hierarchy_masks of the
+    hierarchy, when the caller has them compiled already
+    """
     # Normalize codes by uppercasing and stripping out periods
-    diagnoses = [d.strip().upper().replace(".", "") for d in diagnoses]
+    diagnoses = normalize_icds(diagnoses)
 
-    hccs = set()
+    hccs = 0
 
     # get the union of all hccs implied by individual diagnoses
     for d in diagnoses:
         # some special case edits based on V22I0ED2.TXT
-        if sex == 2 and d in {"D66", "D67"}:
-            hccs.update({48})
-        elif age < 18 and d in {
-            "J410",
-            "J411",
-            "J418",
-            "J42",
-            "J430",
-            "J431",
-            "J432",
-            "J438",
-            "J439",
-            "J440",
-            "J441",
-            "J449",
-            "J982",
-            "J983",
-        }:
-            hccs.update({112})
+        if sex == 2 and d in FEMALE_EDIT_CODES:
+            hccs |= 1 << FEMALE_EDIT_HCC
+        elif age < 18 and d in UNDER_18_EDIT_CODES:
+            hccs |= 1 << UNDER_18_EDIT_HCC
         elif age < 6 or age > 18 and d == "F3481":
             pass
         else:
             # If not special case, default to general mapping
-            hccs.update(icd_mapping.get(d, []))
+            mapped = icd_mapping.get(d)
+            if mapped is None:
+                if diagnostics is not None and diagnostics.enabled:
+                    diagnostics.unmapped_code(d)
+                continue
+            for hcc in mapped:
+                hccs |= 1 << hcc
 
     # remove HCCs that are already implied by more specific categories in the
     # hierarchy
-    for cc in hccs.copy():
-        hccs.difference_update(hcc_hierachy.get(cc, []))
-
-    return hccs
+    if exclusions is None:
+        exclusions = hierarchy_masks(hcc_hierachy)
+    return apply_hierarchy(hccs, exclusions)
 
 
 def get_age_in_model_year(dob, model_year):
@@ -141,46 +250,72 @@ def _explain_score(
             }],
         }
     """
-    output = {
-        "total": round(sum(score_components.values()), 3),
-        "demographic_components": [],
-        "hcc_components": [],
-        "interaction_components": [],
-    }
-    # output["normalized_total"] = output["total"] / CODING_INTENSITY_NORMALIZATION
+    return ScoreExplainer(
+        model_abbreviations, interaction_var_descriptions, hcc_labels
+    ).explain(score_components)
 
-    demographic_regex = re.compile(
-        """
-        \S*                     # any chars
-        (?P<sex>m|f)            # sex
-        (?P<age_lo>\d{1,2})     # lower age limit
-        (_                      # optional underscore
-        (?P<age_hi>\d{1,2}|gt)  # optional upper age limit
-        )?$
-        """,
-        re.VERBOSE,
-    )
-    interaction_regex = re.compile(
-        """
-        \S*                     # any
-        (?P<var_name>{})$       # name of interaction variables
-        """.format(
-            "|".join(interaction_var_descriptions.keys())
-        ),
-        re.VERBOSE,
-    )
-    hcc_regex = re.compile(
+
+class ScoreExplainer(object):
+    """Explains score components, see _explain_score. The category and
+    description of each variable name are worked out once and kept in an
+    index, so that explaining a score only takes dict lookups.
+
+    Arguments:
+        model_abbreviations {[string]} -- Abbreviations of the segments
+        interaction_var_descriptions {dict} -- Descriptions of the interaction
+            variables, by name without the segment prefix
+        hcc_labels {dict} -- Labels of the HCCs, by HCC number
+
+    Keyword Arguments:
+        variables {[string]} -- Variable names to index up front, e.g. every
+            coefficient of the model. Other names are looked up on each call
+            (default: {()})
+    """
+
+    def __init__(
+        self, model_abbreviations, interaction_var_descriptions, hcc_labels, variables=()
+    ):
+        self.interaction_var_descriptions = interaction_var_descriptions
+        self.hcc_labels = hcc_labels
+        self.demographic_regex = re.compile(
+            r"""
+            \S*                     # any chars
+            (?P<sex>m|f)            # sex
+            (?P<age_lo>\d{1,2})     # lower age limit
+            (_                      # optional underscore
+            (?P<age_hi>\d{1,2}|gt)  # optional upper age limit
+            )?$
+            """,
+            re.VERBOSE,
+        )
+        self.interaction_regex = re.compile(
+            r"""
+            \S*                     # any
+            (?P<var_name>{})$       # name of interaction variables
+            """.format(
+                "|".join(interaction_var_descriptions.keys())
+            ),
+            re.VERBOSE,
+        )
+        self.hcc_regex = re.compile(
+            r"""
+            ^(?P<model_abbr>{})      # model abbreviation
+            \_hcc
+            (?P<hcc>\d+)$           # hcc number
+            """.format(
+                "|".join(model_abbreviations)
+            ),
+            re.VERBOSE,
+        )
+        self.index = dict((variable, self.describe(variable)) for variable in variables)
+
+    def describe(self, component):
+        """Returns what is known about a variable name, as a tuple of
+        (category, description, hcc) triples, one per category the name falls
+        in. The description of an HCC is its label, looked up when explaining.
         """
-        ^(?P<model_abbr>{})      # model abbreviation
-        \_hcc
-        (?P<hcc>\d+)$           # hcc number
-        """.format(
-            "|".join(model_abbreviations)
-        ),
-        re.VERBOSE,
-    )
-    for component, score in score_components.items():
-        m = re.match(demographic_regex, component)
+        output = []
+        m = self.demographic_regex.match(component)
         if m:
             sex = m.group("sex")
             age_lo = m.group("age_lo")
@@ -192,31 +327,39 @@ def _explain_score(
                 description += "in range {} to {}".format(age_lo, age_hi)
             else:
                 description += "equal to {}".format(age_lo)
+            output.append(("demographic_components", description, None))
 
-            output["demographic_components"].append(
-                {"variable_name": component, "score": score, "description": description}
-            )
-
-        m = re.match(interaction_regex, component)
+        m = self.interaction_regex.match(component)
         if m:
-            output["interaction_components"].append(
-                {
-                    "variable_name": component,
-                    "score": score,
-                    "description": interaction_var_descriptions.get(
-                        m.group("var_name"), "unknown"
-                    ),
-                }
+            description = self.interaction_var_descriptions.get(
+                m.group("var_name"), "unknown"
             )
+            output.append(("interaction_components", description, None))
 
-        m = re.match(hcc_regex, component)
+        m = self.hcc_regex.match(component)
         if m:
-            output["hcc_components"].append(
-                {
-                    "variable_name": component,
-                    "score": score,
-                    "description": hcc_labels[int(m.group("hcc"))],
-                }
-            )
-    return output
+            output.append(("hcc_components", None, int(m.group("hcc"))))
+        return tuple(output)
+
+    def explain(self, score_components):
+        """Explains score components, see _explain_score for the output"""
+        output = {
+            "total": round(sum(score_components.values()), 3),
+            "demographic_components": [],
+            "hcc_components": [],
+            "interaction_components": [],
+        }
+        # output["normalized_total"] = output["total"] / CODING_INTENSITY_NORMALIZATION
 
+        index = self.index
+        for component, score in score_components.items():
+            entries = index.get(component)
+            if entries is None:
+                entries = self.describe(component)
+            for (category, description, hcc) in entries:
+                if hcc is not None:
+                    description = self.hcc_labels[hcc]
+                output[category].append(
+                    {"variable_name": component, "score": score, "description": description}
+                )
+        return output
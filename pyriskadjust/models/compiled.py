@@ -0,0 +1,469 @@
+"""Compiled models, built once per model version and segment.
+
+A ModelVersion ties together the tables of one model version (ICD mapping,
+HCC hierarchy and coefficients) and its interaction logic. It builds one Model
+per segment (cna, cnd, ..., ins, ne, snpne) on first use. A Model holds
+everything a scoring call needs already resolved: the demographic, HCC and
+interaction variables of its segment mapped to their names and coefficients.
+
+HCC sets are handled as bitmasks (see pyriskadjust.hccs.masks) all the way
+through scoring. Sets are only built by the methods returning HCCs.
+
+The scoring methods take an optional pyriskadjust.diagnostics.Diagnostics,
+which then receives the problems otherwise reported with logging.warning.
+"""
+import logging
+
+from pyriskadjust.coefficients import get_compiled_coefficients
+from pyriskadjust.coefficients.compiled import SegmentCoefficients
+from pyriskadjust.hccs import get_hcc_hierarchy, get_hcc_labels
+from pyriskadjust.hccs.masks import (
+    apply_hierarchy,
+    as_mask,
+    hierarchy_masks,
+    iter_hccs,
+    mask_to_hccs,
+)
+from pyriskadjust.icd_mapping import get_icd_mapping
+from pyriskadjust.models.common import (
+    AGE_SEX_CELLS,
+    MAX_AGE,
+    MODEL_ABBREVIATIONS,
+    ScoreExplainer,
+    age_sex_cell,
+    get_age_sex_string,
+    _diagnoses_to_mask,
+)
+
+NEW_ENROLLEE_MODELS = frozenset({"ne", "snpne"})
+DEMOGRAPHIC_PREFIXES = (
+    "",
+    "nmcaid_norigdis_",
+    "mcaid_norigdis_",
+    "nmcaid_origdis_",
+    "mcaid_origdis_",
+)
+
+
+def _start_member(diagnostics, age):
+    if diagnostics is not None and diagnostics.enabled:
+        diagnostics.start_member()
+        if not 0 <= age <= MAX_AGE:
+            diagnostics.out_of_range_age(age)
+
+
+class ModelVersion(object):
+    """The tables and interaction logic of one model version
+
+    Arguments:
+        icd_mapping {string} -- Name of the ICD mapping, e.g. "2019_v23"
+        hcc_version {string} -- Version of the HCC labels and hierarchy, e.g. "v23"
+        coefficients {string} -- Name of the coefficient table, e.g. "2019_v23"
+        interactions {InteractionRules} -- The interaction table of the version
+        interaction_descriptions {dict} -- Descriptions of the interaction
+            variables, used to explain scores
+    """
+
+    def __init__(
+        self, icd_mapping, hcc_version, coefficients, interactions, interaction_descriptions
+    ):
+        self.icd_mapping_name = icd_mapping
+        self.hcc_version = hcc_version
+        self.coefficients_name = coefficients
+        self.interactions = interactions
+        self.interaction_descriptions = interaction_descriptions
+        self._tables = None
+        self._hierarchy_masks = None
+        self._explainer = None
+        self._batch_tables = None
+        self._models = {}
+
+    def tables(self):
+        """Returns (icd_mapping, hcc_hierarchy, hcc_labels), loading them on
+        first use"""
+        if self._tables is None:
+            self._tables = (
+                get_icd_mapping(self.icd_mapping_name),
+                get_hcc_hierarchy(self.hcc_version),
+                get_hcc_labels(self.hcc_version),
+            )
+        return self._tables
+
+    def hierarchy_masks(self):
+        """Returns the exclusion masks of the HCC hierarchy, see
+        pyriskadjust.hccs.masks.hierarchy_masks. They are compiled on first use"""
+        if self._hierarchy_masks is None:
+            self._hierarchy_masks = hierarchy_masks(self.tables()[1])
+        return self._hierarchy_masks
+
+    def model(self, model="cna"):
+        """Returns the compiled Model of a segment, building it on first use
+
+        Keyword Arguments:
+            model {str} -- Abbreviation for the model to use (default: {"cna"})
+        """
+        try:
+            return self._models[model]
+        except KeyError:
+            pass
+        self._models[model] = Model(self, model)
+        return self._models[model]
+
+    def refresh(self):
+        """Resolves the tables again and rebuilds the models built so far, e.g.
+        after they have been replaced by freeze_tables"""
+        compiled = self._hierarchy_masks is not None
+        self._tables = None
+        self._hierarchy_masks = None
+        self._explainer = None
+        self._batch_tables = None
+        if compiled:
+            self.hierarchy_masks()
+        for model in list(self._models):
+            self._models[model] = Model(self, model)
+
+    def components_by_model(
+        self,
+        diagnoses,
+        age,
+        sex,
+        long_term_institutional_in_medicaid=False,
+        new_enrollee_in_medicaid=False,
+        original_entitlement_reason=0,
+        models=None,
+        diagnostics=None,
+    ):
+        """Scores a patient with several segments, mapping the diagnoses to
+        HCCs only once. See compute_all_risk_score_components of the model
+        modules"""
+        if models is None:
+            models = MODEL_ABBREVIATIONS
+        _start_member(diagnostics, age)
+        # shared by all the segments except the new enrollee ones
+        hccs = None
+        hcc_numbers = ()
+        cell = -1
+        output = {}
+        for model in models:
+            compiled = self.model(model)
+            if hccs is None and not compiled.new_enrollee:
+                hccs = self.diagnoses_to_mask(diagnoses, age, sex, diagnostics)
+                hcc_numbers = list(iter_hccs(hccs))
+                cell = age_sex_cell(age, sex, new_enrollee=False)
+            components = compiled._components(
+                hccs or 0,
+                hcc_numbers,
+                cell,
+                age,
+                sex,
+                long_term_institutional_in_medicaid,
+                new_enrollee_in_medicaid,
+                original_entitlement_reason,
+                diagnostics,
+            )
+            output[model] = {"total": sum(components.values()), "components": components}
+        return output
+
+    def explainer(self):
+        """Returns the ScoreExplainer of the version, with every coefficient
+        name indexed. It is built on first use"""
+        if self._explainer is None:
+            variables = []
+            for segment in get_compiled_coefficients(self.coefficients_name).values():
+                variables.extend(segment.demographic_names)
+                variables.extend(name for name in segment.hcc_names if name is not None)
+                variables.extend(segment.interaction_names)
+            self._explainer = ScoreExplainer(
+                MODEL_ABBREVIATIONS,
+                self.interaction_descriptions,
+                self.tables()[2],
+                variables,
+            )
+        return self._explainer
+
+    def batch_tables(self):
+        """Returns the arrays of the version used by score_batch, built on
+        first use. Needs numpy"""
+        if self._batch_tables is None:
+            from pyriskadjust.models.batch import VersionTables
+
+            self._batch_tables = VersionTables(self)
+        return self._batch_tables
+
+    def apply_hierarchy(self, hccs):
+        """Returns a bitmask of HCCs without the ones excluded by the hierarchy"""
+        return apply_hierarchy(hccs, self.hierarchy_masks())
+
+    def diagnoses_to_hccs(self, diagnoses, age, sex):
+        return mask_to_hccs(self.diagnoses_to_mask(diagnoses, age, sex))
+
+    def diagnoses_to_mask(self, diagnoses, age, sex, diagnostics=None):
+        icd_mapping, hcc_hierarchy, _ = self.tables()
+        return _diagnoses_to_mask(
+            icd_mapping,
+            hcc_hierarchy,
+            diagnoses,
+            age,
+            sex,
+            diagnostics,
+            self.hierarchy_masks(),
+        )
+
+
+class Model(object):
+    """One segment of a model version, compiled for scoring
+
+    Arguments:
+        version {ModelVersion} -- The model version
+        model {str} -- Abbreviation for the segment, e.g. "cna"
+    """
+
+    def __init__(self, version, model):
+        self.version = version
+        self.model = model
+        self.prefix = model + "_"
+        self.new_enrollee = model in NEW_ENROLLEE_MODELS
+        self.interactions = version.interactions.segment(model)
+        self._batch = None
+
+        coefficients = get_compiled_coefficients(version.coefficients_name).get(model)
+        if coefficients is None:
+            coefficients = SegmentCoefficients(model, {})
+        self._demographic_variables = dict(
+            (variable, (coefficients.demographic_names[i], coefficients.demographic[i]))
+            for (variable, i) in coefficients.demographic_ids.items()
+        )
+        # (name, coefficient) of each age/sex cell, by the part of the variable
+        # name that comes before the cell
+        self._demographic_cells = dict(
+            (
+                prefix,
+                [self._demographic_variables.get(prefix + cell) for cell in AGE_SEX_CELLS],
+            )
+            for prefix in DEMOGRAPHIC_PREFIXES
+        )
+        self._hcc_variables = dict(
+            (hcc, (name, coefficients.hcc[hcc]))
+            for (hcc, name) in enumerate(coefficients.hcc_names)
+            if name is not None
+        )
+        self._interaction_variables = dict(
+            (variable, (coefficients.interaction_names[i], coefficients.interaction[i]))
+            for (variable, i) in coefficients.interaction_ids.items()
+        )
+
+    def hccs(self, diagnoses, age, sex):
+        """Returns the set of HCCs implied by a list of ICD-10 codes, after
+        applying the hierarchy"""
+        return self.version.diagnoses_to_hccs(diagnoses, age, sex)
+
+    def score(self, *args, **kwargs):
+        """Returns the risk score of a patient, i.e. the sum of the components.
+        Takes the same arguments as components"""
+        return sum(self.components(*args, **kwargs).values())
+
+    def score_batch(
+        self,
+        codes,
+        offsets,
+        ages,
+        sexes,
+        long_term_institutional_in_medicaid=None,
+        new_enrollee_in_medicaid=None,
+        original_entitlement_reason=None,
+        components=False,
+        diagnostics=None,
+    ):
+        """Scores many patients at once with numpy. See score_batch of the
+        model modules for the arguments"""
+        if self._batch is None:
+            from pyriskadjust.models.batch import BatchModel
+
+            self._batch = BatchModel(self)
+        return self._batch.score(
+            codes,
+            offsets,
+            ages,
+            sexes,
+            long_term_institutional_in_medicaid,
+            new_enrollee_in_medicaid,
+            original_entitlement_reason,
+            components,
+            diagnostics,
+        )
+
+    def components(
+        self,
+        diagnoses,
+        age,
+        sex,
+        long_term_institutional_in_medicaid=False,
+        new_enrollee_in_medicaid=False,
+        original_entitlement_reason=0,
+        diagnostics=None,
+    ):
+        """Computes the risk score components of a patient. See
+        compute_risk_score_components of the model modules for the arguments
+
+        Returns:
+            dict -- Dictionary of the form
+            {
+                "coefficient_name" : coefficient_value,
+                "coefficient_name" : coefficient_value
+            }
+        """
+        _start_member(diagnostics, age)
+        if self.new_enrollee:
+            # the new enrollee models do not use the diagnoses
+            hccs = 0
+            cell = -1
+        else:
+            hccs = self.version.diagnoses_to_mask(diagnoses, age, sex, diagnostics)
+            cell = age_sex_cell(age, sex, new_enrollee=False)
+        return self._components(
+            hccs,
+            iter_hccs(hccs),
+            cell,
+            age,
+            sex,
+            long_term_institutional_in_medicaid,
+            new_enrollee_in_medicaid,
+            original_entitlement_reason,
+            diagnostics,
+        )
+
+    def components_from_hccs(
+        self,
+        hccs,
+        age,
+        sex,
+        long_term_institutional_in_medicaid=False,
+        new_enrollee_in_medicaid=False,
+        original_entitlement_reason=0,
+        apply_hierarchy=False,
+        diagnostics=None,
+    ):
+        """Computes the risk score components of a patient from their HCCs
+        rather than their diagnoses. See compute_risk_score_components_from_hccs
+        of the model modules for the arguments"""
+        _start_member(diagnostics, age)
+        hccs = as_mask(hccs)
+        if apply_hierarchy:
+            hccs = self.version.apply_hierarchy(hccs)
+        return self._components(
+            hccs,
+            iter_hccs(hccs),
+            age_sex_cell(age, sex, new_enrollee=False),
+            age,
+            sex,
+            long_term_institutional_in_medicaid,
+            new_enrollee_in_medicaid,
+            original_entitlement_reason,
+            diagnostics,
+        )
+
+    def _components(
+        self,
+        hccs,
+        hcc_numbers,
+        cell,
+        age,
+        sex,
+        long_term_institutional_in_medicaid,
+        new_enrollee_in_medicaid,
+        original_entitlement_reason,
+        diagnostics,
+    ):
+        # hcc_numbers are the HCCs of the hccs bitmask, and cell the output of
+        # age_sex_cell, computed once by the callers
+        output = {}
+
+        # young and disabled
+        is_disabled = age < 65 and int(original_entitlement_reason) != 0
+        # old but original entitlement reason is disability
+        is_originally_disabled = age >= 65 and int(original_entitlement_reason) == 1
+
+        # --------- New Enrollee and SNP New Enrollee models -----
+
+        # These models are not based on HCCs. They are based solely on sex, age,
+        # whether the new enrollee qualified due to disability, and
+        # whether the new enrollee was on medicaid for at least part of the year
+        if self.new_enrollee:
+            if not new_enrollee_in_medicaid and not is_originally_disabled:
+                demographic_var = "nmcaid_norigdis_"
+            elif new_enrollee_in_medicaid and not is_originally_disabled:
+                demographic_var = "mcaid_norigdis_"
+            elif not new_enrollee_in_medicaid and is_originally_disabled:
+                demographic_var = "nmcaid_origdis_"
+            else:
+                demographic_var = "mcaid_origdis_"
+            self._add_demographic(
+                output,
+                demographic_var,
+                age_sex_cell(age, sex, True),
+                age,
+                sex,
+                True,
+                diagnostics,
+            )
+            return output
+
+        # --------- For all other models -----------------------------------
+
+        self._add_demographic(output, "", cell, age, sex, False, diagnostics)
+
+        hcc_variables = self._hcc_variables
+        for hcc in hcc_numbers:
+            variable = hcc_variables.get(hcc)
+            if variable is not None:
+                output[variable[0]] = variable[1]
+            elif diagnostics is None:
+                logging.warning("HCC coefficient not found: {}hcc{}".format(self.prefix, hcc))
+            elif diagnostics.enabled:
+                diagnostics.missing_coefficient("{}hcc{}".format(self.prefix, hcc))
+
+        interaction_variables = self._interaction_variables
+        for v in self.interactions.evaluate(
+            hccs,
+            age,
+            sex,
+            is_disabled,
+            is_originally_disabled,
+            long_term_institutional_in_medicaid,
+        ):
+            variable = interaction_variables.get(v)
+            if variable is not None:
+                output[variable[0]] = variable[1]
+            elif diagnostics is None:
+                logging.warning(
+                    "Warning, interaction coefficient not found: {}".format(self.prefix + v)
+                )
+            elif diagnostics.enabled:
+                diagnostics.missing_coefficient(self.prefix + v)
+
+        return output
+
+    def _add_demographic(
+        self, output, demographic_var, cell, age, sex, new_enrollee, diagnostics
+    ):
+        # demographic_var is the part of the variable name before the age/sex
+        # cell, only used by the new enrollee models
+        if cell >= 0:
+            variable = self._demographic_cells[demographic_var][cell]
+        else:
+            # ages that fall in no cell
+            demographic_var += get_age_sex_string(age, sex, new_enrollee)
+            variable = self._demographic_variables.get(demographic_var)
+        if variable is not None:
+            output[variable[0]] = variable[1]
+            return
+        if cell >= 0:
+            demographic_var += AGE_SEX_CELLS[cell]
+        if diagnostics is None:
+            logging.warning(
+                "Demographic coefficient not found for patient with age {} and sex {}: {}".format(
+                    age, sex, self.prefix + demographic_var
+                )
+            )
+        elif diagnostics.enabled:
+            diagnostics.missing_coefficient(self.prefix + demographic_var)
@@ -0,0 +1,130 @@
+"""Interaction variables described as data.
+
+Each model version lists its interactions as named HCC groups and rules:
+
+    INTERACTION_GROUPS = {"chf": {85}, "gCopdCF": {110, 111, 112}}
+    INTERACTION_RULES = [
+        # (variable, segments, conditions)
+        ("hcc85_gcopdcf", COMMUNITY, ("chf", "gCopdCF")),
+    ]
+
+A rule applies to a patient scored with one of its segments when all of its
+conditions hold. A condition is either the name of a group, which holds when
+the patient has any of its HCCs, "hcc<n>" for a single HCC, or one of FLAGS.
+Variables are reported in the order of the rules.
+
+InteractionRules compiles a table once per segment into a python function
+that computes each group once and then tests every rule in order, with no
+lookups by name left at scoring time.
+"""
+from pyriskadjust.hccs.masks import hccs_to_mask
+
+# Patient attributes usable as conditions besides HCC groups, and how they are
+# computed from the arguments of SegmentInteractions.evaluate
+FLAGS = {
+    "disabled": "is_disabled",
+    "originally_disabled": "is_originally_disabled",
+    "female": "int(sex) == 2",
+    "male": "int(sex) == 1",
+    "under_65": "age < 65",
+    "ltimcaid": "long_term_institutional_in_medicaid",
+}
+
+COMMUNITY = ("cna", "cnd", "cfa", "cfd", "cpa", "cpd")
+COMMUNITY_AGED = ("cna", "cfa", "cpa")
+COMMUNITY_DISABLED = ("cnd", "cfd", "cpd")
+INSTITUTIONAL = ("ins",)
+
+
+class InteractionRules(object):
+    """The interaction table of a model version
+
+    Arguments:
+        groups {dict} -- A dictionary of the form {"group_name": {hcc, ...}}
+        rules {[(string, [string], [string])]} -- (variable, segments,
+            conditions) triples, see the module docstring
+    """
+
+    def __init__(self, groups, rules):
+        self.groups = dict((name, hccs_to_mask(hccs)) for (name, hccs) in groups.items())
+        self.rules = [
+            (variable, tuple(segments), tuple(conditions))
+            for (variable, segments, conditions) in rules
+        ]
+        for (_, _, conditions) in self.rules:
+            for condition in conditions:
+                if condition not in FLAGS:
+                    self._condition_mask(condition)
+        self._segments = {}
+
+    def _condition_mask(self, condition):
+        if condition in self.groups:
+            return self.groups[condition]
+        if condition.startswith("hcc") and condition[3:].isdigit():
+            return 1 << int(condition[3:])
+        raise ValueError("Unknown interaction condition: {}".format(condition))
+
+    def segment(self, model):
+        """Returns the compiled SegmentInteractions of a segment, e.g. "cna" """
+        try:
+            return self._segments[model]
+        except KeyError:
+            pass
+        self._segments[model] = SegmentInteractions(
+            [
+                (variable, conditions)
+                for (variable, segments, conditions) in self.rules
+                if model in segments
+            ],
+            self._condition_mask,
+        )
+        return self._segments[model]
+
+
+class SegmentInteractions(object):
+    """The interaction rules of one segment, compiled into a python function
+    with one test per rule, like a hand-written if chain. It is called as
+
+        evaluate(hccs, age, sex, is_disabled, is_originally_disabled,
+                 long_term_institutional_in_medicaid)
+
+    where hccs is the bitmask of the patient's HCCs, and returns the
+    interaction variables that apply, in the order of the rules.
+
+    Arguments:
+        rules {[(string, [string])]} -- (variable, conditions) pairs
+        condition_mask {function} -- Returns the HCC mask of a condition
+    """
+
+    def __init__(self, rules, condition_mask):
+        self.rules = list(rules)
+        self.variables = tuple(variable for (variable, _) in rules)
+        # HCC mask of each condition that is not one of FLAGS
+        self.conditions = {}
+
+        # each HCC condition is computed once, as a local c<i> = hccs & M<i>
+        names = {}
+        namespace = {}
+        lines = [
+            "def evaluate(hccs, age, sex, is_disabled, is_originally_disabled,",
+            "             long_term_institutional_in_medicaid):",
+            "    interaction_vars = []",
+        ]
+        for (_, conditions) in rules:
+            for condition in conditions:
+                if condition not in FLAGS and condition not in names:
+                    i = len(names)
+                    names[condition] = "c{}".format(i)
+                    self.conditions[condition] = condition_mask(condition)
+                    namespace["M{}".format(i)] = self.conditions[condition]
+                    lines.append("    c{0} = hccs & M{0}".format(i))
+        for (i, (variable, conditions)) in enumerate(rules):
+            namespace["V{}".format(i)] = variable
+            tests = [FLAGS.get(c) or names[c] for c in conditions]
+            lines.append("    if {}:".format(" and ".join(tests) or "True"))
+            lines.append("        interaction_vars.append(V{})".format(i))
+        lines.append("    return interaction_vars")
+
+        self.source = "\n".join(lines) + "\n"
+        exec(compile(self.source, "<interactions>", "exec"), namespace)
+        self.evaluate = namespace["evaluate"]
@@ -1,17 +1,24 @@
 """Model implements CMS-HCC software V2218.79.O1"""
+import sys
 
-from pyriskadjust.icd_mapping.mapping_2018_v22 import ICD_MAPPING
-from pyriskadjust.hccs.hccs_v22 import HCC_HIERARCHY
-from pyriskadjust.hccs.hccs_v22 import HCC_LABELS
-from pyriskadjust.coefficients.coefficients_2018_v22 import COEFFICIENTS
+from pyriskadjust.icd_mapping import get_icd_mapping
+from pyriskadjust.hccs import get_hcc_hierarchy, get_hcc_labels
+from pyriskadjust.coefficients import get_coefficients
 from pyriskadjust.models.common import (
     MODEL_DESCRIPTIONS,
-    MODEL_ABBREVIATIONS,
-    get_age_sex_string,
-    _diagnoses_to_hccs,
-    _explain_score,
 )
-import logging
+from pyriskadjust.models.compiled import ModelVersion
+from pyriskadjust.models.interactions import (
+    COMMUNITY,
+    COMMUNITY_AGED,
+    INSTITUTIONAL,
+    InteractionRules,
+)
+
+# Tables used by this model. They are loaded on first use, see __getattr__
+ICD_MAPPING_NAME = "2018_v22"
+HCC_VERSION = "v22"
+COEFFICIENTS_NAME = "2018_v22"
 
 INTERACTION_VARIABLE_DESCRIPTIONS = {
     "hcc47_gcancer": "Immunity Disorders & Cancer",
@@ -47,17 +54,46 @@ INTERACTION_VARIABLE_DESCRIPTIONS = {
 
 
 # CODING_INTENSITY_NORMALIZATION = 1.017
+
+
+def __getattr__(name):
+    # keep the tables reachable as module attributes without importing them
+    # when the module itself is imported
+    if name == "ICD_MAPPING":
+        return get_icd_mapping(ICD_MAPPING_NAME)
+    if name == "HCC_HIERARCHY":
+        return get_hcc_hierarchy(HCC_VERSION)
+    if name == "HCC_LABELS":
+        return get_hcc_labels(HCC_VERSION)
+    if name == "COEFFICIENTS":
+        return get_coefficients(COEFFICIENTS_NAME)
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # modules have no __getattr__ before python 3.7 (PEP 562), so the tables
+    # are loaded along with the module there
+    for _table in ("ICD_MAPPING", "HCC_HIERARCHY", "HCC_LABELS", "COEFFICIENTS"):
+        globals()[_table] = __getattr__(_table)
+    del _table
+
+
 def explain_score(score_components):
-    return _explain_score(
-        MODEL_ABBREVIATIONS,
-        INTERACTION_VARIABLE_DESCRIPTIONS,
-        HCC_LABELS,
-        score_components,
-    )
+    return VERSION.explainer().explain(score_components)
 
 
 def diagnoses_to_hccs(diagnoses, age, sex):
-    return _diagnoses_to_hccs(ICD_MAPPING, HCC_HIERARCHY, diagnoses, age, sex)
+    return VERSION.diagnoses_to_hccs(diagnoses, age, sex)
+
+
+def get_compiled_model(model="cna"):
+    """Returns the compiled Model of a segment, see models.compiled.Model. It
+    is built on first use and then reused by every call
+
+    Keyword Arguments:
+        model {str} -- Abbreviation for the model to use (default: {"cna"})
+    """
+    return VERSION.model(model)
 
 
 def compute_risk_score_components(
@@ -68,6 +104,7 @@ def compute_risk_score_components(
     new_enrollee_in_medicaid=False,
     original_entitlement_reason=0,
     model="cna",
+    diagnostics=None,
 ):
     """Computes the risk score for a patient, given a list of diagnoses as ICD_10 codes,
     their age, sex, etc. 
@@ -82,6 +119,8 @@ def compute_risk_score_components(
         new_enrollee_in_medicaid {bool} -- True if new Medicare enrollee and number of months in Medicaid in payment year > 0. This is only relevant to the two New Enrollee models (default: {False})
         original_entitlement_reason {int} -- Original entitlement reason. 0 = Old Age, 1 = Disability, 2 = End Stage Renal Disease, 3 = both Disability and ESRD (default: {0})
         model {str} -- Abbreviation for the model to use (default: {"cna"})
+        diagnostics {Diagnostics} -- A pyriskadjust.diagnostics.Diagnostics collecting the
+            problems met, instead of logging warnings (default: {None})
 
     Returns:
         dict -- Dictionary of the form 
@@ -91,158 +130,220 @@ def compute_risk_score_components(
         }
     """
 
-    output = {}
-
-    model_prefix = "{}_".format(model)
-
-    # young and disabled
-    is_disabled = age < 65 and int(original_entitlement_reason) != 0
-    # old but original entitlement reason is disability
-    is_originally_disabled = age >= 65 and int(original_entitlement_reason) == 1
-
-    # --------- New Enrollee and SNP New Enrollee models -----
-
-    # These models are not based on HCCs. They are based solely on sex, age,
-    # whether the new enrollee qualified due to disability, and
-    # whether the new enrollee was on medicaid for at least part of the year
-    if model == "ne" or model == "snpne":
-        if not new_enrollee_in_medicaid and not is_originally_disabled:
-            demographic_var = model_prefix + "nmcaid_norigdis_"
-        elif new_enrollee_in_medicaid and not is_originally_disabled:
-            demographic_var = model_prefix + "mcaid_norigdis_"
-        elif not new_enrollee_in_medicaid and is_originally_disabled:
-            demographic_var = model_prefix + "nmcaid_origdis_"
-        elif new_enrollee_in_medicaid and is_originally_disabled:
-            demographic_var = model_prefix + "mcaid_origdis_"
-
-        demographic_var += get_age_sex_string(age, sex, new_enrollee=True)
-        if demographic_var in COEFFICIENTS:
-            output[demographic_var] = COEFFICIENTS[demographic_var]
-        else:
-            logging.warning(
-                "Demographic coefficient not found for patient with age {} and sex {}: {}".format(
-                    age, sex, demographic_var
-                )
-            )
-        return output
-
-    # --------- For all other models -----------------------------------
-
-    # Start by getting the demographic variable based on age and sex
-    demographic_var = model_prefix + get_age_sex_string(age, sex, new_enrollee=False)
-    if demographic_var in COEFFICIENTS:
-        output[demographic_var] = COEFFICIENTS[demographic_var]
-    else:
-        logging.warning(
-            "Demographic coefficient not found for patient with age {} and sex {}: {}".format(
-                age, sex, demographic_var
-            )
-        )
-
-    # Now compute the relevant HCCs
-    hccs = diagnoses_to_hccs(diagnoses, age, sex)
-    hcc_vars = [model_prefix + "hcc{}".format(hcc) for hcc in hccs]
-    for v in hcc_vars:
-        if v in COEFFICIENTS:
-            output[v] = COEFFICIENTS[v]
-        else:
-            logging.warning("HCC coefficient not found: {}".format(v))
-
-    # Now compute the interaction components
-    interaction_vars = []
-
-    # common variables to compute interaction vars
-    cancer = bool(hccs.intersection({8, 9, 10, 11, 12}))
-    diabetes = bool(hccs.intersection({17, 18, 19}))
-    card_resp_fail = bool(hccs.intersection({82, 83, 84}))
-    chf = 85 in hccs
-    gCopdCF = bool(hccs.intersection({110, 111, 112}))
-    renal = bool(hccs.intersection({134, 135, 136, 137}))
-    sepsis = 2 in hccs
-    gSubstanceAbuse = bool(hccs.intersection({54, 55}))
-    gPsychiatric = bool(hccs.intersection({57, 58}))
-
-    # --------- Community Models ------------------
-
-    if model in {"cna", "cnd", "cfa", "cfd", "cpa", "cpd"}:
-        # %*community models interactions
-        if 47 in hccs and cancer:
-            interaction_vars.append("hcc47_gcancer")
-        if chf and diabetes:
-            interaction_vars.append("hcc85_gdiabetesmellit")
-        if chf and gCopdCF:
-            interaction_vars.append("hcc85_gcopdcf")
-        if chf and renal:
-            interaction_vars.append("hcc85_grenal")
-        if card_resp_fail and gCopdCF:
-            interaction_vars.append("grespdepandarre_gcopdcf")
-        if chf and 96 in hccs:
-            interaction_vars.append("hcc85_hcc96")
-        if gSubstanceAbuse and gPsychiatric:
-            interaction_vars.append("gsubstanceabuse_gpsychiatric")
-
-        # in the models for aged patients, we also take into account
-        # whether they originally qualified due to disability
-        if model in {"cna", "cfa", "cpa"}:
-            if is_originally_disabled and int(sex) == 2:
-                interaction_vars.append("originallydisabled_female")
-            if is_originally_disabled and int(sex) == 1:
-                interaction_vars.append("originallydisabled_male")
-
-    # --------- Institutional Model ------------------
-
-    if model == "ins":
-        # %*institutional model;
-        pressure_ulcer = bool(hccs.intersection({157, 158}))  # /*10/19/2012*/
-
-        if chf and gCopdCF:
-            interaction_vars.append("chf_gcopdcf")
-        if gCopdCF and card_resp_fail:
-            interaction_vars.append("gcopdcf_card_resp_fail")
-        if sepsis and pressure_ulcer:
-            interaction_vars.append("sepsis_pressure_ulcer")
-        if sepsis and 188 in hccs:
-            interaction_vars.append("sepsis_artif_openings")
-        if pressure_ulcer and 188 in hccs:
-            interaction_vars.append("art_openings_pressure_ulcer")
-
-        if diabetes and chf:
-            interaction_vars.append("diabetes_chf")
-        if gCopdCF and 114 in hccs:
-            interaction_vars.append("gcopdcf_asp_spec_bact_pneum")
-        if pressure_ulcer and 114 in hccs:
-            interaction_vars.append("asp_spec_bact_pneum_pres_ulc")
-        if sepsis and 114 in hccs:
-            interaction_vars.append("sepsis_asp_spec_bact_pneum")
-        if gCopdCF and 57 in hccs:
-            interaction_vars.append("schizophrenia_gcopdcf")
-        if chf and 57 in hccs:
-            interaction_vars.append("schizophrenia_chf")
-        if 57 in hccs and 79 in hccs:
-            interaction_vars.append("schizophrenia_seizures")
-
-        if is_disabled and 85 in hccs:
-            interaction_vars.append("disabled_hcc85")
-        if is_disabled and pressure_ulcer:
-            interaction_vars.append("disabled_pressure_ulcer")
-        if is_disabled and 161 in hccs:
-            interaction_vars.append("disabled_hcc161")
-        if is_disabled and 39 in hccs:
-            interaction_vars.append("disabled_hcc39")
-        if is_disabled and 77 in hccs:
-            interaction_vars.append("disabled_hcc77")
-        if is_disabled and 6 in hccs:
-            interaction_vars.append("disabled_hcc6")
-
-        if long_term_institutional_in_medicaid:
-            interaction_vars.append("ltimcaid")
-        if is_originally_disabled:
-            interaction_vars.append("origds")
-
-    for v in (model_prefix + iv for iv in interaction_vars):
-        if v in COEFFICIENTS:
-            output[v] = COEFFICIENTS[v]
-        else:
-            logging.warning("Warning, interaction coefficient not found: {}".format(v))
-
-    return output
+    return VERSION.model(model).components(
+        diagnoses,
+        age,
+        sex,
+        long_term_institutional_in_medicaid,
+        new_enrollee_in_medicaid,
+        original_entitlement_reason,
+        diagnostics,
+    )
+
+
+def compute_all_risk_score_components(
+    diagnoses,
+    age,
+    sex,
+    long_term_institutional_in_medicaid=False,
+    new_enrollee_in_medicaid=False,
+    original_entitlement_reason=0,
+    models=None,
+    diagnostics=None,
+):
+    """Computes the risk score of a patient with several models at once, e.g.
+    when their dual or institutional status is not known yet. The diagnoses
+    are mapped to HCCs only once and shared by all the models.
+
+    Arguments:
+        diagnoses {[list]} -- List of ICD-10 codes, as strings
+        age {int} -- patient's age, as integer. This should be computed as of Feb 1 for a given model year
+        sex {int} -- 1=male, 2=female
+
+    Keyword Arguments:
+        long_term_institutional_in_medicaid {bool} -- See compute_risk_score_components (default: {False})
+        new_enrollee_in_medicaid {bool} -- See compute_risk_score_components (default: {False})
+        original_entitlement_reason {int} -- See compute_risk_score_components (default: {0})
+        models {[str]} -- Abbreviations of the models to use (default: {all of MODEL_ABBREVIATIONS})
+        diagnostics {Diagnostics} -- A pyriskadjust.diagnostics.Diagnostics collecting the
+            problems met, instead of logging warnings (default: {None})
+
+    Returns:
+        dict -- Dictionary of the form
+        {
+            "cna": {
+                "total": total score,
+                "components": {"coefficient_name" : coefficient_value}
+            },
+            "cnd": ...
+        }
+    """
+    return VERSION.components_by_model(
+        diagnoses,
+        age,
+        sex,
+        long_term_institutional_in_medicaid,
+        new_enrollee_in_medicaid,
+        original_entitlement_reason,
+        models,
+        diagnostics,
+    )
+
+
+def compute_risk_score_components_from_hccs(
+    hccs,
+    age,
+    sex,
+    long_term_institutional_in_medicaid=False,
+    new_enrollee_in_medicaid=False,
+    original_entitlement_reason=0,
+    model="cna",
+    apply_hierarchy=False,
+    diagnostics=None,
+):
+    """Computes the risk score for a patient from HCCs computed beforehand, e.g.
+    by diagnoses_to_hccs or taken from CMS reports, skipping the ICD mapping
+
+    Arguments:
+        hccs {set | [int] | int} -- The patient's HCCs, as an iterable of HCC
+            numbers (set, list, array...) or as a bitmask, see pyriskadjust.hccs.masks
+        age {int} -- patient's age, as integer. This should be computed as of Feb 1 for a given model year
+        sex {int} -- 1=male, 2=female
+
+    Keyword Arguments:
+        long_term_institutional_in_medicaid {bool} -- See compute_risk_score_components (default: {False})
+        new_enrollee_in_medicaid {bool} -- See compute_risk_score_components (default: {False})
+        original_entitlement_reason {int} -- See compute_risk_score_components (default: {0})
+        model {str} -- Abbreviation for the model to use (default: {"cna"})
+        apply_hierarchy {bool} -- Whether to remove the HCCs excluded by the
+            hierarchy first. Not needed for the output of diagnoses_to_hccs (default: {False})
+        diagnostics {Diagnostics} -- A pyriskadjust.diagnostics.Diagnostics collecting the
+            problems met, instead of logging warnings (default: {None})
+
+    Returns:
+        dict -- Dictionary of the form
+        {
+            "coefficient_name" : coefficient_value,
+            "coefficient_name" : coefficient_value
+        }
+    """
+    return VERSION.model(model).components_from_hccs(
+        hccs,
+        age,
+        sex,
+        long_term_institutional_in_medicaid,
+        new_enrollee_in_medicaid,
+        original_entitlement_reason,
+        apply_hierarchy,
+        diagnostics,
+    )
+
+
+def score_batch(
+    codes,
+    offsets,
+    ages,
+    sexes,
+    long_term_institutional_in_medicaid=None,
+    new_enrollee_in_medicaid=None,
+    original_entitlement_reason=None,
+    model="cna",
+    components=False,
+    diagnostics=None,
+):
+    """Computes the risk scores of many patients at once with numpy, with the
+    same results as compute_risk_score_components. Needs numpy
+
+    Arguments:
+        codes {numpy.ndarray} -- The ICD-10 codes of all the patients, one after the other
+        offsets {numpy.ndarray} -- Where the codes of each patient start, plus
+            the total number of codes: patient i has the codes
+            codes[offsets[i]:offsets[i + 1]]. See pyriskadjust.models.batch.flatten_diagnoses
+        ages {numpy.ndarray} -- The ages of the patients, as integers
+        sexes {numpy.ndarray} -- 1=male, 2=female
+
+    Keyword Arguments:
+        long_term_institutional_in_medicaid {numpy.ndarray} -- See compute_risk_score_components (default: {all False})
+        new_enrollee_in_medicaid {numpy.ndarray} -- See compute_risk_score_components (default: {all False})
+        original_entitlement_reason {numpy.ndarray} -- See compute_risk_score_components (default: {all 0})
+        model {str} -- Abbreviation for the model to use (default: {"cna"})
+        components {bool} -- Whether to also return the components (default: {False})
+        diagnostics {Diagnostics} -- Receives the counts of the problems met,
+            instead of one warning per missing coefficient (default: {None})
+
+    Returns:
+        numpy.ndarray -- The total scores of the patients. With components=True,
+        a (totals, components, variables) tuple, where components is a
+        patients x variables matrix of the coefficients that apply to each
+        patient, and variables the names of its columns
+    """
+    return VERSION.model(model).score_batch(
+        codes,
+        offsets,
+        ages,
+        sexes,
+        long_term_institutional_in_medicaid,
+        new_enrollee_in_medicaid,
+        original_entitlement_reason,
+        components,
+        diagnostics,
+    )
+
+
+# Interaction variables, see pyriskadjust.models.interactions
+INTERACTION_GROUPS = {
+    "cancer": {8, 9, 10, 11, 12},
+    "diabetes": {17, 18, 19},
+    "card_resp_fail": {82, 83, 84},
+    "chf": {85},
+    "gCopdCF": {110, 111, 112},
+    "renal": {134, 135, 136, 137},
+    "sepsis": {2},
+    "gSubstanceAbuse": {54, 55},
+    "gPsychiatric": {57, 58},
+    "pressure_ulcer": {157, 158},  # /*10/19/2012*/
+}
+
+INTERACTION_RULES = [
+    # community models
+    ("hcc47_gcancer", COMMUNITY, ("hcc47", "cancer")),
+    ("hcc85_gdiabetesmellit", COMMUNITY, ("chf", "diabetes")),
+    ("hcc85_gcopdcf", COMMUNITY, ("chf", "gCopdCF")),
+    ("hcc85_grenal", COMMUNITY, ("chf", "renal")),
+    ("grespdepandarre_gcopdcf", COMMUNITY, ("card_resp_fail", "gCopdCF")),
+    ("hcc85_hcc96", COMMUNITY, ("chf", "hcc96")),
+    ("gsubstanceabuse_gpsychiatric", COMMUNITY, ("gSubstanceAbuse", "gPsychiatric")),
+    # in the models for aged patients, we also take into account
+    # whether they originally qualified due to disability
+    ("originallydisabled_female", COMMUNITY_AGED, ("originally_disabled", "female")),
+    ("originallydisabled_male", COMMUNITY_AGED, ("originally_disabled", "male")),
+    # institutional model
+    ("chf_gcopdcf", INSTITUTIONAL, ("chf", "gCopdCF")),
+    ("gcopdcf_card_resp_fail", INSTITUTIONAL, ("gCopdCF", "card_resp_fail")),
+    ("sepsis_pressure_ulcer", INSTITUTIONAL, ("sepsis", "pressure_ulcer")),
+    ("sepsis_artif_openings", INSTITUTIONAL, ("sepsis", "hcc188")),
+    ("art_openings_pressure_ulcer", INSTITUTIONAL, ("pressure_ulcer", "hcc188")),
+    ("diabetes_chf", INSTITUTIONAL, ("diabetes", "chf")),
+    ("gcopdcf_asp_spec_bact_pneum", INSTITUTIONAL, ("gCopdCF", "hcc114")),
+    ("asp_spec_bact_pneum_pres_ulc", INSTITUTIONAL, ("pressure_ulcer", "hcc114")),
+    ("sepsis_asp_spec_bact_pneum", INSTITUTIONAL, ("sepsis", "hcc114")),
+    ("schizophrenia_gcopdcf", INSTITUTIONAL, ("gCopdCF", "hcc57")),
+    ("schizophrenia_chf", INSTITUTIONAL, ("chf", "hcc57")),
+    ("schizophrenia_seizures", INSTITUTIONAL, ("hcc57", "hcc79")),
+    ("disabled_hcc85", INSTITUTIONAL, ("disabled", "hcc85")),
+    ("disabled_pressure_ulcer", INSTITUTIONAL, ("disabled", "pressure_ulcer")),
+    ("disabled_hcc161", INSTITUTIONAL, ("disabled", "hcc161")),
+    ("disabled_hcc39", INSTITUTIONAL, ("disabled", "hcc39")),
+    ("disabled_hcc77", INSTITUTIONAL, ("disabled", "hcc77")),
+    ("disabled_hcc6", INSTITUTIONAL, ("disabled", "hcc6")),
+    ("ltimcaid", INSTITUTIONAL, ("ltimcaid",)),
+    ("origds", INSTITUTIONAL, ("originally_disabled",)),
+]
+
+VERSION = ModelVersion(
+    ICD_MAPPING_NAME,
+    HCC_VERSION,
+    COEFFICIENTS_NAME,
+    InteractionRules(INTERACTION_GROUPS, INTERACTION_RULES),
+    INTERACTION_VARIABLE_DESCRIPTIONS,
+)
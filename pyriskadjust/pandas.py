@@ -0,0 +1,98 @@
+"""Scoring of pandas DataFrames.
+
+Claims usually come as a long table of (member_id, icd10) rows, and the
+members as a separate table of demographics:
+
+    claims = pandas.DataFrame({"member_id": [1, 1, 2], "icd10": ["E1169", "I509", "R05"]})
+    members = pandas.DataFrame({"member_id": [1, 2], "age": [70, 81], "sex": [1, 2]})
+    scores = score_frame(claims, members, model="cna")
+
+score_frame groups the claims by member, with the codes turned into a
+categorical so that each distinct code is held by a single string object, and
+scores all the members at once with score_batch (see
+pyriskadjust.models.batch). Needs pandas and numpy.
+"""
+import numpy
+import pandas
+
+from pyriskadjust.models import get_latest_model
+from pyriskadjust.models.batch import OPTIONAL_MEMBER_COLUMNS
+
+
+def score_frame(
+    claims,
+    members,
+    model="cna",
+    year=None,
+    version=None,
+    components=True,
+    member_column="member_id",
+    code_column="icd10",
+    diagnostics=None,
+):
+    """Computes the risk scores of the members of a DataFrame, from a
+    DataFrame of their claims
+
+    Arguments:
+        claims {pandas.DataFrame} -- One row per diagnosis, with the member id
+            and the ICD-10 code. Rows of members not in members are ignored
+        members {pandas.DataFrame} -- One row per member, with the member id
+            and the "age" and "sex" columns of compute_risk_score_components.
+            The columns long_term_institutional_in_medicaid,
+            new_enrollee_in_medicaid and original_entitlement_reason are used
+            when present
+
+    Keyword Arguments:
+        model {str} -- Abbreviation for the model to use (default: {"cna"})
+        year {int} -- Payment year of the model (default: {the latest one of
+            the version, see get_latest_model})
+        version {int | string} -- Version of the model, e.g. 23 or "v23"
+            (default: {the latest one of the year})
+        components {bool} -- Whether to add a column per component (default: {True})
+        member_column {str} -- Name of the member id columns (default: {"member_id"})
+        code_column {str} -- Name of the ICD-10 code column of claims (default: {"icd10"})
+        diagnostics {Diagnostics} -- See score_batch (default: {None})
+
+    Returns:
+        pandas.DataFrame -- One row per member, indexed by member id, with a
+        "total" column and, with components=True, one column per variable of
+        the model holding its coefficient where it applies and 0 elsewhere
+    """
+    module = get_latest_model(year, version)
+
+    member_ids = pandas.Index(members[member_column])
+    if not member_ids.is_unique:
+        raise ValueError("The members table has duplicate {}".format(member_column))
+
+    # the claims, grouped by member in the order of members
+    positions = member_ids.get_indexer(claims[member_column])
+    codes = claims[code_column].astype("category").values
+    kept = (positions >= 0) & (codes.codes >= 0)
+    positions = positions[kept]
+    order = numpy.argsort(positions, kind="stable")
+    # a plain array holding one string object per distinct code, which
+    # score_batch factorizes quickly
+    codes = numpy.asarray(codes.categories, dtype=object)[codes.codes[kept][order]]
+    offsets = numpy.zeros(len(member_ids) + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(positions, minlength=len(member_ids)), out=offsets[1:])
+
+    optional = dict(
+        (column, members[column].values if column in members else None)
+        for column in OPTIONAL_MEMBER_COLUMNS
+    )
+    scores = module.score_batch(
+        codes,
+        offsets,
+        members["age"].values,
+        members["sex"].values,
+        model=model,
+        components=components,
+        diagnostics=diagnostics,
+        **optional
+    )
+    if not components:
+        return pandas.DataFrame({"total": scores}, index=member_ids)
+    totals, values, variables = scores
+    output = pandas.DataFrame(values, index=member_ids, columns=variables)
+    output.insert(0, "total", totals)
+    return output
@@ -0,0 +1,204 @@
+"""Streaming scoring of Parquet files, with bounded memory.
+
+score_parquet reads a members file and a claims file one record batch at a
+time, scores each batch of members with score_batch (see
+pyriskadjust.models.batch) and appends their scores to an output Parquet
+file. Only one batch of members and their claims are held in memory at a
+time, whatever the size of the files:
+
+    score_parquet("claims.parquet", "members.parquet", "scores.parquet", model="cna")
+
+Both files must be sorted by member id, so that the claims of each member are
+contiguous and come in the same order as the members. Claims of members that
+are not in the members file are skipped.
+
+Needs pyarrow and numpy, which are not dependencies of pyriskadjust.
+"""
+import logging
+
+import numpy
+import pyarrow
+import pyarrow.compute
+import pyarrow.parquet
+
+from pyriskadjust.models import get_latest_model
+from pyriskadjust.models.batch import OPTIONAL_MEMBER_COLUMNS
+
+# Members read at once
+BATCH_SIZE = 1 << 16
+
+
+def _is_sorted(ids, previous):
+    if len(ids) == 0:
+        return True
+    if previous is not None and ids[0] < previous:
+        return False
+    return bool((ids[1:] >= ids[:-1]).all())
+
+
+class _ClaimsCursor(object):
+    # Reads the claims file in order, handing out the claims up to a given
+    # member id
+
+    def __init__(self, batches, member_column, code_column):
+        self._batches = batches
+        self.member_column = member_column
+        self.code_column = code_column
+        # the claims read but not taken yet
+        self._ids = None
+        self._codes = None
+        self._last = None
+        self._exhausted = False
+
+    def _read(self):
+        for batch in self._batches:
+            batch = batch.filter(pyarrow.compute.is_valid(batch.column(self.code_column)))
+            ids = batch.column(self.member_column).to_numpy(zero_copy_only=False)
+            codes = batch.column(self.code_column).to_numpy(zero_copy_only=False)
+            if self._ids is None:
+                self._ids = ids[:0]
+                self._codes = codes[:0]
+            if not _is_sorted(ids, self._last):
+                raise ValueError("The claims are not sorted by {}".format(self.member_column))
+            if len(ids):
+                self._last = ids[-1]
+                self._ids = numpy.concatenate((self._ids, ids))
+                self._codes = numpy.concatenate((self._codes, codes))
+                return
+        self._exhausted = True
+
+    def take(self, last_id):
+        """Returns the (member ids, codes) of the claims of the members up to
+        last_id, included"""
+        while not self._exhausted and (
+            self._ids is None or len(self._ids) == 0 or self._ids[-1] <= last_id
+        ):
+            self._read()
+        if self._ids is None:
+            return numpy.array([]), numpy.array([], dtype=object)
+        n = numpy.searchsorted(self._ids, last_id, side="right")
+        taken = (self._ids[:n], self._codes[:n])
+        self._ids = self._ids[n:]
+        self._codes = self._codes[n:]
+        return taken
+
+    def rest(self):
+        """Returns the number of claims left"""
+        count = 0 if self._ids is None else len(self._ids)
+        for batch in self._batches:
+            count += batch.num_rows
+        return count
+
+
+def score_parquet(
+    claims_path,
+    members_path,
+    output_path,
+    model="cna",
+    year=None,
+    version=None,
+    components=False,
+    member_column="member_id",
+    code_column="icd10",
+    batch_size=BATCH_SIZE,
+    diagnostics=None,
+):
+    """Scores the members of a Parquet file from a Parquet file of their
+    claims, writing the scores to a Parquet file
+
+    Arguments:
+        claims_path {string} -- Parquet file with one row per diagnosis, the
+            member id and the ICD-10 code, sorted by member id
+        members_path {string} -- Parquet file with one row per member, the
+            member id and the "age" and "sex" columns of
+            compute_risk_score_components, sorted by member id. The columns
+            long_term_institutional_in_medicaid, new_enrollee_in_medicaid and
+            original_entitlement_reason are used when present
+        output_path {string} -- Where to write the scores
+
+    Keyword Arguments:
+        model {str} -- Abbreviation for the model to use (default: {"cna"})
+        year {int} -- Payment year of the model (default: {the latest one of
+            the version, see get_latest_model})
+        version {int | string} -- Version of the model, e.g. 23 or "v23"
+            (default: {the latest one of the year})
+        components {bool} -- Whether to add a column per component (default: {False})
+        member_column {str} -- Name of the member id columns (default: {"member_id"})
+        code_column {str} -- Name of the ICD-10 code column of the claims (default: {"icd10"})
+        batch_size {int} -- Number of members read at once (default: {BATCH_SIZE})
+        diagnostics {Diagnostics} -- See score_batch (default: {None})
+
+    Returns:
+        int -- The number of members scored. The output has one row per
+        member, in the order of the members file, with the member id, a
+        "total" column and, with components=True, one column per variable of
+        the model
+    """
+    module = get_latest_model(year, version)
+
+    members_file = pyarrow.parquet.ParquetFile(members_path)
+    member_columns = [member_column, "age", "sex"] + [
+        column for column in OPTIONAL_MEMBER_COLUMNS if column in members_file.schema_arrow.names
+    ]
+    claims = _ClaimsCursor(
+        pyarrow.parquet.ParquetFile(claims_path).iter_batches(
+            batch_size=batch_size, columns=[member_column, code_column]
+        ),
+        member_column,
+        code_column,
+    )
+
+    variables = []
+    if components:
+        variables = module.score_batch([], [0], [], [], model=model, components=True)[2]
+    schema = pyarrow.schema(
+        [members_file.schema_arrow.field(member_column), ("total", pyarrow.float64())]
+        + [(variable, pyarrow.float64()) for variable in variables]
+    )
+
+    scored = 0
+    skipped = 0
+    last = None
+    with pyarrow.parquet.ParquetWriter(output_path, schema) as writer:
+        for batch in members_file.iter_batches(batch_size=batch_size, columns=member_columns):
+            if batch.num_rows == 0:
+                continue
+            ids = batch.column(member_column).to_numpy(zero_copy_only=False)
+            if not _is_sorted(ids, last) or (ids[1:] == ids[:-1]).any() or ids[0] == last:
+                raise ValueError("The members are not sorted by unique {}".format(member_column))
+            last = ids[-1]
+
+            claim_ids, codes = claims.take(last)
+            positions = numpy.searchsorted(ids, claim_ids)
+            known = positions < len(ids)
+            known[known] = ids[positions[known]] == claim_ids[known]
+            skipped += len(claim_ids) - known.sum()
+            claim_ids = claim_ids[known]
+            offsets = numpy.searchsorted(claim_ids, ids)
+            scores = module.score_batch(
+                codes[known],
+                numpy.append(offsets, len(claim_ids)),
+                batch.column("age").to_numpy(zero_copy_only=False),
+                batch.column("sex").to_numpy(zero_copy_only=False),
+                model=model,
+                components=components,
+                diagnostics=diagnostics,
+                **dict(
+                    (column, batch.column(column).to_numpy(zero_copy_only=False))
+                    for column in member_columns[3:]
+                )
+            )
+            if components:
+                totals, values, _ = scores
+                columns = [values[:, j] for j in range(len(variables))]
+            else:
+                totals = scores
+                columns = []
+            writer.write_table(
+                pyarrow.Table.from_arrays([batch.column(member_column), totals] + columns, schema=schema)
+            )
+            scored += batch.num_rows
+    skipped += claims.rest()
+    if skipped:
+        logging.warning("Skipped {} claims of unknown members".format(skipped))
+    return scored
@@ -25,14 +25,16 @@ setup(
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
-        "Programming Language :: Python :: 2",
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
     ],
+    entry_points={
+        'console_scripts': [
+            'pyriskadjust=pyriskadjust.cli:main',
+        ],
+    },
     description="A python implementation of CMS's Medicare Risk Adjustment model based on Hierarchical Condition Categories (HCCs)",
     install_requires=requirements,
     license="MIT license",
@@ -42,6 +44,7 @@ setup(
     keywords='pyriskadjust',
     name='pyriskadjust',
     packages=find_packages(exclude=['tests']),
+    python_requires='>=3.5',
     setup_requires=setup_requirements,
     test_suite='tests',
     tests_require=test_requirements,
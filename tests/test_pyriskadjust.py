@@ -6,8 +6,34 @@
 
 import unittest
 import json
+import os
+import subprocess
+import sys
+import shutil
+import tempfile
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    import pandas
+except ImportError:
+    pandas = None
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+import pyriskadjust
+from pyriskadjust import loader
+from pyriskadjust.diagnostics import Diagnostics
 from pyriskadjust.models import model_2018_v22
-from pyriskadjust.models import common
+from pyriskadjust.models import common, interactions
+from pyriskadjust.icd_mapping import binary, codes, get_icd_mapping
+from pyriskadjust.hccs import masks
+from pyriskadjust.icd_mapping.store import MappingStore
+from pyriskadjust.coefficients import get_coefficient_manifest
+from pyriskadjust.coefficients.compiled import compile_coefficients
 
 
 class TestPyriskadjust(unittest.TestCase):
@@ -75,6 +101,26 @@ class TestPyriskadjust(unittest.TestCase):
             ),
         )
 
+    def test_explainer_index(self):
+        explainer = model_2018_v22.VERSION.explainer()
+        self.assertIs(explainer, model_2018_v22.VERSION.explainer())
+        self.assertEqual(
+            explainer.index["ins_disabled_hcc85"],
+            (("interaction_components", "Disabled & Congestive Heart Failure", None),),
+        )
+        self.assertEqual(explainer.index["cna_hcc85"], (("hcc_components", None, 85),))
+        # names missing from the index are explained the same way
+        components = {"cna_m70_74": 0.379, "xyz_hcc85_gdiabetesmellit": 0.154}
+        self.assertEqual(
+            explainer.explain(components),
+            common._explain_score(
+                common.MODEL_ABBREVIATIONS,
+                model_2018_v22.INTERACTION_VARIABLE_DESCRIPTIONS,
+                model_2018_v22.HCC_LABELS,
+                components,
+            ),
+        )
+
 
 class TestCommon(unittest.TestCase):
     """Tests for functions in common.py."""
@@ -95,6 +141,23 @@ class TestCommon(unittest.TestCase):
     def tearDown(self):
         """Tear down test fixtures, if any."""
 
+    def test_age_sex_cells(self):
+        for (age, sex, new_enrollee, cell) in [
+            (0, 1, False, "m0_34"),
+            (66, 2, True, "f66"),
+            (66, 2, False, "f65_69"),
+            (94, 1, False, "m90_94"),
+            (130, 2, False, "f95_gt"),
+        ]:
+            i = common.age_sex_cell(age, sex, new_enrollee)
+            self.assertEqual(common.AGE_SEX_CELLS[i], cell)
+            self.assertEqual(common.get_age_sex_string(age, sex, new_enrollee), cell)
+        self.assertEqual(common.age_sex_cell(-1, 1), -1)
+        self.assertEqual(
+            list(common.age_sex_cells([0, 66, -1], [1, 2, 1], new_enrollee=True)),
+            [common.AGE_SEX_CELLS.index("m0_34"), common.AGE_SEX_CELLS.index("f66"), -1],
+        )
+
     def test_diagnoses_to_hccs(self):
         out = common._diagnoses_to_hccs(
             icd_mapping=self.icd_mapping, hcc_hierachy=self.hcc_hierarchy,
@@ -106,3 +169,777 @@ class TestCommon(unittest.TestCase):
             icd_mapping=self.icd_mapping, hcc_hierachy=self.hcc_hierarchy,
             diagnoses=['A010', 'A011'], age=70, sex='M')
         self.assertEqual(out, {0})
+
+
+class TestRegistry(unittest.TestCase):
+    """Tests for the lazy model registry."""
+
+    def test_get_model(self):
+        self.assertIs(pyriskadjust.get_model(2018, 22), model_2018_v22)
+        self.assertIs(pyriskadjust.get_model("2018", "v22"), model_2018_v22)
+
+    def test_get_model_unknown(self):
+        with self.assertRaises(ValueError):
+            pyriskadjust.get_model(2017, 22)
+
+    def test_get_latest_model(self):
+        from pyriskadjust.models import get_latest_model, model_2019_v23
+
+        self.assertIs(get_latest_model(), model_2019_v23)
+        self.assertIs(get_latest_model(year=2018), model_2018_v22)
+        self.assertIs(get_latest_model(version="v22"), model_2018_v22)
+        with self.assertRaises(ValueError):
+            get_latest_model(2018, 23)
+
+    @unittest.skipIf(sys.version_info < (3, 7), "module __getattr__ needs python 3.7")
+    def test_tables_load_on_first_use(self):
+        script = (
+            "import sys, pyriskadjust\n"
+            "model = pyriskadjust.get_model(2019, 23)\n"
+            "name = 'pyriskadjust.icd_mapping.mapping_2019_v23'\n"
+            "assert name not in sys.modules\n"
+            "model.diagnoses_to_hccs(['E1169'], age=70, sex=1)\n"
+            "assert name in sys.modules\n"
+        )
+        subprocess.check_call([sys.executable, "-c", script])
+
+    def test_register_tables(self):
+        script = (
+            "import json\n"
+            "from pyriskadjust.coefficients import register_coefficients\n"
+            "from pyriskadjust.icd_mapping import register_icd_mapping\n"
+            "from pyriskadjust.models import model_2018_v22 as model\n"
+            "scores = [model.compute_risk_score_components(['E1169'], age=70, sex=1)]\n"
+            "register_icd_mapping('2018_v22', {'E1169': [19]})\n"
+            "register_coefficients('2018_v22', {'cna_m70_74': 0.5, 'cna_hcc19': 0.1})\n"
+            "scores.append(model.compute_risk_score_components(['E1169'], age=70, sex=1))\n"
+            "print(json.dumps(scores))\n"
+        )
+        out = subprocess.check_output([sys.executable, "-c", script])
+        self.assertEqual(
+            json.loads(out.decode("ascii")),
+            [{"cna_m70_74": 0.379, "cna_hcc18": 0.318}, {"cna_m70_74": 0.5, "cna_hcc19": 0.1}],
+        )
+
+    def test_preload(self):
+        script = (
+            "import gc, json, pyriskadjust\n"
+            "from pyriskadjust.icd_mapping import binary\n"
+            "from pyriskadjust.models import preload\n"
+            "preload(models=[(2018, 22)])\n"
+            "model = pyriskadjust.get_model(2018, 22)\n"
+            "assert isinstance(model.ICD_MAPPING, binary.BinaryMapping)\n"
+            "assert isinstance(model.HCC_HIERARCHY[8], tuple)\n"
+            "assert not isinstance(model.HCC_LABELS, dict) and model.HCC_LABELS[18]\n"
+            "assert not isinstance(model.COEFFICIENTS, dict) and model.COEFFICIENTS['cna_hcc18']\n"
+            "tables = model.get_compiled_model('cna').version.tables()\n"
+            "assert isinstance(tables[0], binary.BinaryMapping)\n"
+            "assert not hasattr(gc, 'freeze') or gc.get_freeze_count() > 0\n"
+            "print(json.dumps(model.compute_risk_score_components("
+            "['E1169', 'I5030'], age=70, sex=1)))\n"
+        )
+        out = subprocess.check_output([sys.executable, "-c", script])
+        self.assertEqual(
+            json.loads(out.decode("ascii")),
+            {
+                "cna_m70_74": 0.379,
+                "cna_hcc18": 0.318,
+                "cna_hcc85": 0.323,
+                "cna_hcc85_gdiabetesmellit": 0.154,
+            },
+        )
+
+
+class TestBinaryMapping(unittest.TestCase):
+    """Tests for the binary ICD mapping format."""
+
+    def setUp(self):
+        self.icd_mapping = {"A010": [0], "A011": [1, 2], "B01": [10]}
+
+    def test_round_trip(self):
+        mapping = binary.BinaryMapping(binary.dumps_mapping(self.icd_mapping))
+        self.assertEqual(dict(mapping), self.icd_mapping)
+        self.assertEqual(mapping.get("A011"), [1, 2])
+        self.assertEqual(mapping.get("A01", []), [])
+        self.assertNotIn("A01", mapping)
+
+    def test_encoded_lookup(self):
+        mapping = binary.BinaryMapping(binary.dumps_mapping(self.icd_mapping))
+        self.assertEqual(mapping[codes.encode_icd("A011")], [1, 2])
+        self.assertNotIn(codes.encode_icd("A01"), mapping)
+        self.assertNotIn("a011", mapping)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_encoded_lookup(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        binary.write_mapping(self.icd_mapping, path)
+        code = numpy.array(codes.encode_icds(["A011"]), dtype=numpy.int64)[0]
+        for memory_map in (False, True):
+            mapping = binary.load_mapping(path, memory_map=memory_map)
+            self.assertEqual(mapping.get(code), [1, 2])
+            self.assertIn(numpy.int64(codes.encode_icd("B01")), mapping)
+
+    def test_checksum(self):
+        data = bytearray(binary.dumps_mapping(self.icd_mapping))
+        data[-1] ^= 1
+        with self.assertRaises(ValueError):
+            binary.BinaryMapping(bytes(data))
+
+    def test_shipped_file_matches_module(self):
+        self.assertEqual(
+            dict(get_icd_mapping("2018_v22", backend="binary")),
+            get_icd_mapping("2018_v22"),
+        )
+
+    def test_memory_map(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        binary.write_mapping(self.icd_mapping, path)
+        mapping = binary.load_mapping(path, memory_map=True)
+        self.assertEqual(dict(mapping), self.icd_mapping)
+        self.assertEqual(mapping.get("B01"), [10])
+        self.assertIsNone(mapping.get("B010"))
+
+    def test_model_with_mmap_backend(self):
+        script = (
+            "import json, pyriskadjust\n"
+            "from pyriskadjust.icd_mapping import binary\n"
+            "model = pyriskadjust.get_model(2018, 22)\n"
+            "assert isinstance(model.ICD_MAPPING, binary.MappedBinaryMapping)\n"
+            "print(json.dumps(sorted(model.diagnoses_to_hccs("
+            "['E1169', 'I5030'], age=70, sex=1))))\n"
+        )
+        env = dict(os.environ, PYRISKADJUST_ICD_BACKEND="mmap")
+        out = subprocess.check_output([sys.executable, "-c", script], env=env)
+        self.assertEqual(json.loads(out.decode("ascii")), [18, 85])
+
+
+class TestCodes(unittest.TestCase):
+    """Tests for the integer encoding of ICD-10 codes."""
+
+    def test_round_trip(self):
+        for code in ["A", "A01", "A010", "E1169", "S72001A", "ZZZZZZZ", "0"]:
+            self.assertEqual(codes.decode_icd(codes.encode_icd(code)), code)
+
+    def test_preserves_order(self):
+        icds = ["A0", "A01", "A010", "A0101", "A011", "B", "E1169", "Z9989"]
+        self.assertEqual(list(codes.encode_icds(icds)), sorted(codes.encode_icds(icds)))
+
+    def test_normalize(self):
+        self.assertEqual(codes.normalize_icd(" e11.69 "), "E1169")
+        self.assertEqual(codes.normalize_icd(" e11.69 "), "E1169")
+        self.assertEqual(
+            codes.normalize_icds(["E1169", "i50.30", "I509 "]), ["E1169", "I5030", "I509"]
+        )
+        self.assertEqual(codes.normalize_icds(("i50.30", "I509")), ["I5030", "I509"])
+
+    def test_invalid(self):
+        for code in ["E11.69", "e1169", "S72001AB"]:
+            with self.assertRaises(ValueError):
+                codes.encode_icd(code)
+
+
+class TestMasks(unittest.TestCase):
+    """Tests for HCC sets represented as bitmasks."""
+
+    def test_round_trip(self):
+        hccs = {1, 48, 85, 189}
+        mask = masks.hccs_to_mask(hccs)
+        self.assertEqual(mask, (1 << 1) | (1 << 48) | (1 << 85) | (1 << 189))
+        self.assertEqual(list(masks.iter_hccs(mask)), [1, 48, 85, 189])
+        self.assertEqual(masks.mask_to_hccs(mask), hccs)
+        self.assertEqual(masks.mask_to_hccs(0), set())
+
+    def test_apply_hierarchy(self):
+        exclusions = masks.hierarchy_masks({1: [2, 3], 2: [3], 4: []})
+        self.assertEqual(exclusions, {1: 0b1100, 2: 0b1000})
+        mask = masks.hccs_to_mask({1, 3, 4})
+        self.assertEqual(masks.apply_hierarchy(mask, exclusions), masks.hccs_to_mask({1, 4}))
+        # one pass, like the CMS software: 2 still excludes 3
+        exclusions = masks.hierarchy_masks({1: [2], 2: [3]})
+        mask = masks.hccs_to_mask({1, 2, 3})
+        self.assertEqual(masks.apply_hierarchy(mask, exclusions), masks.hccs_to_mask({1}))
+        mask = masks.hccs_to_mask({1, 3})
+        self.assertEqual(masks.apply_hierarchy(mask, exclusions), mask)
+
+    def test_hierarchy_masks_are_cached(self):
+        version = model_2018_v22.VERSION
+        self.assertIs(version.hierarchy_masks(), version.hierarchy_masks())
+        # ad hoc hierarchies are compiled on every call
+        hierarchy = {0: [1]}
+        icd_mapping = {"A010": [0], "A011": [1]}
+        diagnoses = ["A010", "A011"]
+        self.assertEqual(common._diagnoses_to_hccs(icd_mapping, hierarchy, diagnoses, 70, 1), {0})
+        hierarchy[0] = []
+        self.assertEqual(
+            common._diagnoses_to_hccs(icd_mapping, hierarchy, diagnoses, 70, 1), {0, 1}
+        )
+
+    def test_components_are_ordered_by_hcc(self):
+        components = model_2018_v22.compute_risk_score_components(
+            ["I5030", "I209", "E1169"], age=70, sex=1
+        )
+        self.assertEqual(
+            list(components),
+            ["cna_m70_74", "cna_hcc18", "cna_hcc85", "cna_hcc88", "cna_hcc85_gdiabetesmellit"],
+        )
+
+
+class TestMappingStore(unittest.TestCase):
+    """Tests for the deduplicated multi-version mapping store."""
+
+    def setUp(self):
+        self.mappings = {
+            "a": {"A010": [0], "A011": [1, 2], "B010": [10]},
+            "b": {"A010": [0], "A011": [1, 2], "B011": [11]},
+            "c": {"A010": [0], "A011": [1], "B010": [10]},
+        }
+
+    def test_views_match_mappings(self):
+        store = MappingStore(self.mappings)
+        for (name, mapping) in self.mappings.items():
+            view = store.view(name)
+            self.assertEqual(dict(view), mapping)
+            self.assertEqual(len(view), len(mapping))
+        self.assertNotIn("B010", store.view("b"))
+        self.assertIsNone(store.view("b").get("B010"))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_encoded_lookup(self):
+        view = MappingStore(self.mappings).view("b")
+        self.assertEqual(view.get(numpy.int64(codes.encode_icd("B011"))), [11])
+        self.assertNotIn(numpy.int64(codes.encode_icd("B010")), view)
+
+    def test_shipped_store_matches_modules(self):
+        self.assertEqual(
+            dict(get_icd_mapping("2019_v23", backend="store")),
+            get_icd_mapping("2019_v23"),
+        )
+
+
+class TestCompiledCoefficients(unittest.TestCase):
+    """Tests for the array-backed coefficient tables."""
+
+    def test_compile(self):
+        tables = compile_coefficients(
+            {
+                "cna_m70_74": 0.379,
+                "cna_hcc85": 0.323,
+                "cna_hcc85_gdiabetesmellit": 0.154,
+                "ins_hcc85": 0.2,
+            }
+        )
+        self.assertEqual(sorted(tables), ["cna", "ins"])
+        cna = tables["cna"]
+        self.assertEqual(cna.hcc_coefficient(85), 0.323)
+        self.assertEqual(cna.hcc_names[85], "cna_hcc85")
+        self.assertNotEqual(cna.hcc_coefficient(84), cna.hcc_coefficient(84))
+        self.assertNotEqual(cna.hcc_coefficient(500), cna.hcc_coefficient(500))
+        i = cna.demographic_ids["m70_74"]
+        self.assertEqual((cna.demographic_names[i], cna.demographic[i]), ("cna_m70_74", 0.379))
+        i = cna.interaction_ids["hcc85_gdiabetesmellit"]
+        self.assertEqual(cna.interaction_names[i], "cna_hcc85_gdiabetesmellit")
+
+    def test_manifest(self):
+        variables = get_coefficient_manifest("2019_v23")["variables"]["cna"]
+        self.assertIn(85, variables["hcc"])
+        self.assertIn("m70_74", variables["demographic"])
+        self.assertIn("hcc85_grenal_v23", variables["interaction"])
+
+
+class TestCompiledModel(unittest.TestCase):
+    """Tests for the models compiled per segment."""
+
+    def test_matches_module_functions(self):
+        model = model_2018_v22.get_compiled_model("cna")
+        self.assertIs(model, model_2018_v22.get_compiled_model("cna"))
+        diagnoses = ["E1169", "I5030", "I509", "I211", "I209", "R05"]
+        components = model.components(diagnoses, 70, 1)
+        self.assertEqual(
+            components,
+            model_2018_v22.compute_risk_score_components(diagnoses, age=70, sex=1),
+        )
+        self.assertAlmostEqual(model.score(diagnoses, 70, 1), sum(components.values()))
+        self.assertEqual(model.hccs(diagnoses, 70, 1), {18, 85, 88})
+
+    def test_institutional_interactions(self):
+        model = model_2018_v22.get_compiled_model("ins")
+        components = model.components(
+            ["E1169", "I5030"], 70, 1, long_term_institutional_in_medicaid=True
+        )
+        self.assertIn("ins_diabetes_chf", components)
+        self.assertIn("ins_ltimcaid", components)
+
+    def test_all_models(self):
+        diagnoses = ["E1169", "I5030", "I209"]
+        scores = model_2018_v22.compute_all_risk_score_components(diagnoses, 70, 1)
+        self.assertEqual(list(scores), list(common.MODEL_ABBREVIATIONS))
+        for (model, score) in scores.items():
+            components = model_2018_v22.compute_risk_score_components(
+                diagnoses, 70, 1, model=model
+            )
+            self.assertEqual(score["components"], components)
+            self.assertAlmostEqual(score["total"], sum(components.values()))
+        scores = model_2018_v22.compute_all_risk_score_components(
+            diagnoses, 70, 1, models=["ins", "cna"]
+        )
+        self.assertEqual(list(scores), ["ins", "cna"])
+
+    def test_from_hccs(self):
+        expected = model_2018_v22.compute_risk_score_components(
+            ["E1169", "I5030", "I509", "I209"], age=70, sex=1
+        )
+        for hccs in [{18, 85, 88}, [88, 85, 18], masks.hccs_to_mask({18, 85, 88})]:
+            self.assertEqual(
+                model_2018_v22.compute_risk_score_components_from_hccs(hccs, 70, 1),
+                expected,
+            )
+        # 17 excludes 18 and 19, 86 excludes 88
+        self.assertEqual(
+            model_2018_v22.compute_risk_score_components_from_hccs(
+                {17, 18, 86, 88}, 70, 1, apply_hierarchy=True
+            ),
+            model_2018_v22.compute_risk_score_components_from_hccs({17, 86}, 70, 1),
+        )
+
+    def test_unknown_segment(self):
+        model = model_2018_v22.get_compiled_model("zzz")
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(model.components(["E1169"], 70, 1), {})
+
+
+class TestInteractions(unittest.TestCase):
+    """Tests for the interaction rule tables."""
+
+    def setUp(self):
+        self.rules = interactions.InteractionRules(
+            {"chf": {85}, "gCopdCF": {110, 111, 112}},
+            [
+                ("hcc85_gcopdcf", interactions.COMMUNITY, ("chf", "gCopdCF")),
+                ("chf_hcc96", interactions.COMMUNITY, ("chf", "hcc96")),
+                ("origds", interactions.INSTITUTIONAL, ("originally_disabled",)),
+            ],
+        )
+
+    def test_evaluate(self):
+        cna = self.rules.segment("cna")
+        hccs = masks.hccs_to_mask({85, 96, 111})
+        self.assertEqual(
+            cna.evaluate(hccs, 70, 1, False, False, False), ["hcc85_gcopdcf", "chf_hcc96"]
+        )
+        self.assertEqual(cna.evaluate(masks.hccs_to_mask({85}), 70, 1, False, False, False), [])
+        ins = self.rules.segment("ins")
+        self.assertEqual(ins.evaluate(hccs, 70, 1, False, True, False), ["origds"])
+        self.assertEqual(ins.evaluate(hccs, 70, 1, False, False, False), [])
+
+    def test_unknown_condition(self):
+        with self.assertRaises(ValueError):
+            interactions.InteractionRules({}, [("x", ("cna",), ("nope",))])
+
+
+class TestDiagnostics(unittest.TestCase):
+    """Tests for collecting scoring problems instead of logging them."""
+
+    def test_collect(self):
+        diagnostics = Diagnostics()
+        components = model_2018_v22.compute_risk_score_components(
+            ["E1169", "R05"], age=70, sex=1, diagnostics=diagnostics
+        )
+        self.assertEqual(components["cna_hcc18"], 0.318)
+        model = model_2018_v22.get_compiled_model("zzz")
+        model.components(["E1169"], 130, 1, diagnostics=diagnostics)
+        self.assertEqual(diagnostics.members, 2)
+        self.assertEqual(diagnostics.unmapped_codes, {"R05": 1})
+        self.assertEqual(
+            diagnostics.missing_coefficients, {"zzz_hcc18": 1, "zzz_m95_gt": 1}
+        )
+        self.assertEqual(diagnostics.out_of_range_ages, {130: 1})
+
+    def test_detail(self):
+        diagnostics = Diagnostics(detail=True)
+        model_2018_v22.compute_all_risk_score_components(
+            ["R05"], age=70, sex=1, models=["cna", "ins"], diagnostics=diagnostics
+        )
+        model_2018_v22.compute_risk_score_components_from_hccs(
+            {18}, age=70, sex=1, diagnostics=diagnostics
+        )
+        self.assertEqual(
+            [(d["member"], d["unmapped_codes"]) for d in diagnostics.details],
+            [(0, ["R05"]), (1, [])],
+        )
+
+    def test_disabled(self):
+        diagnostics = Diagnostics(enabled=False)
+        model = model_2018_v22.get_compiled_model("zzz")
+        self.assertEqual(model.components(["E1169", "R05"], 70, 1, diagnostics=diagnostics), {})
+        self.assertEqual(diagnostics.to_dict()["members"], 0)
+        self.assertEqual(diagnostics.missing_coefficients, {})
+
+    def test_merge_and_serialize(self):
+        first = Diagnostics()
+        second = Diagnostics()
+        model_2018_v22.compute_risk_score_components(["R05"], 70, 1, diagnostics=first)
+        model_2018_v22.compute_risk_score_components(["R05"], 200, 1, diagnostics=second)
+        merged = first.merge(second)
+        self.assertEqual(merged.members, 2)
+        self.assertEqual(merged.unmapped_codes, {"R05": 2})
+        copy = Diagnostics.from_dict(json.loads(json.dumps(merged.to_dict())))
+        self.assertEqual(copy.to_dict(), merged.to_dict())
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestIncidenceMatrix(unittest.TestCase):
+    """Tests for ICD mappings as sparse incidence matrices."""
+
+    def setUp(self):
+        from pyriskadjust.icd_mapping import incidence
+
+        self.incidence = incidence
+        self.mapping = {"A010": [1], "A011": [1, 2], "B010": [10], "Z000": []}
+
+    def test_matrix(self):
+        matrix = self.incidence.IncidenceMatrix(self.mapping)
+        self.assertEqual(matrix.codes, ["A010", "A011", "B010", "Z000"])
+        self.assertEqual(matrix.width, 11)
+        dense = matrix.matrix.toarray()
+        self.assertEqual(dense.shape, (4, 11))
+        self.assertEqual(dense.sum(), 4)
+        self.assertEqual(dense[1, 2], 1)
+        self.assertEqual(list(matrix.rows(["B010", "XXX"])), [2, -1])
+
+    def test_claims(self):
+        matrix = self.incidence.IncidenceMatrix(self.mapping)
+        claims = matrix.claims_matrix([0, 0, 0, 2], ["a01.0", "A011", "R05", "B010"], 3)
+        patients, hccs = matrix.hccs(claims).nonzero()
+        self.assertEqual(
+            sorted(zip(patients.tolist(), hccs.tolist())), [(0, 1), (0, 2), (2, 10)]
+        )
+
+    def test_csr_matrix(self):
+        a = self.incidence.CSRMatrix.from_pairs([0, 2, 2, 0], [1, 0, 0, 3], (3, 4))
+        b = self.incidence.CSRMatrix.from_pairs([0, 1, 3, 3], [1, 0, 0, 1], (4, 2))
+        self.assertEqual(a.toarray().tolist(), [[0, 1, 0, 1], [0, 0, 0, 0], [2, 0, 0, 0]])
+        self.assertEqual(
+            a.dot(b).toarray().tolist(), numpy.dot(a.toarray(), b.toarray()).tolist()
+        )
+        with self.assertRaises(ValueError):
+            b.dot(b)
+
+    def test_registry(self):
+        from pyriskadjust.icd_mapping import get_incidence_matrix
+
+        matrix = get_incidence_matrix("2018_v22")
+        self.assertIs(get_incidence_matrix("2018_v22"), matrix)
+        mapping = get_icd_mapping("2018_v22")
+        code = matrix.codes[100]
+        row = matrix.matrix.toarray()[100]
+        self.assertEqual(sorted(numpy.flatnonzero(row).tolist()), sorted(mapping[code]))
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestBatch(unittest.TestCase):
+    """Tests for scoring whole populations with numpy."""
+
+    def setUp(self):
+        from pyriskadjust.models.batch import flatten_diagnoses
+
+        self.diagnoses = [
+            ["E1169", "I5030", "I509", "I211", "I209", "R05"],
+            [],
+            ["D66", "J410", "e11.69"],
+            ["D66", "F3481", "E1169"],
+            ["E1169", "I5030"],
+        ]
+        self.ages = [70, 40, 10, 3, 130]
+        self.sexes = [1, 2, 2, 1, 2]
+        self.reasons = [0, 1, 0, 0, 1]
+        self.codes, self.offsets = flatten_diagnoses(self.diagnoses)
+
+    def test_matches_compute_risk_score_components(self):
+        for model in ["cna", "cnd", "ins", "ne"]:
+            totals, components, variables = model_2018_v22.score_batch(
+                self.codes,
+                self.offsets,
+                self.ages,
+                self.sexes,
+                original_entitlement_reason=self.reasons,
+                model=model,
+                components=True,
+                diagnostics=Diagnostics(),
+            )
+            for (i, diagnoses) in enumerate(self.diagnoses):
+                expected = model_2018_v22.compute_risk_score_components(
+                    diagnoses,
+                    self.ages[i],
+                    self.sexes[i],
+                    original_entitlement_reason=self.reasons[i],
+                    model=model,
+                    diagnostics=Diagnostics(),
+                )
+                self.assertAlmostEqual(totals[i], sum(expected.values()))
+                self.assertEqual(
+                    dict((v, c) for (v, c) in zip(variables, components[i]) if c),
+                    dict((v, c) for (v, c) in expected.items() if c),
+                )
+
+    def test_diagnostics(self):
+        diagnostics = Diagnostics()
+        model_2018_v22.score_batch(
+            self.codes, self.offsets, self.ages, self.sexes, diagnostics=diagnostics
+        )
+        self.assertEqual(diagnostics.members, 5)
+        self.assertEqual(diagnostics.unmapped_codes, {"I211": 1, "R05": 1})
+        self.assertEqual(diagnostics.out_of_range_ages, {130: 1})
+        with self.assertLogs(level="WARNING"):
+            model_2018_v22.score_batch(self.codes, self.offsets, self.ages, self.sexes, model="ne")
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            model_2018_v22.score_batch(self.codes, self.offsets[:-1], self.ages, self.sexes)
+        with self.assertRaises(ValueError):
+            model_2018_v22.score_batch(self.codes, self.offsets, [70, -1, 1, 1, 1], self.sexes)
+
+
+@unittest.skipIf(pandas is None, "pandas is not installed")
+class TestPandas(unittest.TestCase):
+    """Tests for scoring DataFrames of claims."""
+
+    def setUp(self):
+        self.claims = pandas.DataFrame(
+            {
+                "member_id": ["a", "b", "a", "a", "c", "zzz", "b"],
+                "icd10": ["E1169", "I509", "I5030", None, "R05", "E1169", "D66"],
+            }
+        )
+        self.members = pandas.DataFrame(
+            {"member_id": ["b", "a", "c"], "age": [40, 70, 81], "sex": [2, 1, 2]}
+        )
+
+    def test_score_frame(self):
+        from pyriskadjust.pandas import score_frame
+
+        scores = score_frame(self.claims, self.members, year=2018, version=22)
+        self.assertEqual(list(scores.index), ["b", "a", "c"])
+        expected = model_2018_v22.compute_risk_score_components(["E1169", "I5030"], 70, 1)
+        self.assertAlmostEqual(scores.loc["a", "total"], sum(expected.values()))
+        for (variable, value) in expected.items():
+            self.assertEqual(scores.loc["a", variable], value)
+        expected = model_2018_v22.compute_risk_score_components(["I509", "D66"], 40, 2)
+        self.assertAlmostEqual(scores.loc["b", "total"], sum(expected.values()))
+
+    def test_totals_only(self):
+        from pyriskadjust.pandas import score_frame
+
+        members = self.members.assign(original_entitlement_reason=[1, 0, 0])
+        scores = score_frame(
+            self.claims, members, model="cnd", year=2018, version=22, components=False
+        )
+        self.assertEqual(list(scores.columns), ["total"])
+        expected = model_2018_v22.compute_risk_score_components(
+            ["I509", "D66"], 40, 2, original_entitlement_reason=1, model="cnd"
+        )
+        self.assertAlmostEqual(scores.loc["b", "total"], sum(expected.values()))
+        with self.assertRaises(ValueError):
+            score_frame(self.claims, pandas.concat([members, members]))
+
+    def test_year_or_version_only(self):
+        from pyriskadjust.models import model_2019_v23
+        from pyriskadjust.pandas import score_frame
+
+        for (arguments, module) in [({"year": 2018}, model_2018_v22), ({"version": 23}, model_2019_v23)]:
+            scores = score_frame(self.claims, self.members, components=False, **arguments)
+            expected = module.compute_risk_score_components(["E1169", "I5030"], 70, 1)
+            self.assertAlmostEqual(scores.loc["a", "total"], sum(expected.values()))
+        with self.assertRaises(ValueError):
+            score_frame(self.claims, self.members, year=2017)
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestPipeline(unittest.TestCase):
+    """Tests for streaming scoring of Parquet files."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.claims_path = os.path.join(self.directory, "claims.parquet")
+        self.members_path = os.path.join(self.directory, "members.parquet")
+        self.output_path = os.path.join(self.directory, "scores.parquet")
+        pyarrow.parquet.write_table(
+            pyarrow.table(
+                {
+                    "member_id": [1, 1, 2, 3, 3, 3, 5],
+                    "icd10": ["E1169", "I5030", "R05", "I509", None, "E1169", "I509"],
+                }
+            ),
+            self.claims_path,
+            row_group_size=2,
+        )
+        pyarrow.parquet.write_table(
+            pyarrow.table({"member_id": [1, 3, 4, 5], "age": [70, 81, 66, 40], "sex": [1, 2, 1, 2]}),
+            self.members_path,
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_score_parquet(self):
+        from pyriskadjust.pipeline import score_parquet
+
+        with self.assertLogs(level="WARNING"):
+            count = score_parquet(
+                self.claims_path,
+                self.members_path,
+                self.output_path,
+                year=2018,
+                version=22,
+                components=True,
+                batch_size=2,
+            )
+        self.assertEqual(count, 4)
+        scores = pyarrow.parquet.read_table(self.output_path).to_pylist()
+        self.assertEqual([row["member_id"] for row in scores], [1, 3, 4, 5])
+        members = [(["E1169", "I5030"], 70, 1), (["I509", "E1169"], 81, 2), ([], 66, 1), (["I509"], 40, 2)]
+        for (row, (diagnoses, age, sex)) in zip(scores, members):
+            expected = model_2018_v22.compute_risk_score_components(diagnoses, age, sex)
+            self.assertAlmostEqual(row["total"], sum(expected.values()))
+            for (variable, value) in expected.items():
+                self.assertEqual(row[variable], value)
+
+    def test_year_or_version_only(self):
+        from pyriskadjust.models import model_2019_v23
+        from pyriskadjust.pipeline import score_parquet
+
+        for (arguments, module) in [({"year": 2018}, model_2018_v22), ({"version": "v23"}, model_2019_v23)]:
+            with self.assertLogs(level="WARNING"):
+                score_parquet(self.claims_path, self.members_path, self.output_path, **arguments)
+            total = pyarrow.parquet.read_table(self.output_path).to_pylist()[0]["total"]
+            expected = module.compute_risk_score_components(["E1169", "I5030"], 70, 1)
+            self.assertAlmostEqual(total, sum(expected.values()))
+
+    def test_unsorted(self):
+        from pyriskadjust.pipeline import score_parquet
+
+        pyarrow.parquet.write_table(
+            pyarrow.table({"member_id": [3, 1], "age": [81, 70], "sex": [2, 1]}),
+            self.members_path,
+        )
+        with self.assertRaises(ValueError):
+            score_parquet(self.claims_path, self.members_path, self.output_path)
+
+
+class TestCli(unittest.TestCase):
+    """Tests for the pyriskadjust command."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.directory, "scores.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def score(self, *arguments):
+        from pyriskadjust import cli
+
+        cli.main(["score", "-o", self.output_path] + list(arguments))
+        with open(self.output_path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_score_csv(self):
+        path = os.path.join(self.directory, "members.csv")
+        with open(path, "w") as f:
+            f.write('member_id,age,sex,diagnoses\n1,70,1,E1169 I5030\n2,81,2,"I509,E1169"\n3,66,1,\n')
+        scores = self.score(path, "--year", "2018", "--write", "components")
+        members = [(["E1169", "I5030"], 70, 1), (["I509", "E1169"], 81, 2), ([], 66, 1)]
+        self.assertEqual([row["member_id"] for row in scores], ["1", "2", "3"])
+        for (row, (diagnoses, age, sex)) in zip(scores, members):
+            expected = model_2018_v22.compute_risk_score_components(diagnoses, age, sex)
+            self.assertEqual(row["components"], expected)
+            self.assertAlmostEqual(row["total"], sum(expected.values()))
+
+    def test_score_gzipped_jsonl(self):
+        import gzip
+
+        path = os.path.join(self.directory, "members.jsonl.gz")
+        with gzip.open(path, "wt") as f:
+            f.write(json.dumps({"member_id": 1, "age": 70, "sex": 1, "diagnoses": ["E1169", "I5030"]}) + "\n")
+            f.write(json.dumps({"member_id": 2, "age": "old", "sex": 2, "diagnoses": []}) + "\n")
+            f.write('{"member_id": 3, "age": 70,\n')
+            f.write(json.dumps({"member_id": 4, "age": 70, "sex": 1, "diagnoses": ["E1169", 5]}) + "\n")
+            f.write(json.dumps({"member_id": 5, "age": 70, "sex": 1, "diagnoses": {"E1169": 1}}) + "\n")
+        with self.assertRaises(SystemExit):
+            self.score(path, "--year", "2018")
+        diagnostics_path = os.path.join(self.directory, "diagnostics.json")
+        with self.assertLogs(level="WARNING"):
+            scores = self.score(
+                path, "--year", "2018", "--skip-invalid", "--diagnostics", diagnostics_path
+            )
+        expected = model_2018_v22.compute_risk_score_components(["E1169", "I5030"], 70, 1)
+        self.assertEqual(len(scores), 1)
+        self.assertAlmostEqual(scores[0]["total"], sum(expected.values()))
+        with open(diagnostics_path) as f:
+            report = json.load(f)
+        self.assertEqual(report["invalid_rows"], 4)
+        self.assertEqual([line for (line, _) in report["invalid_row_examples"]], [2, 3, 4, 5])
+
+    def test_without_numpy(self):
+        path = os.path.join(self.directory, "members.csv")
+        with open(path, "w") as f:
+            f.write("member_id,age,sex,diagnoses\n1,70,1,E1169\n")
+        script = (
+            "import sys\n"
+            "sys.modules['numpy'] = None\n"
+            "from pyriskadjust import cli\n"
+            "cli.main(['score', sys.argv[1], '--year', '2018'])\n"
+        )
+        out = subprocess.check_output([sys.executable, "-c", script, path])
+        lines = out.decode("ascii").split()
+        self.assertEqual(lines[0], "member_id,total")
+        self.assertAlmostEqual(float(lines[1].split(",")[1]), 0.697)
+
+    def test_model_selection(self):
+        from pyriskadjust import cli
+
+        path = os.path.join(self.directory, "members.csv")
+        with open(path, "w") as f:
+            f.write("age,sex,diagnoses\n70,1,E1169\n")
+        for (arguments, expected) in [(["--year", "2018"], 0.697), (["--version", "v23"], 0.695)]:
+            self.assertAlmostEqual(self.score(path, *arguments)[0]["total"], expected)
+        with self.assertRaises(SystemExit):
+            cli.main(["score", path, "--year", "2018", "--version", "23"])
+
+
+class TestLoader(unittest.TestCase):
+    """Tests for loading raw CMS files with an on-disk cache."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.directory, "cache")
+        with open(os.path.join(self.directory, "F0000X1Y.TXT"), "w") as f:
+            f.write("A010\t0\t\r\nA011\t1\t\r\nA011\t2\t\r\n")
+        with open(os.path.join(self.directory, "C0000X1Y.csv"), "w") as f:
+            f.write('"CNA_M70_74","CNA_HCC85"\n0.379,0.323\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_load_cms_directory(self):
+        tables = loader.load_cms_directory(self.directory, cache_dir=self.cache_dir)
+        self.assertEqual(
+            dict(tables["icd_mappings"]["F0000X1Y"]), {"A010": [0], "A011": [1, 2]}
+        )
+        self.assertEqual(
+            tables["coefficients"]["C0000X1Y"], {"cna_m70_74": 0.379, "cna_hcc85": 0.323}
+        )
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_cache_is_keyed_by_content(self):
+        loader.load_cms_directory(self.directory, cache_dir=self.cache_dir)
+        loader.load_cms_directory(self.directory, cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+        with open(os.path.join(self.directory, "F0000X1Y.TXT"), "a") as f:
+            f.write("B010\t10\t\r\n")
+        tables = loader.load_cms_directory(self.directory, cache_dir=self.cache_dir)
+        self.assertEqual(tables["icd_mappings"]["F0000X1Y"]["B010"], [10])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 3)